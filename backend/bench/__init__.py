@@ -0,0 +1 @@
+"""백엔드 벤치마크 모음 (backend 디렉터리에서 python -m bench.<모듈> 로 실행)"""
@@ -0,0 +1,129 @@
+"""
+벤치마크 공통 도구: 환경 설정, 합성 카탈로그 생성, 통계 계산, 결과 저장/기준선 비교
+앱 모듈(config, models, crud, main)은 import 시점에 설정을 읽으므로
+configure_env()를 먼저 호출한 뒤 import해야 합니다.
+"""
+import json
+import os
+import platform
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+
+# 기준선 대비 이 비율 이상 느려지면 회귀로 판단
+DEFAULT_TOLERANCE = 0.15
+
+
+def configure_env(database_url: str) -> None:
+    """
+    앱 설정을 벤치마크용 DB로 지정합니다 (앱 모듈 import 전에 호출).
+    벤치마크는 한 프로세스에서 실행하므로 워커 간 카탈로그 무효화를 끕니다
+    (file 방식이면 실행 중인 서버와 같이 쓰는 공용 스탬프 파일을 건드림).
+    """
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["CATALOG_SYNC"] = "off"
+
+
+def synthesize_catalog(connection, size: int, chapters: int = 50, chunk_size: int = 5000) -> None:
+    """size개의 합성 한자 데이터를 (id "1"~"size") 삽입합니다."""
+    from models import HanjaModel
+    from id_allocator import sync_hanja_id_sequence
+
+    table = HanjaModel.__table__
+    for start in range(1, size + 1, chunk_size):
+        rows = [
+            {
+                "id": str(i),
+                "character": chr(0x4E00 + i % 20000) + (str(i // 20000) if i >= 20000 else ""),
+                "sound": f"음{i % 400}",
+                "meaning": f"뜻{i}",
+                "stroke_order": [],
+                "examples": [
+                    {"sentence": f"예문{i}-1", "meaning": f"예문 뜻{i}-1"},
+                    {"sentence": f"예문{i}-2", "meaning": f"예문 뜻{i}-2"},
+                ],
+                "chapter": i % chapters + 1,
+                "difficulty": i % 5 + 1,
+            }
+            for i in range(start, min(start + chunk_size, size + 1))
+        ]
+        connection.execute(table.insert(), rows)
+    sync_hanja_id_sequence(connection)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """정렬된 표본의 백분위수 (최근접 순위)"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples_ms: List[float], elapsed_s: Optional[float] = None) -> Dict[str, float]:
+    """지연 시간 표본(ms)을 p50/p95/p99/평균과 처리량으로 요약합니다."""
+    summary = {
+        "count": len(samples_ms),
+        "mean_ms": round(statistics.fmean(samples_ms), 4) if samples_ms else 0.0,
+        "p50_ms": round(percentile(samples_ms, 50), 4),
+        "p95_ms": round(percentile(samples_ms, 95), 4),
+        "p99_ms": round(percentile(samples_ms, 99), 4),
+    }
+    if elapsed_s:
+        summary["throughput_rps"] = round(len(samples_ms) / elapsed_s, 2)
+    return summary
+
+
+def time_calls(fn: Callable[[], object], repeat: int) -> List[float]:
+    """fn을 repeat번 호출하며 호출별 소요 시간(ms)을 기록합니다."""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def save_results(path: str, kind: str, results: Dict[str, Dict[str, float]], **meta) -> None:
+    payload = {
+        "kind": kind,
+        "meta": {"python": platform.python_version(), "platform": platform.platform(), **meta},
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+
+
+def compare_with_baseline(
+    baseline_path: str,
+    results: Dict[str, Dict[str, float]],
+    tolerance: float = DEFAULT_TOLERANCE,
+    metrics=("p50_ms", "p95_ms")
+) -> List[str]:
+    """기준선 결과와 비교해 회귀 항목 설명 목록을 반환합니다 (없으면 빈 목록)."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in metrics:
+            before, after = previous.get(metric), current.get(metric)
+            if before and after and after > before * (1 + tolerance):
+                regressions.append(f"{name} {metric}: {before:.3f} -> {after:.3f} (+{(after / before - 1) * 100:.0f}%)")
+        before, after = previous.get("throughput_rps"), current.get("throughput_rps")
+        if before and after and after < before * (1 - tolerance):
+            regressions.append(f"{name} throughput_rps: {before:.1f} -> {after:.1f} ({(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def print_table(results: Dict[str, Dict[str, float]]) -> None:
+    print(f"{'name':40} {'n':>6} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} {'req/s':>10}")
+    for name, r in results.items():
+        rps = r.get("throughput_rps")
+        print(
+            f"{name:40} {r['count']:>6} {r['p50_ms']:>10.3f} {r['p95_ms']:>10.3f} {r['p99_ms']:>10.3f} "
+            f"{(f'{rps:.1f}' if rps else '-'):>10}"
+        )
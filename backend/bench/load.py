@@ -0,0 +1,139 @@
+"""
+API 부하 테스트 (프로세스 내부, httpx ASGI transport)
+main.app에 네트워크 없이 고정 동시성으로 요청을 보내 엔드포인트별 p50/p95/p99 지연 시간과 처리량을 측정합니다.
+
+실행 (backend 디렉터리에서):
+    python -m bench.load
+    python -m bench.load --catalog-size 10000 --concurrency 32 --requests 2000 --save bench_load.json
+    python -m bench.load --baseline bench_load.json   # 기준선 대비 회귀 시 종료 코드 1
+    python -m bench.load --scenario hanja_list --scenario study_upsert
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+
+from bench.common import (
+    DEFAULT_TOLERANCE, compare_with_baseline, configure_env, print_table, save_results, summarize,
+    synthesize_catalog
+)
+
+# 시나리오: 이름 -> (rng, 카탈로그 크기)로 (method, path, json 본문)을 만드는 함수
+RequestFactory = Callable[[random.Random, int], Tuple[str, str, object]]
+
+
+def _progress_item(rng: random.Random, size: int, user_id: str) -> dict:
+    i = rng.randint(1, size)
+    return {"user_id": user_id, "hanja_id": str(i), "chapter": i % 50 + 1, "is_known": rng.random() < 0.5}
+
+
+SCENARIOS: Dict[str, RequestFactory] = {
+    "hanja_list": lambda rng, size: ("GET", "/api/hanja", None),
+    "hanja_by_chapter": lambda rng, size: ("GET", f"/api/hanja/chapter/{rng.randint(1, 50)}", None),
+    "hanja_by_id": lambda rng, size: ("GET", f"/api/hanja/{rng.randint(1, size)}", None),
+    "chapters": lambda rng, size: ("GET", "/api/chapters", None),
+    "study_progress_list": lambda rng, size: ("GET", f"/api/study-progress/load-{rng.randint(0, 49)}", None),
+    "study_upsert": lambda rng, size: (
+        "POST", "/api/study-progress", _progress_item(rng, size, f"load-{rng.randint(0, 49)}")
+    ),
+    "study_upsert_batch": lambda rng, size: (
+        "POST", "/api/study-progress/batch",
+        [_progress_item(rng, size, f"load-{rng.randint(0, 49)}") for _ in range(20)]
+    ),
+    "practice_upsert": lambda rng, size: (
+        "POST", "/api/practice-progress", _progress_item(rng, size, f"load-{rng.randint(0, 49)}")
+    ),
+    "stats": lambda rng, size: ("GET", f"/api/stats/load-{rng.randint(0, 49)}", None),
+    "quiz": lambda rng, size: ("POST", "/api/quiz", {"count": 20, "chapters": [rng.randint(1, 50)]}),
+}
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    factory: RequestFactory,
+    catalog_size: int,
+    concurrency: int,
+    total: int,
+    seed: int
+) -> Dict[str, float]:
+    rng = random.Random(seed)
+    requests = [factory(rng, catalog_size) for _ in range(total)]
+    samples: List[float] = []
+    pending = iter(requests)
+
+    async def worker() -> None:
+        for method, path, body in pending:
+            started = time.perf_counter()
+            response = await client.request(method, path, json=body)
+            samples.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                raise RuntimeError(f"{method} {path} -> {response.status_code}: {response.text[:200]}")
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(samples, time.perf_counter() - started)
+
+
+async def run_all(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    import main as app_module
+
+    transport = httpx.ASGITransport(app=app_module.app)
+    results = {}
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 카탈로그 캐시 예열
+        (await client.get("/api/hanja")).raise_for_status()
+        for name in args.scenario or SCENARIOS:
+            print(f"{name} 측정 중...", file=sys.stderr)
+            results[name] = await run_scenario(
+                client, SCENARIOS[name], args.catalog_size, args.concurrency, args.requests, args.seed
+            )
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="API 부하 테스트 (httpx ASGI transport)")
+    parser.add_argument("--database-url", help="기본값: 합성 카탈로그를 넣은 임시 SQLite 파일")
+    parser.add_argument("--catalog-size", type=int, default=1800)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=500, help="시나리오별 요청 수")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="여러 번 지정 가능 (기본: 전체)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--save", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--baseline", help="비교할 기준선 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        if args.database_url:
+            configure_env(args.database_url)
+        else:
+            configure_env(f"sqlite:///{os.path.join(workdir, 'load.db')}")
+            from database import engine
+            from migrations import run_migrations
+
+            run_migrations(engine)
+            with engine.begin() as conn:
+                synthesize_catalog(conn, args.catalog_size)
+
+        results = asyncio.run(run_all(args))
+
+    print_table(results)
+    meta = {"catalog_size": args.catalog_size, "concurrency": args.concurrency, "requests": args.requests}
+    if args.save:
+        save_results(args.save, "load", results, **meta)
+    if args.baseline:
+        regressions = compare_with_baseline(args.baseline, results, args.tolerance)
+        for line in regressions:
+            print(f"회귀: {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+crud.py 마이크로 벤치마크
+SQLite에 1k/10k/100k 규모의 합성 카탈로그를 만들고 주요 CRUD 함수의 호출당 지연 시간을 측정합니다.
+
+실행 (backend 디렉터리에서):
+    python -m bench.micro
+    python -m bench.micro --sizes 1000 10000 --save bench_micro.json
+    python -m bench.micro --baseline bench_micro.json   # 기준선 대비 회귀 시 종료 코드 1
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+
+from bench.common import (
+    DEFAULT_TOLERANCE, compare_with_baseline, configure_env, print_table, save_results, summarize,
+    synthesize_catalog, time_calls
+)
+
+
+def run_size(size: int, repeat: int, workdir: str) -> dict:
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.orm import Session
+    import crud
+    from catalog_cache import catalog_cache
+    from migrations import run_migrations
+    from models import HanjaModel
+
+    engine = create_engine(f"sqlite:///{os.path.join(workdir, f'micro_{size}.db')}")
+    run_migrations(engine)
+    with engine.begin() as conn:
+        synthesize_catalog(conn, size)
+
+    rng = random.Random(size)
+    results = {}
+    with Session(engine) as db:
+        models = db.execute(select(HanjaModel).limit(min(size, repeat * 10))).scalars().all()
+        it = iter(models * (repeat * 10 // len(models) + 1))
+        results["_model_to_schema"] = summarize(time_calls(lambda: crud._model_to_schema(next(it)), repeat * 10))
+
+        def cold_load():
+            catalog_cache.invalidate()
+            crud.get_all_hanja(db)
+
+        results["get_all_hanja (cold)"] = summarize(time_calls(cold_load, max(3, repeat // (size // 1000 or 1))))
+        results["get_all_hanja (cached)"] = summarize(time_calls(lambda: crud.get_all_hanja(db), repeat * 10))
+
+        # 인덱스 구축 후 검색 (검색어가 대부분 달라 결과 캐시에 거의 적중하지 않음)
+        crud.search_hanja(db, "뜻", 20)
+        results["search_hanja (meaning)"] = summarize(
+            time_calls(lambda: crud.search_hanja(db, f"뜻{rng.randint(1, size)}", 20), repeat * 10)
+        )
+        results["search_hanja (choseong)"] = summarize(
+            time_calls(lambda: crud.search_hanja(db, rng.choice(["ㄸ", "ㅇ", "ㅇㅁ", "ㄸ1"]), 20), repeat * 10)
+        )
+
+        def upsert_one():
+            i = rng.randint(1, size)
+            crud.upsert_study_progress(db, {
+                "user_id": f"bench-{i % 100}", "hanja_id": str(i), "chapter": i % 50 + 1, "is_known": bool(i % 2)
+            })
+
+        results["upsert_study_progress"] = summarize(time_calls(upsert_one, repeat))
+
+        def upsert_batch():
+            user_id = f"bench-{rng.randint(0, 99)}"
+            crud.upsert_study_progress_batch(db, [
+                {"user_id": user_id, "hanja_id": str(i), "chapter": i % 50 + 1, "is_known": bool(i % 3)}
+                for i in rng.sample(range(1, size + 1), 50)
+            ])
+
+        results["upsert_study_progress_batch (50)"] = summarize(time_calls(upsert_batch, repeat))
+
+        def create_one():
+            crud.create_hanja(db, {"character": "新", "sound": "신", "meaning": "새", "chapter": 1, "difficulty": 1})
+
+        results["create_hanja"] = summarize(time_calls(create_one, repeat))
+
+    engine.dispose()
+    return {f"{name} [{size}]": value for name, value in results.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="crud.py 마이크로 벤치마크 (SQLite)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--save", help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--baseline", help="비교할 기준선 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # 앱 모듈이 사용할 기본 DB (각 규모별 DB는 run_size에서 따로 생성)
+        configure_env(f"sqlite:///{os.path.join(workdir, 'app.db')}")
+        results = {}
+        for size in args.sizes:
+            print(f"카탈로그 {size}행 측정 중...", file=sys.stderr)
+            results.update(run_size(size, args.repeat, workdir))
+
+    print_table(results)
+    if args.save:
+        save_results(args.save, "micro", results, sizes=args.sizes, repeat=args.repeat)
+    if args.baseline:
+        regressions = compare_with_baseline(args.baseline, results, args.tolerance)
+        for line in regressions:
+            print(f"회귀: {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
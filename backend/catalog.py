@@ -0,0 +1,320 @@
+"""
+한자 카탈로그 대량 가져오기/내보내기 도구
+파일을 청크 단위로 스트리밍하므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+가져오기는 character 기준 upsert입니다 (같은 한자가 있으면 수정, 없으면 새 ID로 추가).
+- PostgreSQL(psycopg2): 임시 테이블로 COPY 후 한 번에 병합
+- 그 외: 청크별 executemany
+
+실행 (backend 디렉터리에서):
+    python -m catalog import hanja.csv
+    python -m catalog import hanja.jsonl --chunk-size 5000
+    python -m catalog export hanja.ndjson
+    python -m catalog export - --format csv > hanja.csv
+
+CSV 열: id,character,sound,meaning,chapter,difficulty,strokeOrder,examples
+(strokeOrder, examples는 JSON 문자열, id는 비워 두면 자동 발급)
+strokeOrder/examples 열(JSONL은 키)이 없으면 기존 한자의 값은 그대로 두고 새 한자는 빈 목록으로 추가합니다.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, IO, Iterable, Iterator, List, Optional
+
+from sqlalchemy import select, update, insert
+from sqlalchemy.orm import Session
+
+from catalog_sync import catalog_sync
+from database import SessionLocal
+from id_allocator import reserve_hanja_ids, sync_hanja_id_sequence
+from models import HanjaModel
+
+CSV_COLUMNS = ["id", "character", "sound", "meaning", "chapter", "difficulty", "strokeOrder", "examples"]
+# .json(JSON 배열)은 스트리밍할 수 없으므로 지원하지 않음 (한 줄에 하나씩 쓴 JSONL로 변환해서 사용)
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+# 파일에 열이 없을 수 있는 JSON 컬럼 (HanjaModel 컬럼 이름, 파일의 열 이름)
+OPTIONAL_JSON_FIELDS = (("stroke_order", "strokeOrder"), ("examples", "examples"))
+DEFAULT_CHUNK_SIZE = 2000
+
+
+def detect_format(path: str, fmt: Optional[str]) -> str:
+    if fmt:
+        return fmt
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise SystemExit(f"파일 형식을 알 수 없습니다: {path} (--format csv|jsonl 지정)")
+    return FORMATS[ext]
+
+
+@contextmanager
+def open_stream(path: str, mode: str) -> Iterator[IO[str]]:
+    """'-'이면 표준 입출력, 아니면 UTF-8 파일"""
+    if path == "-":
+        yield sys.stdin if "r" in mode else sys.stdout
+        return
+    with open(path, mode, encoding="utf-8", newline="") as f:
+        yield f
+
+
+def _normalize(raw: Dict) -> Dict:
+    """파일 한 줄을 HanjaModel 컬럼 이름의 dict로 바꿉니다 (파일에 없는 strokeOrder/examples는 넣지 않음)."""
+    def json_field(value, default):
+        if value in (None, ""):
+            return default
+        return json.loads(value) if isinstance(value, str) else value
+
+    try:
+        record = {
+            "id": str(raw["id"]) if raw.get("id") not in (None, "") else None,
+            "character": raw["character"],
+            "sound": raw["sound"],
+            "meaning": raw["meaning"],
+            "chapter": int(raw["chapter"]),
+            "difficulty": int(raw.get("difficulty") or 2),
+        }
+        for column, key in OPTIONAL_JSON_FIELDS:
+            if key in raw:
+                record[column] = json_field(raw[key], [])
+        return record
+    except (KeyError, ValueError) as e:
+        raise ValueError(f"잘못된 행입니다: {raw!r} ({e})") from e
+
+
+def read_records(stream: IO[str], fmt: str) -> Iterator[Dict]:
+    if fmt == "csv":
+        for raw in csv.DictReader(stream):
+            yield _normalize(raw)
+    else:
+        for line in stream:
+            if line.strip():
+                yield _normalize(json.loads(line))
+
+
+def chunked(records: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+    chunk: List[Dict] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class Progress:
+    """처리량을 표준 오류로 보고합니다."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.rows = self.inserted = self.updated = 0
+
+    def report(self, final: bool = False) -> None:
+        elapsed = time.perf_counter() - self.started
+        rate = self.rows / elapsed if elapsed else 0.0
+        counts = f" (추가 {self.inserted}, 수정 {self.updated})" if final else ""
+        print(f"{'완료' if final else '진행'}: {self.rows}행{counts}, {elapsed:.1f}초, {rate:.0f}행/초", file=sys.stderr)
+
+
+def _dedupe_by_character(chunk: List[Dict]) -> List[Dict]:
+    return list({record["character"]: record for record in chunk}.values())
+
+
+def import_chunked(db: Session, records: Iterable[Dict], chunk_size: int, progress: Progress) -> None:
+    """청크마다 기존 한자 조회 1회 + executemany UPDATE/INSERT + commit"""
+    for chunk in chunked(records, chunk_size):
+        chunk = _dedupe_by_character(chunk)
+        characters = [record["character"] for record in chunk]
+        existing = dict(db.execute(
+            select(HanjaModel.character, HanjaModel.id).where(HanjaModel.character.in_(characters))
+        ).all())
+
+        to_update = [{**record, "id": existing[record["character"]]} for record in chunk if record["character"] in existing]
+        # 새 한자는 파일에 없는 JSON 컬럼을 빈 목록으로 채움
+        to_insert = [
+            {**{column: [] for column, _ in OPTIONAL_JSON_FIELDS}, **record}
+            for record in chunk if record["character"] not in existing
+        ]
+
+        # 파일에 적힌 ID가 이미 다른 한자에 쓰이고 있으면 새로 발급
+        wanted = [record["id"] for record in to_insert if record["id"]]
+        taken = set(db.execute(select(HanjaModel.id).where(HanjaModel.id.in_(wanted))).scalars()) if wanted else set()
+        missing = [record for record in to_insert if not record["id"] or record["id"] in taken]
+        for record, new_id in zip(missing, reserve_hanja_ids(db, len(missing))):
+            record["id"] = new_id
+
+        if to_update:
+            db.execute(update(HanjaModel), to_update)
+        if to_insert:
+            db.execute(insert(HanjaModel), to_insert)
+        sync_hanja_id_sequence(db)
+        db.commit()
+
+        progress.rows += len(chunk)
+        progress.inserted += len(to_insert)
+        progress.updated += len(to_update)
+        progress.report()
+
+
+def import_copy(db: Session, records: Iterable[Dict], chunk_size: int, progress: Progress) -> None:
+    """PostgreSQL: 청크별로 임시 테이블에 COPY한 뒤 character 기준으로 한 번에 병합"""
+    table = HanjaModel.__table__
+    target = f"{table.schema}.{table.name}" if table.schema else table.name
+    sequence = f"{table.schema}.hanja_id_seq" if table.schema else "hanja_id_seq"
+
+    raw = db.connection().connection.dbapi_connection
+    with raw.cursor() as cursor:
+        cursor.execute(
+            "CREATE TEMP TABLE hanja_import ("
+            " seq bigserial, id text, character text, sound text, meaning text,"
+            " chapter integer, difficulty integer, stroke_order text, examples text"
+            ") ON COMMIT DROP"
+        )
+        for chunk in chunked(records, chunk_size):
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for record in chunk:
+                writer.writerow([
+                    record["id"] if record["id"] is not None else None,
+                    record["character"], record["sound"], record["meaning"],
+                    record["chapter"], record["difficulty"],
+                    # 파일에 없는 컬럼은 NULL로 두고 병합할 때 기존 값(새 한자는 빈 목록)을 사용
+                    *(
+                        json.dumps(record[column], ensure_ascii=False) if column in record else None
+                        for column, _ in OPTIONAL_JSON_FIELDS
+                    ),
+                ])
+            buffer.seek(0)
+            cursor.copy_expert(
+                "COPY hanja_import (id, character, sound, meaning, chapter, difficulty, stroke_order, examples)"
+                " FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+            progress.rows += len(chunk)
+            progress.report()
+
+        # 파일 안에서 같은 한자가 여러 번 나오면 마지막 행만 사용
+        cursor.execute(
+            "DELETE FROM hanja_import a USING hanja_import b WHERE a.character = b.character AND a.seq < b.seq"
+        )
+        cursor.execute(
+            f"UPDATE {target} h SET sound = s.sound, meaning = s.meaning, chapter = s.chapter,"
+            f" difficulty = s.difficulty, stroke_order = COALESCE(s.stroke_order::json, h.stroke_order),"
+            f" examples = COALESCE(s.examples::json, h.examples)"
+            f" FROM hanja_import s WHERE h.character = s.character"
+        )
+        progress.updated = cursor.rowcount
+        cursor.execute(
+            f"INSERT INTO {target} (id, character, sound, meaning, chapter, difficulty, stroke_order, examples)"
+            f" SELECT CASE WHEN s.id IS NOT NULL AND NOT EXISTS (SELECT 1 FROM {target} t WHERE t.id = s.id)"
+            f" THEN s.id ELSE nextval('{sequence}')::text END,"
+            f" s.character, s.sound, s.meaning, s.chapter, s.difficulty,"
+            f" COALESCE(s.stroke_order::json, '[]'::json), COALESCE(s.examples::json, '[]'::json)"
+            f" FROM hanja_import s WHERE NOT EXISTS (SELECT 1 FROM {target} h WHERE h.character = s.character)"
+        )
+        progress.inserted = cursor.rowcount
+    sync_hanja_id_sequence(db)
+    db.commit()
+
+
+def _supports_copy(db: Session) -> bool:
+    bind = db.get_bind()
+    return bind.dialect.name == "postgresql" and bind.dialect.driver == "psycopg2"
+
+
+def run_import(path: str, fmt: Optional[str], chunk_size: int, use_copy: bool) -> None:
+    fmt = detect_format(path, fmt)
+    progress = Progress()
+    db = SessionLocal()
+    try:
+        with open_stream(path, "r") as stream:
+            records = read_records(stream, fmt)
+            if use_copy and _supports_copy(db):
+                import_copy(db, records, chunk_size, progress)
+            else:
+                import_chunked(db, records, chunk_size, progress)
+        # 실행 중인 서버의 워커들이 카탈로그 캐시를 다시 로드하도록 알림
+        catalog_sync.publish(db)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    progress.report(final=True)
+
+
+def _export_copy(db: Session, stream: IO[str]) -> None:
+    table = HanjaModel.__table__
+    target = f"{table.schema}.{table.name}" if table.schema else table.name
+    raw = db.connection().connection.dbapi_connection
+    with raw.cursor() as cursor:
+        cursor.copy_expert(
+            f'COPY (SELECT id, character, sound, meaning, chapter, difficulty, stroke_order AS "strokeOrder", examples'
+            f" FROM {target} ORDER BY chapter, id) TO STDOUT WITH (FORMAT csv, HEADER)",
+            stream
+        )
+
+
+def run_export(path: str, fmt: Optional[str], chunk_size: int, use_copy: bool) -> None:
+    fmt = detect_format(path, fmt)
+    progress = Progress()
+    db = SessionLocal()
+    try:
+        with open_stream(path, "w") as stream:
+            if fmt == "csv" and use_copy and _supports_copy(db):
+                _export_copy(db, stream)
+                progress.report(final=True)
+                return
+
+            writer = csv.writer(stream) if fmt == "csv" else None
+            if writer:
+                writer.writerow(CSV_COLUMNS)
+            stmt = select(HanjaModel).order_by(HanjaModel.chapter, HanjaModel.id).execution_options(yield_per=chunk_size)
+            for hanja in db.execute(stmt).scalars():
+                record = {
+                    "id": hanja.id,
+                    "character": hanja.character,
+                    "sound": hanja.sound,
+                    "meaning": hanja.meaning,
+                    "chapter": hanja.chapter,
+                    "difficulty": hanja.difficulty,
+                    "strokeOrder": hanja.stroke_order or [],
+                    "examples": hanja.examples or [],
+                }
+                if writer:
+                    record["strokeOrder"] = json.dumps(record["strokeOrder"], ensure_ascii=False)
+                    record["examples"] = json.dumps(record["examples"], ensure_ascii=False)
+                    writer.writerow([record[column] for column in CSV_COLUMNS])
+                else:
+                    stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+                progress.rows += 1
+                if progress.rows % chunk_size == 0:
+                    # 세션에 쌓인 객체를 비워 메모리 사용량을 일정하게 유지
+                    db.expunge_all()
+                    progress.report()
+    finally:
+        db.close()
+    progress.report(final=True)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m catalog", description="한자 카탈로그 가져오기/내보내기")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("import", "파일에서 가져오기 (character 기준 upsert)"), ("export", "파일로 내보내기")):
+        command = sub.add_parser(name, help=help_text)
+        command.add_argument("path", help="파일 경로 ('-'는 표준 입출력)")
+        command.add_argument("--format", choices=["csv", "jsonl"], help="기본값: 확장자로 판단 (.csv, .jsonl, .ndjson)")
+        command.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+        command.add_argument("--no-copy", action="store_true", help="PostgreSQL에서도 COPY 대신 executemany 사용")
+    args = parser.parse_args(argv)
+
+    run = run_import if args.command == "import" else run_export
+    run(args.path, args.format, args.chunk_size, not args.no_copy)
+
+
+if __name__ == "__main__":
+    main()
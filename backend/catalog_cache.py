@@ -0,0 +1,168 @@
+"""
+한자 카탈로그 인메모리 캐시
+카탈로그는 거의 바뀌지 않으므로 DB 조회와 Pydantic 객체 생성을 한 번만 수행하고,
+버전 카운터로 무효화합니다 (create/update/delete 시 버전 증가).
+응답 JSON도 스냅샷마다 한 번만 인코딩하여 ETag와 함께 재사용합니다.
+"""
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models import HanjaModel
+from progress_bitmap import bitmap_size
+from quiz import QuizPools, build_quiz_pools
+from schemas import Hanja
+
+_hanja_list_adapter = TypeAdapter(List[Hanja])
+
+
+def _encode_hanja_list(hanja_list: List[Hanja]) -> bytes:
+    """HanjaListResponse 형식({"hanja": [...]})으로 인코딩합니다."""
+    return b'{"hanja":' + _hanja_list_adapter.dump_json(hanja_list) + b"}"
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    """특정 버전의 카탈로그 스냅샷 (읽기 전용)"""
+    version: int
+    hanja: List[Hanja]
+    by_chapter: Dict[int, List[Hanja]]
+    by_id: Dict[str, Hanja]
+    chapters: List[int] = field(default_factory=list)
+    # 퀴즈 오답 후보 (스냅샷 로드 시 미리 계산)
+    quiz_pools: Optional[QuizPools] = None
+    # 진행 상태 비트맵의 비트 수 (가장 큰 숫자 ID + 1)
+    bitmap_size: int = 0
+    # 카탈로그 전체 JSON의 해시 (ETag 기준값, 재시작/워커와 무관하게 내용이 같으면 동일)
+    tag: str = ""
+    _encoded: Dict[str, bytes] = field(default_factory=dict, repr=False, compare=False)
+
+    def etag(self, key: str) -> str:
+        """리소스 키에 대한 strong ETag를 반환합니다."""
+        return f'"{self.tag}-{key}"'
+
+    def encoded(self, key: str, encode: Callable[[], bytes]) -> bytes:
+        """리소스 키별로 인코딩된 JSON 바이트를 한 번만 만들고 재사용합니다."""
+        body = self._encoded.get(key)
+        if body is None:
+            body = encode()
+            self._encoded[key] = body
+        return body
+
+    def list_json(self) -> bytes:
+        """GET /api/hanja 응답 바이트"""
+        return self.encoded("all", lambda: _encode_hanja_list(self.hanja))
+
+    def chapter_json(self, chapter: int) -> bytes:
+        """GET /api/hanja/chapter/{chapter} 응답 바이트"""
+        return self.encoded(f"c{chapter}", lambda: _encode_hanja_list(self.by_chapter.get(chapter, [])))
+
+    def hanja_json(self, hanja_id: str) -> Optional[bytes]:
+        """GET /api/hanja/{hanja_id} 응답 바이트 (없으면 None)"""
+        hanja = self.by_id.get(hanja_id)
+        if hanja is None:
+            return None
+        return self.encoded(f"h{hanja_id}", hanja.model_dump_json().encode)
+
+    def chapters_json(self) -> bytes:
+        """GET /api/chapters 응답 바이트"""
+        return self.encoded("chapters", lambda: json.dumps(self.chapters, separators=(",", ":")).encode())
+
+
+class CatalogCache:
+    """버전 카운터 기반 카탈로그 캐시"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._version = 0
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def invalidate(self) -> int:
+        """카탈로그 버전을 올려 다음 조회 시 다시 로드되도록 합니다."""
+        with self._lock:
+            self._version += 1
+            self._snapshot = None
+            return self._version
+
+    def current(self) -> Optional[CatalogSnapshot]:
+        """최신 버전의 스냅샷이 있으면 반환합니다 (DB 접근 없음)."""
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self._version:
+            self.hits += 1
+            return snapshot
+        return None
+
+    def get(self, db: Session) -> CatalogSnapshot:
+        """스냅샷을 반환하고, 오래되었으면 DB에서 다시 로드합니다."""
+        snapshot = self.current()
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            # 다른 요청이 먼저 로드했을 수 있음
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.version == self._version:
+                self.hits += 1
+                return snapshot
+            self.misses += 1
+            version = self._version
+
+        # 로드 중에 무효화되면 이전 버전으로 저장되어 다음 조회에서 다시 로드됨
+        snapshot = self._load(db, version)
+        with self._lock:
+            if version == self._version:
+                self._snapshot = snapshot
+        return snapshot
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중/미스 통계를 반환합니다."""
+        snapshot = self._snapshot
+        return {
+            "version": self._version,
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(snapshot.hanja) if snapshot else 0,
+        }
+
+    @staticmethod
+    def _load(db: Session, version: int) -> CatalogSnapshot:
+        # crud -> catalog_cache 순환 import 방지
+        from crud import _model_to_schema
+
+        stmt = select(HanjaModel).order_by(HanjaModel.chapter, HanjaModel.id)
+        hanja_list = [_model_to_schema(h) for h in db.execute(stmt).scalars().all()]
+
+        by_chapter: Dict[int, List[Hanja]] = {}
+        by_id: Dict[str, Hanja] = {}
+        for hanja in hanja_list:
+            by_chapter.setdefault(hanja.chapter, []).append(hanja)
+            by_id[hanja.id] = hanja
+
+        # 전체 목록을 미리 인코딩하고 그 해시를 ETag 기준값으로 사용
+        body = _encode_hanja_list(hanja_list)
+        return CatalogSnapshot(
+            version=version,
+            hanja=hanja_list,
+            by_chapter=by_chapter,
+            by_id=by_id,
+            chapters=sorted(by_chapter),
+            quiz_pools=build_quiz_pools(hanja_list),
+            bitmap_size=bitmap_size(by_id),
+            tag=hashlib.sha1(body).hexdigest()[:16],
+            _encoded={"all": body},
+        )
+
+
+catalog_cache = CatalogCache()
@@ -0,0 +1,188 @@
+"""
+워커(프로세스) 간 카탈로그 캐시 무효화
+카탈로그 캐시와 검색 인덱스는 워커마다 메모리에 있으므로, 한 워커에서 관리자 수정(create/update/delete_hanja)이
+커밋되면 다른 워커도 카탈로그 버전을 올려야 오래된 데이터를 내보내지 않습니다.
+- notify: PostgreSQL LISTEN/NOTIFY. 수정한 트랜잭션 안에서 pg_notify를 호출하므로 커밋된 경우에만 전달되며,
+  다른 호스트의 워커에도 전달됩니다.
+- file: 같은 호스트의 워커가 공유하는 스탬프 파일 (SQLite/로컬). 커밋 후 파일을 새로 쓰고,
+  각 워커는 catalog_sync_interval_ms마다 stat 결과만 비교합니다.
+- off: 단일 워커 (프로세스 안에서만 무효화)
+알림을 받은 워커는 버전만 올리고, 카탈로그와 검색 인덱스는 다음 요청에서 다시 로드됩니다.
+"""
+import asyncio
+import logging
+import os
+import tempfile
+from typing import Dict, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from catalog_cache import CatalogCache, catalog_cache
+from config import settings
+from database import CATALOG_STICKY_KEY, mark_written
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "hanja_catalog"
+# 이 프로세스가 보낸 알림을 구분하는 ID (자기 수정은 crud에서 이미 무효화함)
+WORKER_ID = uuid4().hex
+# LISTEN 연결 확인 주기, 확인 쿼리 제한 시간, 재연결 간격 상한 (초)
+LISTEN_KEEPALIVE = 30.0
+LISTEN_CHECK_TIMEOUT = 10.0
+MAX_RECONNECT_DELAY = 30.0
+DEFAULT_STAMP_FILE = os.path.join(tempfile.gettempdir(), "hanja-catalog.stamp")
+
+
+def resolve_mode() -> str:
+    """CATALOG_SYNC 설정(auto 포함)을 실제 방식(notify/file/off)으로 바꿉니다."""
+    mode = settings.catalog_sync
+    if mode != "auto":
+        return mode
+    if make_url(settings.database_url).get_backend_name() != "postgresql":
+        return "file"
+    # 트랜잭션 풀러로는 LISTEN 연결을 유지할 수 없음 (CATALOG_LISTEN_URL에 직접 연결 URL을 주면 notify)
+    if settings.db_transaction_pooler and not settings.catalog_listen_url:
+        return "file"
+    return "notify"
+
+
+class CatalogSync:
+    """카탈로그 수정 알림을 보내고 다른 워커의 알림을 받아 캐시를 무효화합니다."""
+
+    def __init__(
+        self,
+        cache: CatalogCache,
+        mode: str,
+        listen_url: Optional[str] = None,
+        stamp_file: str = DEFAULT_STAMP_FILE,
+        interval_ms: int = 200
+    ) -> None:
+        if mode not in ("notify", "file", "off"):
+            raise ValueError(f"지원하지 않는 CATALOG_SYNC 값입니다: {mode}")
+        self.cache = cache
+        self.mode = mode
+        self.listen_url = listen_url
+        self.stamp_file = stamp_file
+        self.interval = interval_ms / 1000
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.received = 0
+        self.connects = 0
+
+    def publish(self, db: Session) -> None:
+        """
+        카탈로그 수정을 다른 워커에 알립니다 (crud에서 커밋 직전에 호출).
+        notify는 같은 트랜잭션에 알림을 넣고, file은 커밋이 끝난 뒤 스탬프 파일을 씁니다.
+        """
+        if self.mode == "notify" and db.get_bind().dialect.name == "postgresql":
+            db.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": CHANNEL, "payload": WORKER_ID})
+            self.sent += 1
+        elif self.mode == "file":
+            # 커밋 전에 알리면 다른 워커가 수정 전 데이터를 새 버전으로 캐시할 수 있음
+            event.listen(db, "after_commit", self._write_stamp, once=True)
+
+    def _write_stamp(self, *_) -> None:
+        # 새 파일로 교체하므로 mtime 해상도가 낮은 파일 시스템에서도 inode가 바뀜
+        temp = f"{self.stamp_file}.{os.getpid()}.tmp"
+        try:
+            with open(temp, "w") as f:
+                f.write(WORKER_ID)
+            os.replace(temp, self.stamp_file)
+            self.sent += 1
+        except OSError:
+            logger.exception("카탈로그 스탬프 파일을 쓰지 못했습니다: %s", self.stamp_file)
+
+    def _read_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat_result = os.stat(self.stamp_file)
+        except FileNotFoundError:
+            return None
+        return stat_result.st_ino, stat_result.st_mtime_ns
+
+    def _invalidate(self) -> None:
+        self.received += 1
+        # 복제본이 아직 수정을 받지 못했을 수 있으므로 잠시 primary에서 읽음
+        # (무효화 직후의 재로드도 primary에서 하도록 먼저 표시)
+        mark_written(CATALOG_STICKY_KEY)
+        self.cache.invalidate()
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str) -> None:
+        if payload != WORKER_ID:
+            self._invalidate()
+
+    async def _poll(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            stamp = self._read_stamp()
+            # 자기 자신이 쓴 스탬프도 무효화함 (그 사이 다른 워커가 쓴 것과 구분할 수 없음)
+            if stamp != self._stamp:
+                self._stamp = stamp
+                self._invalidate()
+
+    async def _listen(self) -> None:
+        import asyncpg  # notify 방식에서만 필요
+
+        dsn = make_url(self.listen_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        delay = 1.0
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(dsn)
+                await conn.add_listener(CHANNEL, self._on_notify)
+                # 연결이 없던 동안의 알림은 받을 수 없으므로 (재)연결할 때마다 무효화
+                self.cache.invalidate()
+                self.connects += 1
+                delay = 1.0
+                while True:
+                    await asyncio.sleep(LISTEN_KEEPALIVE)
+                    await asyncio.wait_for(conn.execute("SELECT 1"), timeout=LISTEN_CHECK_TIMEOUT)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("카탈로그 LISTEN 연결 실패, %.0f초 후 다시 연결합니다.", delay, exc_info=True)
+            finally:
+                if conn is not None and not conn.is_closed():
+                    conn.terminate()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    def start(self) -> None:
+        """알림 수신 작업을 시작합니다 (이벤트 루프 안에서 호출)."""
+        if self._task is not None or self.mode == "off":
+            return
+        if self.mode == "notify":
+            self._task = asyncio.create_task(self._listen())
+        else:
+            self._stamp = self._read_stamp()
+            self._task = asyncio.create_task(self._poll())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "mode": self.mode,
+            "sent": self.sent,
+            "received": self.received,
+            "connects": self.connects,
+        }
+
+
+catalog_sync = CatalogSync(
+    catalog_cache,
+    resolve_mode(),
+    listen_url=settings.catalog_listen_url or settings.database_url,
+    stamp_file=settings.catalog_sync_file or DEFAULT_STAMP_FILE,
+    interval_ms=settings.catalog_sync_interval_ms,
+)
@@ -1,13 +1,66 @@
 from pydantic_settings import BaseSettings
+from sqlalchemy.engine import make_url
 from typing import Optional
 
 
 class Settings(BaseSettings):
+    # 필수 (설정이 빠졌을 때 조용히 다른 DB로 시작하지 않도록). 엣지 모드는 sqlite:///./hanja.db처럼 명시
     database_url: str
-    database_schema: str = "public"  # 사용할 PostgreSQL 스키마 이름
+    database_schema: str = "public"  # 사용할 PostgreSQL 스키마 이름 (SQLite에서는 무시)
+    # 비동기 DB 엔진 사용 여부 (asyncpg / aiosqlite), False면 동기 엔진을 스레드풀에서 사용
+    use_async_db: bool = False
+    # 서버 시작 시 마이그레이션 적용 (기본: 배포 단계에서 python migrations.py로 따로 실행)
+    auto_migrate: bool = False
+    # 비동기 엔진 URL (없으면 database_url에서 드라이버만 바꿔 사용)
+    async_database_url: Optional[str] = None
+    # 읽기 전용 복제본 URL (있으면 GET 엔드포인트의 조회를 복제본으로 보냄)
+    read_database_url: Optional[str] = None
+    async_read_database_url: Optional[str] = None
+    # 쓰기 후 같은 사용자/카탈로그의 읽기를 primary로 보내는 시간 (초, 복제 지연보다 길게)
+    replica_sticky_seconds: float = 5.0
+    # 연결 풀 설정 (PostgreSQL, 워커 프로세스마다 적용)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0  # 빈 연결을 기다리는 최대 시간 (초)
+    db_pool_recycle: int = 1800  # 이 시간(초)보다 오래된 연결은 체크아웃 시 새로 연결 (-1이면 사용 안 함)
+    # 체크아웃마다 연결 확인 쿼리 실행 (왕복 1회 추가, 끊긴 연결이 자주 생기는 환경에서만 사용)
+    db_pool_pre_ping: bool = False
+    # SQL 문 실행 시간 제한 (밀리초, 없으면 서버 기본값)
+    db_statement_timeout_ms: Optional[int] = None
+    # 트랜잭션 풀러(pgbouncer transaction 모드, Supabase pooler 6543 포트) 사용 시:
+    # 앱 쪽 풀을 두지 않고(NullPool) 서버 측 prepared statement를 재사용하지 않음
+    db_transaction_pooler: bool = False
+    # 한자 검색 방식: "memory"(인메모리 n-gram 인덱스) 또는 "pg_trgm"(PostgreSQL LIKE + 트라이그램 인덱스)
+    search_backend: str = "memory"
+    # 진행 상태 write-behind: 저장 요청을 메모리에 모아 주기적으로 한 번에 커밋 (워커가 하나일 때만 사용 가능)
+    progress_write_behind: bool = False
+    # write-behind 저장 주기 (밀리초)와 즉시 저장을 시작하는 대기 항목 수
+    write_behind_interval_ms: int = 50
+    write_behind_max_entries: int = 500
+    # 워커 프로세스 수 (uvicorn이 읽는 값과 같은 WEB_CONCURRENCY, 워커 수에 따라 켤 수 없는 기능 확인용)
+    web_concurrency: int = 1
+    # 워커 간 카탈로그 캐시 무효화: "auto"(PostgreSQL이면 notify, 아니면 file), "notify", "file", "off"
+    catalog_sync: str = "auto"
+    # notify: LISTEN 전용 연결 URL (없으면 database_url, 트랜잭션 풀러를 쓰면 직접 연결 URL 지정)
+    catalog_listen_url: Optional[str] = None
+    # file: 같은 호스트의 워커가 공유하는 스탬프 파일 (없으면 임시 디렉터리)과 확인 주기 (밀리초)
+    catalog_sync_file: Optional[str] = None
+    catalog_sync_interval_ms: int = 200
+    # SQLite 엣지 모드: 쓰기는 연결 하나(BEGIN IMMEDIATE)로 직렬화하고 읽기는 별도 연결 풀(DB_POOL_SIZE) 사용
+    sqlite_synchronous: str = "NORMAL"  # WAL에서는 NORMAL이어도 커밋이 손상되지 않음 (전원 장애 시 마지막 커밋만 유실 가능)
+    sqlite_mmap_size: int = 268435456  # 메모리 맵 I/O 크기 (바이트, 0이면 사용 안 함)
+    sqlite_cache_size_kb: int = 65536  # 연결당 페이지 캐시 크기 (KiB)
+    sqlite_busy_timeout_ms: int = 5000  # 다른 프로세스가 쓰기 잠금을 잡고 있을 때 기다리는 시간
     host: str = "0.0.0.0"
     port: int = 8000
 
+    @property
+    def table_schema(self) -> Optional[str]:
+        """테이블에 붙일 스키마 (SQLite는 스키마가 없으므로 None)"""
+        if make_url(self.database_url).get_backend_name() == "sqlite":
+            return None
+        return self.database_schema
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -1,8 +1,26 @@
 from sqlalchemy.orm import Session, selectinload
-from sqlalchemy import select, func
-from models import HanjaModel, StudyProgressModel, PracticeProgressModel
-from schemas import Hanja, Example, StudyProgress, StudyProgressResponse, PracticeProgressResponse
-from typing import List, Optional
+from sqlalchemy import (
+    Boolean, select, func, insert, update, delete, case, literal, literal_column, column, tuple_, values, and_, or_, text
+)
+from sqlalchemy.engine import Row
+from models import (
+    HanjaModel, StudyProgressModel, PracticeProgressModel, ReviewStateModel, ProgressCounterModel,
+    ProgressTombstoneModel
+)
+from schemas import (
+    Hanja, Example, StudyProgress, StudyProgressResponse, PracticeProgressResponse, ReviewStateResponse,
+    ChapterStats
+)
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+from catalog_cache import catalog_cache, CatalogSnapshot
+from catalog_sync import catalog_sync
+from id_allocator import allocate_hanja_id
+from search_index import search_index, is_choseong_query, query_characters, RANK_CHARACTER, RANK_SOUND, RANK_MEANING, RANK_EXAMPLE
+from config import settings
+from progress_bitmap import encode_bitmap, hanja_ordinal
+import random
+import scheduler
 
 
 def _model_to_schema(hanja_model: HanjaModel) -> Hanja:
@@ -24,54 +42,140 @@ def _model_to_schema(hanja_model: HanjaModel) -> Hanja:
     )
 
 
+def get_catalog(db: Session) -> CatalogSnapshot:
+    """현재 버전의 카탈로그 스냅샷을 반환합니다 (필요하면 DB에서 로드)."""
+    return catalog_cache.get(db)
+
+
 def get_all_hanja(db: Session) -> List[Hanja]:
-    """모든 한자 데이터를 가져옵니다 (ORM 사용)."""
-    # SQLAlchemy 2.0 스타일 쿼리
-    stmt = select(HanjaModel).order_by(HanjaModel.chapter, HanjaModel.id)
-    hanja_list = db.execute(stmt).scalars().all()
-    
-    return [_model_to_schema(h) for h in hanja_list]
+    """모든 한자 데이터를 가져옵니다 (카탈로그 캐시 사용, 반환값은 읽기 전용)."""
+    return catalog_cache.get(db).hanja
 
 
 def get_all_chapters(db: Session) -> List[int]:
     """존재하는 모든 단원 번호 목록을 반환합니다 (오름차순, 중복 제거)."""
-    stmt = select(HanjaModel.chapter).distinct().order_by(HanjaModel.chapter)
-    chapters = db.execute(stmt).scalars().all()
-    return list(chapters)
+    return list(catalog_cache.get(db).chapters)
 
 
 def get_hanja_by_id(db: Session, hanja_id: str) -> Optional[Hanja]:
-    """ID로 한자 데이터를 가져옵니다 (ORM 사용)."""
-    stmt = select(HanjaModel).where(HanjaModel.id == hanja_id)
-    hanja_model = db.execute(stmt).scalar_one_or_none()
-    
-    if not hanja_model:
-        return None
-    
-    return _model_to_schema(hanja_model)
+    """ID로 한자 데이터를 가져옵니다 (카탈로그 캐시 사용)."""
+    return catalog_cache.get(db).by_id.get(hanja_id)
 
 
 def get_hanja_by_chapter(db: Session, chapter: int) -> List[Hanja]:
-    """단원별로 한자 데이터를 가져옵니다 (ORM 사용)."""
-    stmt = select(HanjaModel).where(HanjaModel.chapter == chapter).order_by(HanjaModel.id)
-    hanja_list = db.execute(stmt).scalars().all()
-    
-    return [_model_to_schema(h) for h in hanja_list]
+    """단원별로 한자 데이터를 가져옵니다 (카탈로그 캐시 사용, 반환값은 읽기 전용)."""
+    return catalog_cache.get(db).by_chapter.get(chapter, [])
+
+
+# API 필드 이름 -> 컬럼 (필드 선택 시 SELECT 컬럼 목록으로 사용)
+HANJA_FIELD_COLUMNS = {
+    "id": HanjaModel.id,
+    "character": HanjaModel.character,
+    "sound": HanjaModel.sound,
+    "meaning": HanjaModel.meaning,
+    "strokeOrder": HanjaModel.stroke_order,
+    "examples": HanjaModel.examples,
+    "chapter": HanjaModel.chapter,
+    "difficulty": HanjaModel.difficulty,
+}
+
+
+def get_hanja_page(
+    db: Session,
+    after: Optional[Tuple[int, str]] = None,
+    limit: Optional[int] = None,
+    fields: Optional[List[str]] = None
+) -> Tuple[List[dict], Optional[Tuple[int, str]]]:
+    """
+    (chapter, id) 순서의 키셋 페이지네이션으로 한자 목록을 가져옵니다.
+    fields를 지정하면 해당 컬럼만 SELECT합니다 (id는 항상 포함).
+    다음 페이지가 있으면 (마지막 chapter, 마지막 id) 커서를 함께 반환합니다.
+    """
+    fields = list(dict.fromkeys(["id"] + (fields or list(HANJA_FIELD_COLUMNS))))
+    # 커서 계산을 위해 chapter는 항상 조회
+    columns = [HANJA_FIELD_COLUMNS[f].label(f) for f in fields]
+    if "chapter" not in fields:
+        columns.append(HanjaModel.chapter.label("chapter"))
+
+    stmt = select(*columns).order_by(HanjaModel.chapter, HanjaModel.id)
+    if after is not None:
+        chapter, hanja_id = after
+        stmt = stmt.where(or_(
+            HanjaModel.chapter > chapter,
+            and_(HanjaModel.chapter == chapter, HanjaModel.id > hanja_id)
+        ))
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    rows = db.execute(stmt).mappings().all()
+    next_cursor = None
+    if limit is not None and len(rows) == limit:
+        next_cursor = (rows[-1]["chapter"], rows[-1]["id"])
+    return [{f: row[f] for f in fields} for row in rows], next_cursor
+
+
+def search_hanja(db: Session, query: str, limit: int = 20) -> List[Hanja]:
+    """
+    한자/음/뜻/예문/초성으로 검색합니다.
+    기본은 카탈로그 버전에 맞춘 인메모리 인덱스이며, SEARCH_BACKEND=pg_trgm이면 PostgreSQL에서 검색합니다
+    (초성 검색은 항상 인메모리 인덱스 사용).
+    """
+    query = query.strip()
+    if (
+        settings.search_backend == "pg_trgm"
+        and db.get_bind().dialect.name == "postgresql"
+        and not is_choseong_query(query)
+    ):
+        return _search_hanja_trgm(db, query, limit)
+
+    snapshot = get_catalog(db)
+    if search_index.version != snapshot.version:
+        search_index.rebuild(snapshot.version, snapshot.hanja)
+    return search_index.search(query, limit)
+
+
+# 예문 JSON 배열에서 문장/뜻을 LIKE로 찾는 조건 (PostgreSQL은 json_array_elements, SQLite는 json_each)
+_EXAMPLE_MATCH_SQL = {
+    "postgresql": "EXISTS (SELECT 1 FROM json_array_elements(examples) AS e"
+                  " WHERE e->>'sentence' LIKE :pattern ESCAPE '/' OR e->>'meaning' LIKE :pattern ESCAPE '/')",
+    "sqlite": "EXISTS (SELECT 1 FROM json_each(examples) AS e"
+              " WHERE json_extract(e.value, '$.sentence') LIKE :pattern ESCAPE '/'"
+              " OR json_extract(e.value, '$.meaning') LIKE :pattern ESCAPE '/')",
+}
+
+
+def _search_hanja_trgm(db: Session, query: str, limit: int) -> List[Hanja]:
+    """
+    PostgreSQL LIKE 검색 (음/뜻은 migrations.py 6번의 트라이그램 인덱스 사용).
+    순위 규칙은 인메모리 인덱스(search_index.py)와 같으며, 같은 결과인지 테스트에서 SQLite로도 실행합니다.
+    """
+    if not query:
+        return []
+    pattern = "%" + query.replace("/", "//").replace("%", "/%").replace("_", "/_") + "%"
+    character_match = HanjaModel.character.in_(query_characters(query))
+    sound_match = HanjaModel.sound.like(pattern, escape="/")
+    meaning_match = HanjaModel.meaning.like(pattern, escape="/")
+    example_match = text(_EXAMPLE_MATCH_SQL[db.get_bind().dialect.name]).bindparams(pattern=pattern)
+    rank = case(
+        (character_match, RANK_CHARACTER),
+        (sound_match, RANK_SOUND),
+        (meaning_match, RANK_MEANING),
+        else_=RANK_EXAMPLE
+    )
+    stmt = (
+        select(HanjaModel)
+        .where(or_(character_match, sound_match, meaning_match, example_match))
+        .order_by(rank, HanjaModel.chapter, HanjaModel.id)
+        .limit(limit)
+    )
+    return [_model_to_schema(h) for h in db.execute(stmt).scalars().all()]
 
 
 def create_hanja(db: Session, hanja_data: dict) -> Hanja:
     """새 한자 데이터를 생성합니다 (ORM 사용)."""
-    # ID가 없으면 자동 생성 (기존 최대 ID + 1)
+    # ID가 없으면 시퀀스에서 발급 (기존 문자열 ID 형식 유지)
     if "id" not in hanja_data or not hanja_data.get("id"):
-        stmt = select(HanjaModel.id)
-        existing_ids = db.execute(stmt).scalars().all()
-        if existing_ids:
-            # 숫자 ID만 추출하여 최대값 찾기
-            numeric_ids = [int(id) for id in existing_ids if str(id).isdigit()]
-            new_id = str(max(numeric_ids) + 1) if numeric_ids else "1"
-        else:
-            new_id = "1"
-        hanja_data["id"] = new_id
+        hanja_data["id"] = allocate_hanja_id(db)
     
     # examples를 dict 리스트로 변환
     examples_data = hanja_data.get("examples", [])
@@ -96,9 +200,12 @@ def create_hanja(db: Session, hanja_data: dict) -> Hanja:
         difficulty=hanja_data.get("difficulty", 2)
     )
     db.add(hanja_model)
+    catalog_sync.publish(db)
     db.commit()
     db.refresh(hanja_model)
-    return _model_to_schema(hanja_model)
+    hanja = _model_to_schema(hanja_model)
+    search_index.apply(catalog_cache.invalidate(), hanja=hanja)
+    return hanja
 
 
 def update_hanja(db: Session, hanja_id: str, hanja_data: dict) -> Optional[Hanja]:
@@ -130,9 +237,12 @@ def update_hanja(db: Session, hanja_id: str, hanja_data: dict) -> Optional[Hanja
     if "difficulty" in hanja_data:
         hanja_model.difficulty = hanja_data["difficulty"]
     
+    catalog_sync.publish(db)
     db.commit()
     db.refresh(hanja_model)
-    return _model_to_schema(hanja_model)
+    hanja = _model_to_schema(hanja_model)
+    search_index.apply(catalog_cache.invalidate(), hanja=hanja)
+    return hanja
 
 
 def delete_hanja(db: Session, hanja_id: str) -> bool:
@@ -144,10 +254,494 @@ def delete_hanja(db: Session, hanja_id: str) -> bool:
         return False
     
     db.delete(hanja_model)
+    catalog_sync.publish(db)
     db.commit()
+    search_index.apply(catalog_cache.invalidate(), removed_id=hanja_id)
     return True
 
 
+def _dialect_insert(db: Session):
+    """ON CONFLICT를 지원하는 방언별 insert 생성자를 반환합니다 (미지원 DB는 None)."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return None
+    return dialect_insert
+
+
+def _merge_progress_items(items: List[dict]) -> Dict[Tuple[str, str], dict]:
+    """같은 (user_id, hanja_id)가 여러 번 들어오면 마지막 값만 남깁니다."""
+    merged: Dict[Tuple[str, str], dict] = {}
+    for item in items:
+        merged[(item["user_id"], item["hanja_id"])] = {
+            "user_id": item["user_id"],
+            "hanja_id": item["hanja_id"],
+            "chapter": item["chapter"],
+            "is_known": item["is_known"],
+        }
+    return merged
+
+
+def _read_existing_progress(db: Session, model, merged: Dict[Tuple[str, str], dict]) -> Dict[Tuple[str, str], Row]:
+    """저장할 키의 기존 행(id, chapter, is_known)을 잠그고 가져옵니다 (통계 카운터 증감 계산용)."""
+    user_ids = {user_id for user_id, _ in merged}
+    hanja_ids = {hanja_id for _, hanja_id in merged}
+    stmt = select(model.id, model.user_id, model.hanja_id, model.chapter, model.is_known).where(
+        model.user_id.in_(user_ids),
+        model.hanja_id.in_(hanja_ids)
+    ).with_for_update()
+    return {
+        (row.user_id, row.hanja_id): row
+        for row in db.execute(stmt)
+        if (row.user_id, row.hanja_id) in merged
+    }
+
+
+def _on_conflict_update(stmt, model):
+    """(user_id, hanja_id)가 이미 있으면 값이 바뀐 경우에만 갱신하는 ON CONFLICT 절"""
+    return stmt.on_conflict_do_update(
+        index_elements=[model.user_id, model.hanja_id],
+        set_={
+            "chapter": stmt.excluded.chapter,
+            "is_known": stmt.excluded.is_known,
+            # ON CONFLICT 경로에서는 onupdate가 적용되지 않으므로 직접 갱신
+            "updated_at": func.now(),
+        },
+        # 값이 같으면 건드리지 않음: 재전송된 배치는 updated_at/카운터를 바꾸지 않는 no-op
+        where=or_(model.chapter != stmt.excluded.chapter, model.is_known != stmt.excluded.is_known),
+    )
+
+
+def _postgresql_upsert_statement(model, rows: List[dict]):
+    """
+    PostgreSQL: 기존 행을 잠그는 CTE와 ON CONFLICT DO UPDATE를 한 문장으로 실행하고,
+    RETURNING으로 저장된 값과 함께 이전 값(old_chapter, old_is_known)과 새로 삽입됐는지(xmax = 0)를 돌려받습니다.
+    """
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+    old = select(model.user_id, model.hanja_id, model.chapter, model.is_known).where(
+        tuple_(model.user_id, model.hanja_id).in_([(row["user_id"], row["hanja_id"]) for row in rows])
+    ).with_for_update().cte("old_progress")
+    columns = ["user_id", "hanja_id", "chapter", "is_known"]
+    source = values(*(column(name, model.__table__.c[name].type) for name in columns), name="new_progress").data(
+        [tuple(row[name] for name in columns) for row in rows]
+    )
+    # SELECT CTE는 처음 참조될 때 실행되므로, 삽입할 행을 내보내기 전에 CTE를 끝까지 읽게 해서
+    # 이 문장이 행을 고치기 전에 기존 행을 모두 잠그고 이전 값을 확보함
+    locked = select(func.count()).select_from(old).scalar_subquery()
+    stmt = pg_insert(model).from_select(columns, select(source).where(locked >= 0))
+    stmt = _on_conflict_update(stmt, model)
+
+    # RETURNING 안의 서브쿼리는 자동으로 대상 테이블과 연관되지 않으므로 대상 테이블 컬럼을 직접 참조
+    target = model.__table__.name
+
+    def previous(name):
+        return select(old.c[name]).where(
+            old.c.user_id == literal_column(f"{target}.user_id"),
+            old.c.hanja_id == literal_column(f"{target}.hanja_id")
+        ).scalar_subquery()
+
+    return stmt.add_cte(old).returning(
+        model.user_id, model.hanja_id, model.chapter, model.is_known,
+        literal_column("xmax = 0", Boolean).label("inserted"),
+        previous("chapter").label("old_chapter"),
+        previous("is_known").label("old_is_known"),
+    )
+
+
+def _upsert_progress(db: Session, model, items: List[dict]) -> List[dict]:
+    """
+    진행 상태를 (user_id, hanja_id) 유니크 인덱스 기준의 INSERT ... ON CONFLICT DO UPDATE ... RETURNING 한 문장으로 저장합니다.
+    같은 트랜잭션에서 단원별 통계 카운터도 갱신합니다 (증감은 이전 값과 저장된 값으로 계산).
+    - PostgreSQL: 이전 값도 같은 문장의 RETURNING으로 받음
+    - SQLite: 쓰기 연결이 하나뿐이라(BEGIN IMMEDIATE) 먼저 읽은 기존 행이 upsert 시점까지 바뀌지 않음
+    - 그 외: 기존 행을 잠가서 읽은 뒤 다중 행 INSERT/UPDATE
+    저장된 값과 같은 항목은 건드리지 않으므로 같은 배치를 다시 보내도 결과가 같습니다 (멱등).
+    """
+    merged = _merge_progress_items(items)
+    if not merged:
+        return []
+
+    mode = _PROGRESS_MODES[model]
+    dialect_insert = _dialect_insert(db)
+    if db.get_bind().dialect.name == "postgresql":
+        # 동시 트랜잭션 간 교착을 피하기 위해 항상 같은 순서로 저장
+        rows = [item for _, item in sorted(merged.items())]
+        changed = [dict(row) for row in db.execute(_postgresql_upsert_statement(model, rows)).mappings()]
+        removed = [
+            (row["user_id"], row["old_chapter"], row["old_is_known"])
+            for row in changed if row["old_is_known"] is not None
+        ]
+        # 새로 삽입되지 않았는데 이전 값이 없으면 다른 트랜잭션이 같은 키를 방금 처음 저장한 경우
+        # (CTE의 스냅샷에 그 행이 없음): 이전 값을 알 수 없으므로 해당 사용자의 카운터를 다시 계산
+        raced = {row["user_id"] for row in changed if not row["inserted"] and row["old_is_known"] is None}
+    else:
+        existing = _read_existing_progress(db, model, merged)
+        if dialect_insert is None:
+            changed = _upsert_progress_fallback(db, model, merged, existing)
+        else:
+            stmt = _on_conflict_update(dialect_insert(model).values(list(merged.values())), model)
+            stmt = stmt.returning(model.user_id, model.hanja_id, model.chapter, model.is_known)
+            changed = [dict(row) for row in db.execute(stmt).mappings()]
+        removed = [
+            (old.user_id, old.chapter, old.is_known)
+            for old in (existing.get((row["user_id"], row["hanja_id"])) for row in changed)
+            if old is not None
+        ]
+        raced = set()
+
+    added = [(row["user_id"], row["chapter"], row["is_known"]) for row in changed]
+    _apply_progress_counters(db, mode, removed, added)
+    if raced:
+        _recount_progress_counters(db, mode, raced)
+    db.commit()
+    # 바뀌지 않은 행도 요청한 값과 저장된 값이 같으므로 그대로 반환
+    return list(merged.values())
+
+
+def _upsert_progress_fallback(
+    db: Session,
+    model,
+    merged: Dict[Tuple[str, str], dict],
+    existing: Dict[Tuple[str, str], Row]
+) -> List[dict]:
+    """ON CONFLICT를 지원하지 않는 DB용: 다중 행 INSERT/UPDATE, 실제로 바뀐 행만 반환 (commit은 호출한 쪽에서)"""
+    changed_keys = [
+        key for key, item in merged.items()
+        if key not in existing
+        or (existing[key].chapter, existing[key].is_known) != (item["chapter"], item["is_known"])
+    ]
+    to_update = [
+        {"id": existing[key].id, "chapter": merged[key]["chapter"], "is_known": merged[key]["is_known"]}
+        for key in changed_keys if key in existing
+    ]
+    to_insert = [merged[key] for key in changed_keys if key not in existing]
+    if to_update:
+        db.execute(update(model), to_update)
+    if to_insert:
+        db.execute(insert(model), to_insert)
+    return [merged[key] for key in changed_keys]
+
+
+# 단원별 통계 카운터 (progress_counters)
+_PROGRESS_MODES = {StudyProgressModel: "study", PracticeProgressModel: "practice"}
+
+
+def _apply_progress_counters(
+    db: Session,
+    mode: str,
+    removed: List[Tuple[str, int, bool]],
+    added: List[Tuple[str, int, bool]]
+) -> None:
+    """
+    (user_id, chapter, is_known) 상태를 빼고 더해 (user_id, chapter)별 known/unknown 카운터를 증감합니다.
+    진행 상태를 바꾸는 트랜잭션 안에서 호출해야 합니다.
+    """
+    deltas: Dict[Tuple[str, int], List[int]] = {}
+    for states, sign in ((removed, -1), (added, 1)):
+        for user_id, chapter, is_known in states:
+            delta = deltas.setdefault((user_id, chapter), [0, 0])
+            delta[0 if is_known else 1] += sign
+
+    # 동시 트랜잭션 간 교착을 피하기 위해 항상 같은 순서로 잠금
+    rows = [
+        {"user_id": user_id, "mode": mode, "chapter": chapter, "known_count": known, "unknown_count": unknown}
+        for (user_id, chapter), (known, unknown) in sorted(deltas.items())
+        if known or unknown
+    ]
+    if not rows:
+        return
+
+    dialect_insert = _dialect_insert(db)
+    if dialect_insert is None:
+        for row in rows:
+            stmt = update(ProgressCounterModel).where(
+                ProgressCounterModel.user_id == row["user_id"],
+                ProgressCounterModel.mode == mode,
+                ProgressCounterModel.chapter == row["chapter"]
+            ).values(
+                known_count=ProgressCounterModel.known_count + row["known_count"],
+                unknown_count=ProgressCounterModel.unknown_count + row["unknown_count"]
+            )
+            if db.execute(stmt).rowcount == 0:
+                db.execute(insert(ProgressCounterModel).values(**row))
+        return
+
+    stmt = dialect_insert(ProgressCounterModel).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ProgressCounterModel.user_id, ProgressCounterModel.mode, ProgressCounterModel.chapter],
+        set_={
+            "known_count": ProgressCounterModel.known_count + stmt.excluded.known_count,
+            "unknown_count": ProgressCounterModel.unknown_count + stmt.excluded.unknown_count,
+        },
+    )
+    db.execute(stmt)
+
+
+def rebuild_progress_counters(db) -> None:
+    """진행 상태 테이블에서 통계 카운터 전체를 다시 계산합니다 (마이그레이션/복구용)."""
+    db.execute(ProgressCounterModel.__table__.delete())
+    for model, mode in _PROGRESS_MODES.items():
+        stmt = select(
+            model.user_id,
+            literal(mode),
+            model.chapter,
+            func.sum(case((model.is_known, 1), else_=0)),
+            func.sum(case((model.is_known, 0), else_=1))
+        ).group_by(model.user_id, model.chapter)
+        db.execute(insert(ProgressCounterModel).from_select(
+            ["user_id", "mode", "chapter", "known_count", "unknown_count"], stmt
+        ))
+
+
+def _recount_progress_counters(db: Session, mode: str, user_ids: set) -> None:
+    """
+    사용자들의 mode 카운터를 진행 상태 테이블에서 다시 계산합니다 (이전 값을 알 수 없는 동시 첫 저장 복구용).
+    카운터 행을 먼저 잠가 다른 트랜잭션의 증감이 커밋된 뒤에 세므로, 아직 카운터를 건드리지 않은 트랜잭션은
+    나중에 자기 증감을 더해도 결과가 맞습니다.
+    """
+    model = _PROGRESS_MODELS[mode]
+    counter_keys = (ProgressCounterModel.user_id.in_(user_ids), ProgressCounterModel.mode == mode)
+    db.execute(
+        select(ProgressCounterModel.user_id).where(*counter_keys)
+        .order_by(ProgressCounterModel.user_id, ProgressCounterModel.chapter).with_for_update()
+    )
+    db.execute(update(ProgressCounterModel).where(*counter_keys).values(known_count=0, unknown_count=0))
+    rows = [
+        {"user_id": user_id, "mode": mode, "chapter": chapter, "known_count": known, "unknown_count": unknown}
+        for user_id, chapter, known, unknown in db.execute(
+            select(
+                model.user_id,
+                model.chapter,
+                func.sum(case((model.is_known, 1), else_=0)),
+                func.sum(case((model.is_known, 0), else_=1))
+            ).where(model.user_id.in_(user_ids)).group_by(model.user_id, model.chapter)
+            .order_by(model.user_id, model.chapter)
+        )
+    ]
+    if not rows:
+        return
+    stmt = _dialect_insert(db)(ProgressCounterModel).values(rows)
+    db.execute(stmt.on_conflict_do_update(
+        index_elements=[ProgressCounterModel.user_id, ProgressCounterModel.mode, ProgressCounterModel.chapter],
+        set_={"known_count": stmt.excluded.known_count, "unknown_count": stmt.excluded.unknown_count},
+    ))
+
+
+def get_progress_stats(db: Session, user_id: str) -> dict:
+    """
+    사용자의 단원별 학습/연습 통계를 반환합니다.
+    카운터 테이블과 카탈로그 캐시만 읽으므로 진행 상태 행 수와 무관하게 O(단원 수)입니다.
+    """
+    snapshot = catalog_cache.get(db)
+    stmt = select(ProgressCounterModel).where(ProgressCounterModel.user_id == user_id)
+    counters = {(c.mode, c.chapter): c for c in db.execute(stmt).scalars().all()}
+
+    chapters = sorted(set(snapshot.chapters) | {chapter for _, chapter in counters})
+    stats = {"user_id": user_id}
+    for mode in _PROGRESS_MODES.values():
+        stats[mode] = []
+        for chapter in chapters:
+            counter = counters.get((mode, chapter))
+            stats[mode].append(ChapterStats(
+                chapter=chapter,
+                known=counter.known_count if counter else 0,
+                unknown=counter.unknown_count if counter else 0,
+                total=len(snapshot.by_chapter.get(chapter, []))
+            ))
+    return stats
+
+
+# 델타 동기화 (updated_at 워터마크 + 삭제 기록)
+# PostgreSQL의 now()는 트랜잭션 시작 시각이므로, 긴 트랜잭션이 워터마크보다 이른 시각으로
+# 늦게 커밋되어도 놓치지 않도록 이 구간만큼 겹쳐서 조회합니다 (중복 행은 클라이언트에서 덮어씀).
+SYNC_OVERLAP = timedelta(seconds=5)
+_SYNC_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite는 시간대 없이 UTC로 저장하므로 비교 전에 모두 UTC aware로 맞춥니다."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _add_tombstone(db: Session, mode: str, progress_model) -> None:
+    """진행 상태 삭제를 동기화용으로 기록합니다 (삭제 트랜잭션 안에서 호출)."""
+    db.add(ProgressTombstoneModel(
+        user_id=progress_model.user_id,
+        mode=mode,
+        hanja_id=progress_model.hanja_id,
+        chapter=progress_model.chapter
+    ))
+
+
+def get_progress_changes(db: Session, user_id: str, since: Optional[datetime] = None) -> dict:
+    """
+    since 이후 바뀐 학습/연습 진행 상태와 삭제 기록을 반환합니다 ((user_id, updated_at) 인덱스 범위 스캔).
+    since가 없으면 전체 목록을 반환합니다. 새 워터마크는 DB에 기록된 시각 중 가장 늦은 값이라
+    서버와 DB 시계가 달라도 어긋나지 않습니다.
+    """
+    full = since is None
+    watermark = _SYNC_EPOCH if full else _as_utc(since)
+    lower = watermark - SYNC_OVERLAP
+
+    changes: Dict[str, list] = {}
+    updated: Dict[Tuple[str, str], datetime] = {}
+    for model, mode in _PROGRESS_MODES.items():
+        stmt = select(model.hanja_id, model.chapter, model.is_known, model.updated_at).where(model.user_id == user_id)
+        if not full:
+            stmt = stmt.where(model.updated_at > lower)
+        rows = db.execute(stmt).all()
+        changes[mode] = [
+            {"user_id": user_id, "hanja_id": row.hanja_id, "chapter": row.chapter, "is_known": row.is_known}
+            for row in rows
+        ]
+        for row in rows:
+            updated_at = _as_utc(row.updated_at)
+            updated[(mode, row.hanja_id)] = updated_at
+            watermark = max(watermark, updated_at)
+
+    deleted: Dict[Tuple[str, str], dict] = {}
+    if not full:
+        stmt = select(
+            ProgressTombstoneModel.mode, ProgressTombstoneModel.hanja_id,
+            ProgressTombstoneModel.chapter, ProgressTombstoneModel.deleted_at
+        ).where(
+            ProgressTombstoneModel.user_id == user_id,
+            ProgressTombstoneModel.deleted_at > lower
+        ).order_by(ProgressTombstoneModel.deleted_at)
+        for row in db.execute(stmt):
+            deleted_at = _as_utc(row.deleted_at)
+            watermark = max(watermark, deleted_at)
+            # 삭제 후 다시 저장된 항목은 현재 행이 우선
+            if updated.get((row.mode, row.hanja_id), _SYNC_EPOCH) >= deleted_at:
+                continue
+            deleted[(row.mode, row.hanja_id)] = {"mode": row.mode, "hanja_id": row.hanja_id, "chapter": row.chapter}
+
+    return {
+        "user_id": user_id,
+        "watermark": watermark,
+        "full": full,
+        "study": [StudyProgressResponse(**item) for item in changes["study"]],
+        "practice": [PracticeProgressResponse(**item) for item in changes["practice"]],
+        "deleted": list(deleted.values()),
+    }
+
+
+# 진행 상태 비트맵 (progress_bitmap.py)
+_PROGRESS_MODELS = {mode: model for model, mode in _PROGRESS_MODES.items()}
+
+
+def get_progress_bitmap(db: Session, mode: str, user_id: str) -> dict:
+    """사용자의 알고 있음/모름 상태를 카탈로그 버전과 함께 비트맵 두 개로 반환합니다."""
+    model = _PROGRESS_MODELS[mode]
+    snapshot = get_catalog(db)
+    known, unknown = [], []
+    for hanja_id, is_known in db.execute(select(model.hanja_id, model.is_known).where(model.user_id == user_id)):
+        ordinal = hanja_ordinal(hanja_id)
+        if ordinal is None or ordinal >= snapshot.bitmap_size:
+            continue
+        (known if is_known else unknown).append(ordinal)
+    return {
+        "user_id": user_id,
+        "catalog_version": snapshot.tag,
+        "size": snapshot.bitmap_size,
+        "known": encode_bitmap(known, snapshot.bitmap_size),
+        "unknown": encode_bitmap(unknown, snapshot.bitmap_size),
+    }
+
+
+def replace_progress(db: Session, mode: str, user_id: str, items: List[dict], size: int) -> None:
+    """
+    사용자의 진행 상태를 items로 교체합니다 (비트맵 저장용).
+    items에 없는 기록은 삭제 기록과 함께 지우고 나머지는 upsert하며, 통계 카운터도 같은 트랜잭션에서 갱신합니다.
+    비트맵으로 표현할 수 없는 기록(숫자가 아닌 ID, size 이상의 서수)은 비트맵에 없더라도 지우지 않습니다.
+    """
+    model = _PROGRESS_MODELS[mode]
+    keep = {item["hanja_id"] for item in items}
+    stale = []
+    for row in db.execute(
+        select(model.hanja_id, model.chapter, model.is_known).where(model.user_id == user_id).with_for_update()
+    ):
+        ordinal = hanja_ordinal(row.hanja_id)
+        if ordinal is not None and ordinal < size and row.hanja_id not in keep:
+            stale.append(row)
+    if stale:
+        db.execute(delete(model).where(model.user_id == user_id, model.hanja_id.in_([row.hanja_id for row in stale])))
+        db.execute(insert(ProgressTombstoneModel), [
+            {"user_id": user_id, "mode": mode, "hanja_id": row.hanja_id, "chapter": row.chapter} for row in stale
+        ])
+        _apply_progress_counters(db, mode, [(user_id, row.chapter, row.is_known) for row in stale], [])
+    if items:
+        _upsert_progress(db, model, items)
+    else:
+        db.commit()
+
+
+# 전체 연습 세션에 사용할 학습한 한자 수
+PRACTICE_SAMPLE_SIZE = 20
+
+
+def get_study_session(
+    db: Session,
+    user_id: str,
+    mode: str,
+    chapter: Optional[int] = None,
+    review: bool = False,
+    seed: Optional[int] = None
+) -> dict:
+    """
+    학습/연습 세션의 카드 목록을 만듭니다.
+    - 학습(단원): 단원 전체를 카탈로그 순서로, review면 모름으로 표시한 한자만
+    - 연습(단원): 단원 전체를 섞어서, review면 연습에서 틀린(모름) 한자만
+    - 연습(전체): 학습하거나 연습한 한자 중 무작위 PRACTICE_SAMPLE_SIZE개, review면 연습에서 틀린 한자 전체
+    진행 상태는 user_id 인덱스 범위로 조회하고, 카탈로그 스냅샷과는 집합으로 거릅니다.
+    """
+    model = _PROGRESS_MODELS[mode]
+    snapshot = get_catalog(db)
+    stmt = select(model.hanja_id, model.is_known).where(model.user_id == user_id)
+    if chapter is not None:
+        stmt = stmt.where(model.chapter == chapter)
+    known, unknown = set(), set()
+    for hanja_id, is_known in db.execute(stmt):
+        (known if is_known else unknown).add(hanja_id)
+
+    candidates = snapshot.by_chapter.get(chapter, []) if chapter is not None else snapshot.hanja
+    if review:
+        cards = [h for h in candidates if h.id in unknown]
+    elif mode == "practice" and chapter is None:
+        studied = known | unknown
+        studied.update(db.execute(
+            select(StudyProgressModel.hanja_id).where(StudyProgressModel.user_id == user_id)
+        ).scalars())
+        cards = [h for h in candidates if h.id in studied]
+    else:
+        cards = list(candidates)
+
+    if seed is None:
+        seed = random.randrange(2 ** 31)
+    if mode == "practice":
+        rng = random.Random(seed)
+        if chapter is None and not review:
+            cards = rng.sample(cards, min(PRACTICE_SAMPLE_SIZE, len(cards)))
+        else:
+            rng.shuffle(cards)
+    return {
+        "user_id": user_id,
+        "mode": mode,
+        "chapter": chapter,
+        "review": review,
+        "seed": seed,
+        "cards": cards,
+        "known_ids": sorted(known),
+        "unknown_ids": sorted(unknown),
+    }
+
+
 # 학습 진행 상태 CRUD 함수들
 def get_study_progress(db: Session, user_id: str, hanja_id: str) -> Optional[StudyProgressResponse]:
     """특정 사용자의 특정 한자 학습 상태를 가져옵니다."""
@@ -205,35 +799,14 @@ def get_all_study_progress(db: Session, user_id: str) -> List[StudyProgressRespo
 
 def upsert_study_progress(db: Session, progress_data: dict) -> StudyProgressResponse:
     """학습 진행 상태를 저장하거나 업데이트합니다 (upsert)."""
-    stmt = select(StudyProgressModel).where(
-        StudyProgressModel.user_id == progress_data["user_id"],
-        StudyProgressModel.hanja_id == progress_data["hanja_id"]
-    )
-    progress_model = db.execute(stmt).scalar_one_or_none()
-    
-    if progress_model:
-        # 기존 레코드 업데이트
-        progress_model.is_known = progress_data["is_known"]
-        progress_model.chapter = progress_data["chapter"]
-    else:
-        # 새 레코드 생성
-        progress_model = StudyProgressModel(
-            user_id=progress_data["user_id"],
-            hanja_id=progress_data["hanja_id"],
-            chapter=progress_data["chapter"],
-            is_known=progress_data["is_known"]
-        )
-        db.add(progress_model)
-    
-    db.commit()
-    db.refresh(progress_model)
-    
-    return StudyProgressResponse(
-        user_id=progress_model.user_id,
-        hanja_id=progress_model.hanja_id,
-        chapter=progress_model.chapter,
-        is_known=progress_model.is_known
-    )
+    saved = _upsert_progress(db, StudyProgressModel, [progress_data])
+    return StudyProgressResponse(**saved[0])
+
+
+def upsert_study_progress_batch(db: Session, items: List[dict]) -> List[StudyProgressResponse]:
+    """학습 진행 상태 여러 건을 한 번에 저장하거나 업데이트합니다."""
+    saved = _upsert_progress(db, StudyProgressModel, items)
+    return [StudyProgressResponse(**item) for item in saved]
 
 
 def delete_study_progress(db: Session, user_id: str, hanja_id: str) -> bool:
@@ -248,6 +821,8 @@ def delete_study_progress(db: Session, user_id: str, hanja_id: str) -> bool:
         return False
     
     db.delete(progress_model)
+    _apply_progress_counters(db, "study", [(user_id, progress_model.chapter, progress_model.is_known)], [])
+    _add_tombstone(db, "study", progress_model)
     db.commit()
     return True
 
@@ -309,35 +884,14 @@ def get_all_practice_progress(db: Session, user_id: str) -> List[PracticeProgres
 
 def upsert_practice_progress(db: Session, progress_data: dict) -> PracticeProgressResponse:
     """연습 진행 상태를 저장하거나 업데이트합니다 (upsert)."""
-    stmt = select(PracticeProgressModel).where(
-        PracticeProgressModel.user_id == progress_data["user_id"],
-        PracticeProgressModel.hanja_id == progress_data["hanja_id"]
-    )
-    progress_model = db.execute(stmt).scalar_one_or_none()
-    
-    if progress_model:
-        # 기존 레코드 업데이트
-        progress_model.is_known = progress_data["is_known"]
-        progress_model.chapter = progress_data["chapter"]
-    else:
-        # 새 레코드 생성
-        progress_model = PracticeProgressModel(
-            user_id=progress_data["user_id"],
-            hanja_id=progress_data["hanja_id"],
-            chapter=progress_data["chapter"],
-            is_known=progress_data["is_known"]
-        )
-        db.add(progress_model)
-    
-    db.commit()
-    db.refresh(progress_model)
-    
-    return PracticeProgressResponse(
-        user_id=progress_model.user_id,
-        hanja_id=progress_model.hanja_id,
-        chapter=progress_model.chapter,
-        is_known=progress_model.is_known
-    )
+    saved = _upsert_progress(db, PracticeProgressModel, [progress_data])
+    return PracticeProgressResponse(**saved[0])
+
+
+def upsert_practice_progress_batch(db: Session, items: List[dict]) -> List[PracticeProgressResponse]:
+    """연습 진행 상태 여러 건을 한 번에 저장하거나 업데이트합니다."""
+    saved = _upsert_progress(db, PracticeProgressModel, items)
+    return [PracticeProgressResponse(**item) for item in saved]
 
 
 def delete_practice_progress(db: Session, user_id: str, hanja_id: str) -> bool:
@@ -352,5 +906,87 @@ def delete_practice_progress(db: Session, user_id: str, hanja_id: str) -> bool:
         return False
     
     db.delete(progress_model)
+    _apply_progress_counters(db, "practice", [(user_id, progress_model.chapter, progress_model.is_known)], [])
+    _add_tombstone(db, "practice", progress_model)
     db.commit()
     return True
+
+
+# 간격 반복 복습 CRUD 함수들
+def _review_to_schema(review_model: ReviewStateModel) -> ReviewStateResponse:
+    return ReviewStateResponse(
+        user_id=review_model.user_id,
+        hanja_id=review_model.hanja_id,
+        chapter=review_model.chapter,
+        ease=review_model.ease,
+        interval_days=review_model.interval_days,
+        repetitions=review_model.repetitions,
+        lapses=review_model.lapses,
+        due_at=review_model.due_at
+    )
+
+
+def record_review(db: Session, review_data: dict) -> ReviewStateResponse:
+    """
+    복습 결과를 반영해 다음 복습 시각을 계산하고 저장합니다.
+    첫 복습이면 초기 상태 행을 INSERT ... ON CONFLICT DO NOTHING으로 먼저 만들어 두므로,
+    같은 카드의 첫 복습이 동시에 들어와도 둘 다 같은 행을 잠그고 차례로 갱신합니다.
+    """
+    dialect_insert = _dialect_insert(db)
+    if dialect_insert is not None:
+        initial = scheduler.ReviewState()
+        db.execute(
+            dialect_insert(ReviewStateModel).values(
+                user_id=review_data["user_id"],
+                hanja_id=review_data["hanja_id"],
+                chapter=review_data["chapter"],
+                ease=initial.ease,
+                interval_days=initial.interval_days,
+                repetitions=initial.repetitions,
+                lapses=initial.lapses,
+                due_at=scheduler.utcnow()
+            ).on_conflict_do_nothing(index_elements=[ReviewStateModel.user_id, ReviewStateModel.hanja_id])
+        )
+
+    stmt = select(ReviewStateModel).where(
+        ReviewStateModel.user_id == review_data["user_id"],
+        ReviewStateModel.hanja_id == review_data["hanja_id"]
+    ).with_for_update()
+    review_model = db.execute(stmt).scalar_one_or_none()
+
+    if review_model:
+        state = scheduler.ReviewState(
+            ease=review_model.ease,
+            interval_days=review_model.interval_days,
+            repetitions=review_model.repetitions,
+            lapses=review_model.lapses
+        )
+    else:
+        state = scheduler.ReviewState()
+        review_model = ReviewStateModel(user_id=review_data["user_id"], hanja_id=review_data["hanja_id"])
+        db.add(review_model)
+
+    now = scheduler.utcnow()
+    state = scheduler.next_state(state, review_data["grade"])
+    review_model.chapter = review_data["chapter"]
+    review_model.ease = state.ease
+    review_model.interval_days = state.interval_days
+    review_model.repetitions = state.repetitions
+    review_model.lapses = state.lapses
+    review_model.due_at = scheduler.due_at(state, now)
+    review_model.last_reviewed_at = now
+
+    response = _review_to_schema(review_model)
+    db.commit()
+    return response
+
+
+def get_review_queue(db: Session, user_id: str, limit: int = 20) -> List[ReviewStateResponse]:
+    """복습 시각이 지난 카드를 오래된 순으로 가져옵니다 ((user_id, due_at) 인덱스 범위 스캔)."""
+    stmt = (
+        select(ReviewStateModel)
+        .where(ReviewStateModel.user_id == user_id, ReviewStateModel.due_at <= scheduler.utcnow())
+        .order_by(ReviewStateModel.due_at)
+        .limit(limit)
+    )
+    return [_review_to_schema(r) for r in db.execute(stmt).scalars().all()]
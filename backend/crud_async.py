@@ -0,0 +1,153 @@
+"""
+비동기 CRUD 함수
+crud.py의 동기 함수를 그대로 재사용합니다.
+- AsyncSession: run_sync로 비동기 커넥션 위에서 실행 (이벤트 루프를 막지 않음)
+- Session (동기 폴백): 스레드풀에서 실행
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+import crud
+from catalog_cache import CatalogSnapshot
+from database import DbSession
+from schemas import Hanja, StudyProgressResponse, PracticeProgressResponse, ReviewStateResponse
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple
+
+
+async def run_db(db: DbSession, fn: Callable[..., Any], *args: Any) -> Any:
+    """세션 종류에 맞게 동기 CRUD 함수를 이벤트 루프를 막지 않고 실행합니다."""
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args)
+    return await run_in_threadpool(fn, db, *args)
+
+
+async def get_catalog(db: DbSession) -> CatalogSnapshot:
+    return await run_db(db, crud.get_catalog)
+
+
+async def get_all_hanja(db: DbSession) -> List[Hanja]:
+    return await run_db(db, crud.get_all_hanja)
+
+
+async def get_all_chapters(db: DbSession) -> List[int]:
+    return await run_db(db, crud.get_all_chapters)
+
+
+async def get_hanja_by_id(db: DbSession, hanja_id: str) -> Optional[Hanja]:
+    return await run_db(db, crud.get_hanja_by_id, hanja_id)
+
+
+async def get_hanja_by_chapter(db: DbSession, chapter: int) -> List[Hanja]:
+    return await run_db(db, crud.get_hanja_by_chapter, chapter)
+
+
+async def search_hanja(db: DbSession, query: str, limit: int = 20) -> List[Hanja]:
+    return await run_db(db, crud.search_hanja, query, limit)
+
+
+async def get_hanja_page(
+    db: DbSession,
+    after: Optional[Tuple[int, str]] = None,
+    limit: Optional[int] = None,
+    fields: Optional[List[str]] = None
+) -> Tuple[List[dict], Optional[Tuple[int, str]]]:
+    return await run_db(db, crud.get_hanja_page, after, limit, fields)
+
+
+async def create_hanja(db: DbSession, hanja_data: dict) -> Hanja:
+    return await run_db(db, crud.create_hanja, hanja_data)
+
+
+async def update_hanja(db: DbSession, hanja_id: str, hanja_data: dict) -> Optional[Hanja]:
+    return await run_db(db, crud.update_hanja, hanja_id, hanja_data)
+
+
+async def delete_hanja(db: DbSession, hanja_id: str) -> bool:
+    return await run_db(db, crud.delete_hanja, hanja_id)
+
+
+# 학습 진행 상태
+async def get_study_progress(db: DbSession, user_id: str, hanja_id: str) -> Optional[StudyProgressResponse]:
+    return await run_db(db, crud.get_study_progress, user_id, hanja_id)
+
+
+async def get_study_progress_by_chapter(db: DbSession, user_id: str, chapter: int) -> List[StudyProgressResponse]:
+    return await run_db(db, crud.get_study_progress_by_chapter, user_id, chapter)
+
+
+async def get_all_study_progress(db: DbSession, user_id: str) -> List[StudyProgressResponse]:
+    return await run_db(db, crud.get_all_study_progress, user_id)
+
+
+async def upsert_study_progress(db: DbSession, progress_data: dict) -> StudyProgressResponse:
+    return await run_db(db, crud.upsert_study_progress, progress_data)
+
+
+async def upsert_study_progress_batch(db: DbSession, items: List[dict]) -> List[StudyProgressResponse]:
+    return await run_db(db, crud.upsert_study_progress_batch, items)
+
+
+async def delete_study_progress(db: DbSession, user_id: str, hanja_id: str) -> bool:
+    return await run_db(db, crud.delete_study_progress, user_id, hanja_id)
+
+
+# 연습 진행 상태
+async def get_practice_progress(db: DbSession, user_id: str, hanja_id: str) -> Optional[PracticeProgressResponse]:
+    return await run_db(db, crud.get_practice_progress, user_id, hanja_id)
+
+
+async def get_practice_progress_by_chapter(db: DbSession, user_id: str, chapter: int) -> List[PracticeProgressResponse]:
+    return await run_db(db, crud.get_practice_progress_by_chapter, user_id, chapter)
+
+
+async def get_all_practice_progress(db: DbSession, user_id: str) -> List[PracticeProgressResponse]:
+    return await run_db(db, crud.get_all_practice_progress, user_id)
+
+
+async def upsert_practice_progress(db: DbSession, progress_data: dict) -> PracticeProgressResponse:
+    return await run_db(db, crud.upsert_practice_progress, progress_data)
+
+
+async def upsert_practice_progress_batch(db: DbSession, items: List[dict]) -> List[PracticeProgressResponse]:
+    return await run_db(db, crud.upsert_practice_progress_batch, items)
+
+
+async def delete_practice_progress(db: DbSession, user_id: str, hanja_id: str) -> bool:
+    return await run_db(db, crud.delete_practice_progress, user_id, hanja_id)
+
+
+# 단원별 통계
+async def get_progress_stats(db: DbSession, user_id: str) -> dict:
+    return await run_db(db, crud.get_progress_stats, user_id)
+
+
+async def get_progress_bitmap(db: DbSession, mode: str, user_id: str) -> dict:
+    return await run_db(db, crud.get_progress_bitmap, mode, user_id)
+
+
+async def replace_progress(db: DbSession, mode: str, user_id: str, items: List[dict], size: int) -> None:
+    return await run_db(db, crud.replace_progress, mode, user_id, items, size)
+
+
+async def get_study_session(
+    db: DbSession,
+    user_id: str,
+    mode: str,
+    chapter: Optional[int] = None,
+    review: bool = False,
+    seed: Optional[int] = None
+) -> dict:
+    return await run_db(db, crud.get_study_session, user_id, mode, chapter, review, seed)
+
+
+async def get_progress_changes(db: DbSession, user_id: str, since: Optional[datetime] = None) -> dict:
+    return await run_db(db, crud.get_progress_changes, user_id, since)
+
+
+# 간격 반복 복습
+async def record_review(db: DbSession, review_data: dict) -> ReviewStateResponse:
+    return await run_db(db, crud.record_review, review_data)
+
+
+async def get_review_queue(db: DbSession, user_id: str, limit: int = 20) -> List[ReviewStateResponse]:
+    return await run_db(db, crud.get_review_queue, user_id, limit)
@@ -1,16 +1,127 @@
 from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker, Session
+from sqlalchemy.pool import NullPool
+from starlette.requests import Request
 from config import settings
+from metrics import TimedAsyncQueuePool, TimedQueuePool
+from typing import AsyncIterator, Dict, Iterator, Optional, Union
+from uuid import uuid4
+import threading
+import time
 
 # SQLAlchemy 2.0 스타일
 Base = declarative_base()
 
-# 엔진 생성 (pool_pre_ping으로 연결 안정성 향상)
-engine = create_engine(
-    settings.database_url,
-    pool_pre_ping=True,
-    echo=False  # SQL 쿼리 로깅 (개발 시 True로 변경 가능)
-)
+
+def is_sqlite_file(database_url) -> bool:
+    """파일 기반 SQLite URL인지 확인합니다 (메모리 DB는 연결마다 다른 DB라 제외)."""
+    url = make_url(database_url)
+    return (
+        url.get_backend_name() == "sqlite"
+        and url.database not in (None, "", ":memory:")
+        and url.query.get("mode") != "memory"
+    )
+
+
+def engine_options(database_url: str, is_async: bool = False, read_only: bool = False) -> dict:
+    """Settings의 연결 풀/타임아웃 설정을 create_engine 인자로 변환합니다."""
+    backend = make_url(database_url).get_backend_name()
+    options = {
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "echo": False,  # SQL 쿼리 로깅 (개발 시 True로 변경 가능)
+    }
+    if is_sqlite_file(database_url):
+        # SQLite는 한 번에 한 트랜잭션만 쓸 수 있으므로 쓰기 엔진은 연결 하나로 직렬화하고, 읽기는 풀 사용
+        options.update(
+            poolclass=TimedAsyncQueuePool if is_async else TimedQueuePool,
+            pool_size=settings.db_pool_size if read_only else 1,
+            max_overflow=settings.db_max_overflow if read_only else 0,
+            pool_timeout=settings.db_pool_timeout,
+        )
+        return options
+    if backend != "postgresql":
+        return options
+
+    connect_args = {}
+    if settings.db_transaction_pooler:
+        # 풀러가 서버 연결을 재사용하므로 앱 쪽에서는 연결을 들고 있지 않음
+        options["poolclass"] = NullPool
+        if is_async:
+            # 트랜잭션마다 서버 연결이 바뀌므로 prepared statement를 캐시하지 않고 이름이 겹치지 않게 함
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+            connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+    else:
+        options.update(
+            poolclass=TimedAsyncQueuePool if is_async else TimedQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+        # 풀러는 시작 파라미터(options)를 받지 않으므로 직접 연결할 때만 연결 시 설정
+        if settings.db_statement_timeout_ms:
+            if is_async:
+                connect_args["server_settings"] = {"statement_timeout": str(settings.db_statement_timeout_ms)}
+            else:
+                connect_args["options"] = f"-c statement_timeout={settings.db_statement_timeout_ms}"
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def install_statement_timeout(sync_engine) -> None:
+    """트랜잭션 풀러 모드: 트랜잭션마다 SET LOCAL로 실행 시간 제한을 겁니다 (비동기 엔진은 sync_engine 전달)."""
+    if not (settings.db_transaction_pooler and settings.db_statement_timeout_ms):
+        return
+    if sync_engine.dialect.name != "postgresql":
+        return
+
+    @event.listens_for(sync_engine, "begin")
+    def _set_timeout(conn):
+        conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(settings.db_statement_timeout_ms)}")
+
+
+def install_sqlite_pragmas(sync_engine, read_only: bool = False) -> None:
+    """
+    SQLite 파일 DB의 연결마다 WAL과 캐시/mmap 설정을 적용합니다 (비동기 엔진은 sync_engine 전달).
+    쓰기 엔진은 트랜잭션을 BEGIN IMMEDIATE로 시작해 처음부터 쓰기 잠금을 잡고
+    (읽다가 쓰기로 바꿀 때 다른 프로세스와 부딪혀 바로 SQLITE_BUSY가 나지 않도록), 읽기 엔진은 query_only로 엽니다.
+    """
+    if not is_sqlite_file(sync_engine.url):
+        return
+    pragmas = [
+        f"PRAGMA busy_timeout = {int(settings.sqlite_busy_timeout_ms)}",
+        "PRAGMA journal_mode = WAL",
+        f"PRAGMA synchronous = {settings.sqlite_synchronous}",
+        f"PRAGMA cache_size = -{int(settings.sqlite_cache_size_kb)}",
+        f"PRAGMA mmap_size = {int(settings.sqlite_mmap_size)}",
+        "PRAGMA temp_store = MEMORY",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only = ON")
+
+    @event.listens_for(sync_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        if not read_only:
+            # 드라이버가 알아서 BEGIN을 보내지 않도록 하고 begin 이벤트에서 직접 시작
+            dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+    if not read_only:
+        @event.listens_for(sync_engine, "begin")
+        def _begin_immediate(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
+install_statement_timeout(engine)
+install_sqlite_pragmas(engine)
 
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -19,6 +130,42 @@ SessionLocal = sessionmaker(
     class_=Session
 )
 
+# 읽기 전용 복제본 (READ_DATABASE_URL) 또는 SQLite 파일 DB의 읽기 전용 연결 풀
+# 둘 다 아니면 primary 세션을 그대로 사용
+read_database_url = settings.read_database_url or (
+    settings.database_url if is_sqlite_file(settings.database_url) else None
+)
+read_engine = None
+ReadSessionLocal = SessionLocal
+if read_database_url:
+    read_engine = create_engine(read_database_url, **engine_options(read_database_url, read_only=True))
+    install_statement_timeout(read_engine)
+    install_sqlite_pragmas(read_engine, read_only=True)
+    ReadSessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=read_engine,
+        class_=Session
+    )
+
+# 동기/비동기 세션 중 설정에 따라 사용되는 세션 타입
+DbSession = Union[Session, AsyncSession]
+
+
+def to_async_url(database_url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버 URL로 바꿉니다 (psycopg2 -> asyncpg, sqlite -> aiosqlite)."""
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "postgresql":
+        query = dict(url.query)
+        # asyncpg는 sslmode 대신 ssl 파라미터를 사용
+        if "sslmode" in query:
+            query["ssl"] = query.pop("sslmode")
+        url = url.set(drivername="postgresql+asyncpg", query=query)
+    elif backend == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+    return url.render_as_string(hide_password=False)
+
 
 def get_db() -> Session:
     """데이터베이스 세션 의존성"""
@@ -27,3 +174,126 @@ def get_db() -> Session:
         yield db
     finally:
         db.close()
+
+
+# 비동기 엔진은 설정에서 켠 경우에만 생성 (asyncpg/aiosqlite가 필요)
+async_engine = None
+AsyncSessionLocal = None
+if settings.use_async_db:
+    async_database_url = settings.async_database_url or to_async_url(settings.database_url)
+    async_engine = create_async_engine(async_database_url, **engine_options(async_database_url, is_async=True))
+    install_statement_timeout(async_engine.sync_engine)
+    install_sqlite_pragmas(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+        class_=AsyncSession
+    )
+
+
+async_read_engine = None
+AsyncReadSessionLocal = AsyncSessionLocal
+if settings.use_async_db and read_database_url:
+    async_read_database_url = settings.async_read_database_url or to_async_url(read_database_url)
+    async_read_engine = create_async_engine(
+        async_read_database_url, **engine_options(async_read_database_url, is_async=True, read_only=True)
+    )
+    install_statement_timeout(async_read_engine.sync_engine)
+    install_sqlite_pragmas(async_read_engine.sync_engine, read_only=True)
+    AsyncReadSessionLocal = async_sessionmaker(
+        bind=async_read_engine,
+        autoflush=False,
+        expire_on_commit=False,
+        class_=AsyncSession
+    )
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """비동기 데이터베이스 세션 의존성"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# 엔드포인트에서 사용하는 세션 의존성 (설정에 따라 동기/비동기 선택)
+get_session = get_async_db if settings.use_async_db else get_db
+
+
+# 카탈로그(한자 데이터) 쓰기 후 stickiness 키 (사용자 ID 대신 사용)
+CATALOG_STICKY_KEY = "__catalog__"
+
+
+class PrimaryStickiness:
+    """
+    쓰기 직후 복제 지연 동안 같은 키(사용자 ID 또는 카탈로그)의 읽기를 primary로 보내기 위한 기록
+    프로세스(워커)마다 따로 관리합니다.
+    """
+    # 기록이 이보다 많아지면 만료된 항목을 정리
+    PRUNE_THRESHOLD = 10000
+
+    def __init__(self, window_seconds: float) -> None:
+        self.window = window_seconds
+        self._lock = threading.Lock()
+        self._until: Dict[str, float] = {}
+
+    def mark(self, *keys: str) -> None:
+        """키별로 지금부터 window 동안 primary에서 읽도록 표시합니다."""
+        until = time.monotonic() + self.window
+        with self._lock:
+            for key in keys:
+                self._until[key] = until
+            if len(self._until) > self.PRUNE_THRESHOLD:
+                now = time.monotonic()
+                self._until = {key: t for key, t in self._until.items() if t > now}
+
+    def is_sticky(self, key: str) -> bool:
+        until = self._until.get(key)
+        return until is not None and until > time.monotonic()
+
+
+stickiness = PrimaryStickiness(settings.replica_sticky_seconds)
+
+
+def _use_primary(request: Request) -> bool:
+    # 카탈로그를 쓴 직후에는 사용자 경로의 요청도 카탈로그 스냅샷을 다시 로드할 수 있으므로 모두 primary
+    if stickiness.is_sticky(CATALOG_STICKY_KEY):
+        return True
+    user_id = request.path_params.get("user_id")
+    return user_id is not None and stickiness.is_sticky(user_id)
+
+
+def catalog_session() -> Session:
+    """요청 밖에서 카탈로그를 로드할 세션 (카탈로그를 쓴 직후면 primary, 아니면 복제본)"""
+    return SessionLocal() if stickiness.is_sticky(CATALOG_STICKY_KEY) else ReadSessionLocal()
+
+
+def get_read_db(request: Request) -> Iterator[Session]:
+    """읽기 전용 세션 의존성 (최근에 쓴 사용자/카탈로그는 primary, 그 외에는 복제본)"""
+    db = SessionLocal() if _use_primary(request) else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request) -> AsyncIterator[AsyncSession]:
+    """비동기 읽기 전용 세션 의존성"""
+    factory = AsyncSessionLocal if _use_primary(request) else AsyncReadSessionLocal
+    async with factory() as db:
+        yield db
+
+
+# GET 엔드포인트용 세션 의존성 (복제본이 없으면 get_session과 같음)
+if read_engine is None:
+    get_read_session = get_session
+else:
+    get_read_session = get_async_read_db if settings.use_async_db else get_read_db
+
+
+def mark_written(*keys: Optional[str]) -> None:
+    """
+    쓰기가 끝난 사용자 ID(또는 CATALOG_STICKY_KEY)를 stickiness 기간 동안 primary로 읽게 합니다.
+    SQLite 읽기 풀은 같은 파일이라 커밋 즉시 보이므로 복제본이 있을 때만 기록합니다.
+    """
+    if settings.read_database_url:
+        stickiness.mark(*(key for key in keys if key is not None))
@@ -0,0 +1,108 @@
+"""
+한자 ID 발급기
+기존 문자열 ID 형식("1", "2", ...)을 유지하면서 O(1)로 원자적으로 ID를 발급합니다.
+- PostgreSQL: hanja_id_seq 시퀀스 (nextval)
+- SQLite 등: id_sequences 카운터 테이블 (UPDATE ... RETURNING, 쓰기 잠금으로 원자성 보장)
+"""
+from sqlalchemy import Integer, case, cast, func, select, text, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from models import HanjaModel, IdSequenceModel, hanja_id_seq
+from typing import List, Union
+
+HANJA_SEQUENCE_NAME = "hanja"
+
+Bind = Union[Session, Connection]
+
+
+def _dialect_name(db: Bind) -> str:
+    if isinstance(db, Connection):
+        return db.dialect.name
+    return db.get_bind().dialect.name
+
+
+def _max_numeric_hanja_id(db: Bind) -> int:
+    """숫자로만 된 기존 한자 ID 중 최댓값 (없으면 0). 시퀀스 초기화/동기화에만 사용합니다."""
+    dialect = _dialect_name(db)
+    if dialect == "postgresql":
+        numeric = HanjaModel.id.regexp_match("^[0-9]+$")
+    elif dialect == "sqlite":
+        numeric = HanjaModel.id.op("NOT GLOB")("*[^0-9]*")
+    else:
+        ids = db.execute(select(HanjaModel.id)).scalars().all()
+        return max((int(i) for i in ids if str(i).isdigit()), default=0)
+    stmt = select(func.max(cast(HanjaModel.id, Integer))).where(numeric, HanjaModel.id != "")
+    return db.execute(stmt).scalar() or 0
+
+
+def _reserve_from_table(db: Bind, count: int) -> List[int]:
+    stmt = (
+        update(IdSequenceModel)
+        .where(IdSequenceModel.name == HANJA_SEQUENCE_NAME)
+        .values(next_value=IdSequenceModel.next_value + count)
+        .returning(IdSequenceModel.next_value)
+    )
+    end = db.execute(stmt).scalar_one_or_none()
+    if end is None:
+        _seed_table(db)
+        end = db.execute(stmt).scalar_one()
+    return list(range(end - count, end))
+
+
+def _seed_table(db: Bind) -> None:
+    """카운터 행이 없으면 기존 최대 ID 다음 값으로 만듭니다."""
+    start = _max_numeric_hanja_id(db) + 1
+    savepoint = db.begin_nested()
+    try:
+        db.execute(IdSequenceModel.__table__.insert().values(name=HANJA_SEQUENCE_NAME, next_value=start))
+        savepoint.commit()
+    except IntegrityError:
+        # 동시에 다른 요청이 먼저 만든 경우
+        savepoint.rollback()
+
+
+def reserve_hanja_ids(db: Bind, count: int) -> List[str]:
+    """
+    한자 ID를 count개 예약합니다 (대량 가져오기용).
+    PostgreSQL에서는 동시 발급이 섞이면 연속되지 않을 수 있지만 중복되지 않습니다.
+    """
+    if count <= 0:
+        return []
+    if _dialect_name(db) == "postgresql":
+        stmt = select(hanja_id_seq.next_value()).select_from(func.generate_series(1, count))
+        ids = db.execute(stmt).scalars().all()
+    else:
+        ids = _reserve_from_table(db, count)
+    return [str(i) for i in ids]
+
+
+def allocate_hanja_id(db: Bind) -> str:
+    """새 한자 ID 하나를 발급합니다."""
+    return reserve_hanja_ids(db, 1)[0]
+
+
+def sync_hanja_id_sequence(db: Bind) -> None:
+    """
+    ID를 직접 지정해 넣은 뒤(init_db, 가져오기 등) 발급기가 기존 ID와 겹치지 않도록
+    시퀀스를 기존 최대 ID 이후로 맞춥니다. 이미 더 앞서 있으면 그대로 둡니다.
+    """
+    max_id = _max_numeric_hanja_id(db)
+    if _dialect_name(db) == "postgresql":
+        sequence_name = f"{hanja_id_seq.schema}.{hanja_id_seq.name}" if hanja_id_seq.schema else hanja_id_seq.name
+        last_value, is_called = db.execute(text(f"SELECT last_value, is_called FROM {sequence_name}")).one()
+        next_value = last_value + 1 if is_called else last_value
+        if next_value <= max_id:
+            db.execute(select(func.setval(sequence_name, max_id, True)))
+        return
+
+    stmt = (
+        update(IdSequenceModel)
+        .where(IdSequenceModel.name == HANJA_SEQUENCE_NAME)
+        .values(next_value=case(
+            (IdSequenceModel.next_value <= max_id, max_id + 1),
+            else_=IdSequenceModel.next_value,
+        ))
+    )
+    if db.execute(stmt).rowcount == 0:
+        _seed_table(db)
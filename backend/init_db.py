@@ -8,6 +8,8 @@ from sqlalchemy import text, inspect
 from database import SessionLocal, engine, Base
 from models import HanjaModel
 from config import settings
+from migrations import run_migrations
+from id_allocator import sync_hanja_id_sequence
 
 # 샘플 데이터 (sampleHanja.ts에서 가져온 데이터)
 SAMPLE_DATA = [
@@ -175,8 +177,8 @@ def init_db():
     db = SessionLocal()
     try:
         # 스키마가 없으면 생성 (DDL 작업이므로 text 사용)
-        schema_name = settings.database_schema
-        if schema_name != "public":
+        schema_name = settings.table_schema
+        if schema_name not in (None, "public"):
             try:
                 # 스키마 존재 여부 확인
                 inspector = inspect(engine)
@@ -200,8 +202,8 @@ def init_db():
                 print(f"💡 public 스키마를 사용하거나 Supabase SQL Editor에서 스키마를 생성하세요.")
                 raise
         
-        # ORM을 사용하여 테이블 생성
-        Base.metadata.create_all(bind=engine)
+        # ORM을 사용하여 테이블 생성 및 마이그레이션 적용
+        run_migrations(engine)
         print("테이블을 생성/확인했습니다.")
         
         # ORM을 사용하여 기존 데이터 확인
@@ -230,6 +232,9 @@ def init_db():
         
         # bulk insert (ORM 방식)
         db.add_all(hanja_models)
+        db.flush()
+        # ID를 직접 지정했으므로 ID 발급기를 최대 ID 이후로 맞춤
+        sync_hanja_id_sequence(db)
         db.commit()
         print(f"성공적으로 {len(SAMPLE_DATA)}개의 한자 데이터를 삽입했습니다.")
     except Exception as e:
@@ -1,32 +1,127 @@
-from fastapi import FastAPI, Depends, Request, HTTPException
+from fastapi import FastAPI, Depends, Request, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, Response
-from sqlalchemy.orm import Session
-from database import get_db, engine, Base
-from crud import (
-    get_all_hanja, get_hanja_by_id, get_hanja_by_chapter, get_all_chapters,
-    create_hanja, update_hanja, delete_hanja,
+from fastapi.responses import Response, PlainTextResponse, JSONResponse
+from database import (
+    get_session, get_read_session, engine, async_engine, read_engine, async_read_engine, DbSession,
+    catalog_session, mark_written, CATALOG_STICKY_KEY,
+)
+from migrations import run_migrations
+from catalog_cache import catalog_cache
+from catalog_sync import catalog_sync
+from search_index import search_index
+from progress_bitmap import decode_bitmap
+from config import settings
+from quiz import generate_quiz
+from metrics import (
+    MetricsMiddleware, registry as metrics_registry, install_sql_hooks,
+    catalog_cache_collector, catalog_sync_collector, progress_buffer_collector, pool_collector,
+)
+from write_behind import ProgressBuffer
+from static_files import PrecompressedStaticFiles, SpaIndex
+from crud import HANJA_FIELD_COLUMNS, get_catalog as load_catalog
+from crud_async import (
+    get_catalog, get_hanja_page, search_hanja, create_hanja, update_hanja, delete_hanja,
     get_study_progress, get_study_progress_by_chapter, get_all_study_progress,
-    upsert_study_progress, delete_study_progress,
+    upsert_study_progress_batch, delete_study_progress,
     get_practice_progress, get_practice_progress_by_chapter, get_all_practice_progress,
-    upsert_practice_progress, delete_practice_progress
+    upsert_practice_progress_batch, delete_practice_progress,
+    get_progress_stats, get_progress_changes, get_progress_bitmap, replace_progress,
+    get_study_session, record_review, get_review_queue
 )
 from schemas import (
     HanjaListResponse, Hanja, HanjaCreate, HanjaUpdate,
     StudyProgress, StudyProgressCreate, StudyProgressResponse, StudyProgressListResponse,
-    PracticeProgress, PracticeProgressCreate, PracticeProgressResponse, PracticeProgressListResponse
+    PracticeProgress, PracticeProgressCreate, PracticeProgressResponse, PracticeProgressListResponse,
+    ProgressStatsResponse, QuizRequest, QuizResponse, ReviewCreate, ReviewStateResponse, ReviewQueueResponse,
+    SyncResponse, StudySessionResponse, ProgressBitmap, ProgressBitmapUpdate
 )
-from typing import List, Optional
+from contextlib import asynccontextmanager
+from datetime import datetime
+from sqlalchemy import text
+from starlette.concurrency import run_in_threadpool
+from typing import Callable, List, Literal, Optional
+import asyncio
+import logging
 import os
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
+
+# 배치 저장 요청 한 번에 허용하는 최대 항목 수
+MAX_PROGRESS_BATCH_SIZE = 1000
+
+# 진행 상태 write-behind 버퍼 (PROGRESS_WRITE_BEHIND=true일 때만 사용)
+# 버퍼는 프로세스마다 따로 있어 다른 워커의 조회에는 저장 전 값이 보이지 않으므로 워커가 여러 개면 시작하지 않음
+if settings.progress_write_behind and settings.web_concurrency > 1:
+    raise RuntimeError("PROGRESS_WRITE_BEHIND는 워커가 하나일 때만 사용할 수 있습니다 (WEB_CONCURRENCY=1).")
+progress_buffer: Optional[ProgressBuffer] = (
+    ProgressBuffer(settings.write_behind_interval_ms, settings.write_behind_max_entries)
+    if settings.progress_write_behind else None
+)
+
+
+# 시작 상태 (/readyz)
+startup_state = {"catalog_loaded": False, "error": None}
+# 카탈로그 예열 재시도 간격 상한 (초)
+WARM_UP_MAX_DELAY = 30.0
+
+
+def _load_catalog() -> None:
+    """카탈로그 캐시와 검색 인덱스를 미리 로드합니다."""
+    db = catalog_session()
+    try:
+        snapshot = load_catalog(db)
+    finally:
+        db.close()
+    if settings.search_backend == "memory" and search_index.version != snapshot.version:
+        search_index.rebuild(snapshot.version, snapshot.hanja)
+
+
+async def _warm_up() -> None:
+    """요청을 받으면서 백그라운드에서 카탈로그를 로드합니다 (DB에 연결할 수 없으면 재시도)."""
+    delay = 0.5
+    while True:
+        try:
+            await run_in_threadpool(_load_catalog)
+        except Exception as e:
+            startup_state["error"] = str(e)
+            logger.exception("카탈로그 예열 실패, %.1f초 후 다시 시도합니다.", delay)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, WARM_UP_MAX_DELAY)
+            continue
+        startup_state.update(catalog_loaded=True, error=None)
+        return
+
+
+def _ping_database() -> None:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 마이그레이션은 배포 시 python migrations.py로 따로 실행 (AUTO_MIGRATE=true면 시작 시 적용)
+    if settings.auto_migrate:
+        await run_in_threadpool(run_migrations, engine)
+    # 다른 워커의 카탈로그 수정 알림을 먼저 받기 시작한 뒤 예열
+    catalog_sync.start()
+    warm_up = asyncio.create_task(_warm_up())
+    if progress_buffer is not None:
+        progress_buffer.start()
+    try:
+        yield
+    finally:
+        warm_up.cancel()
+        await catalog_sync.stop()
+        # 종료 전에 버퍼에 남은 진행 상태를 모두 저장
+        if progress_buffer is not None:
+            await progress_buffer.stop()
+
 
 app = FastAPI(
     title="한자 5급 API",
     description="한자능력검정시험 5급 데이터를 제공하는 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정 (프론트엔드에서 접근 가능하도록)
@@ -38,43 +133,173 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 시간/SQL 실행 계측 (가장 바깥 미들웨어로 등록)
+app.add_middleware(MetricsMiddleware, metrics=metrics_registry)
+install_sql_hooks(engine)
+if async_engine is not None:
+    install_sql_hooks(async_engine.sync_engine)
+metrics_registry.add_collector(catalog_cache_collector(catalog_cache))
+metrics_registry.add_collector(catalog_sync_collector(catalog_sync))
+if read_engine is not None:
+    install_sql_hooks(read_engine)
+if async_read_engine is not None:
+    install_sql_hooks(async_read_engine.sync_engine)
+metrics_registry.add_collector(pool_collector({
+    name: e for name, e in (
+        ("sync", engine),
+        ("async", async_engine.sync_engine if async_engine is not None else None),
+        ("read", read_engine),
+        ("async_read", async_read_engine.sync_engine if async_read_engine is not None else None),
+    ) if e is not None
+}))
+if progress_buffer is not None:
+    metrics_registry.add_collector(progress_buffer_collector(progress_buffer))
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인합니다 (weak 비교)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _catalog_response(request: Request, etag: str, encode: Callable[[], bytes]) -> Response:
+    """
+    미리 인코딩된 카탈로그 JSON으로 응답합니다.
+    클라이언트의 ETag가 최신이면 본문 없이 304를 반환합니다.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=encode(), media_type="application/json", headers=headers)
+
+
 # API 엔드포인트 (정적 파일 서빙보다 먼저 정의)
 @app.get("/api/hanja", response_model=HanjaListResponse)
-async def get_hanja_list(db: Session = Depends(get_db)):
+async def get_hanja_list(
+    request: Request,
+    after: Optional[str] = Query(None, description="다음 페이지 커서 (<chapter>,<id>)"),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 필드 목록 (예: character,sound,meaning)"),
+    db: DbSession = Depends(get_read_session)
+):
     """
     모든 한자 데이터를 반환합니다.
     sampleHanja.ts의 JSON 구조와 동일한 형식으로 반환됩니다.
+    after/limit/fields를 지정하면 (chapter, id) 순 키셋 페이지와 선택한 필드만 반환하고,
+    다음 페이지가 있으면 응답의 next에 커서를 담습니다.
     """
-    hanja_list = get_all_hanja(db)
-    return {"hanja": hanja_list}
+    if after is None and limit is None and fields is None:
+        snapshot = catalog_cache.current() or await get_catalog(db)
+        return _catalog_response(request, snapshot.etag("all"), snapshot.list_json)
+
+    cursor = None
+    if after is not None:
+        chapter, _, hanja_id = after.partition(",")
+        if not chapter.lstrip("-").isdigit() or not hanja_id:
+            raise HTTPException(status_code=400, detail="after는 '<chapter>,<id>' 형식이어야 합니다.")
+        cursor = (int(chapter), hanja_id)
+
+    field_list = None
+    if fields is not None:
+        field_list = [f.strip() for f in fields.split(",") if f.strip()]
+        unknown = [f for f in field_list if f not in HANJA_FIELD_COLUMNS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"알 수 없는 필드입니다: {', '.join(unknown)}")
+
+    rows, next_cursor = await get_hanja_page(db, cursor, limit, field_list)
+    return JSONResponse({
+        "hanja": rows,
+        "next": f"{next_cursor[0]},{next_cursor[1]}" if next_cursor else None,
+    })
+
+
+@app.get("/api/hanja/search", response_model=HanjaListResponse)
+async def search_hanja_endpoint(
+    q: str = Query(..., min_length=1, max_length=50, description="한자, 음, 뜻, 예문 또는 초성 (예: ㅎㅈ)"),
+    limit: int = Query(20, ge=1, le=100),
+    db: DbSession = Depends(get_read_session)
+):
+    """한자/음/뜻/예문/초성으로 검색합니다 (/api/hanja/{hanja_id}보다 먼저 정의)."""
+    snapshot = catalog_cache.current()
+    if settings.search_backend == "memory" and snapshot is not None and search_index.version == snapshot.version:
+        # 인덱스가 최신이면 DB/스레드풀을 거치지 않고 바로 검색
+        return {"hanja": search_index.search(q, limit)}
+    return {"hanja": await search_hanja(db, q, limit)}
 
 
 @app.get("/api/hanja/{hanja_id}", response_model=Hanja)
-async def get_hanja(hanja_id: str, db: Session = Depends(get_db)):
+async def get_hanja(hanja_id: str, request: Request, db: DbSession = Depends(get_read_session)):
     """특정 ID의 한자 데이터를 반환합니다."""
-    hanja = get_hanja_by_id(db, hanja_id)
-    if not hanja:
-        from fastapi import HTTPException
+    snapshot = catalog_cache.current() or await get_catalog(db)
+    body = snapshot.hanja_json(hanja_id)
+    if body is None:
         raise HTTPException(status_code=404, detail="한자를 찾을 수 없습니다.")
-    return hanja
+    return _catalog_response(request, snapshot.etag(f"h{hanja_id}"), lambda: body)
 
 
 @app.get("/api/hanja/chapter/{chapter}", response_model=HanjaListResponse)
-async def get_hanja_by_chapter_endpoint(chapter: int, db: Session = Depends(get_db)):
+async def get_hanja_by_chapter_endpoint(chapter: int, request: Request, db: DbSession = Depends(get_read_session)):
     """특정 단원의 한자 데이터를 반환합니다."""
-    hanja_list = get_hanja_by_chapter(db, chapter)
-    return {"hanja": hanja_list}
+    snapshot = catalog_cache.current() or await get_catalog(db)
+    return _catalog_response(request, snapshot.etag(f"c{chapter}"), lambda: snapshot.chapter_json(chapter))
 
 
 @app.get("/api/chapters", response_model=List[int])
-async def get_chapter_list(db: Session = Depends(get_db)):
+async def get_chapter_list(request: Request, db: DbSession = Depends(get_read_session)):
     """현재 등록된 한자 기준으로 존재하는 단원 번호 목록을 반환합니다."""
-    chapters = get_all_chapters(db)
-    return chapters
+    snapshot = catalog_cache.current() or await get_catalog(db)
+    return _catalog_response(request, snapshot.etag("chapters"), snapshot.chapters_json)
+
+
+@app.get("/healthz")
+async def healthz():
+    """프로세스가 살아 있으면 200을 반환합니다 (DB 확인 없음)."""
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+async def readyz():
+    """카탈로그를 로드했고 DB에 연결할 수 있으면 200, 아니면 503을 반환합니다."""
+    if not startup_state["catalog_loaded"]:
+        return JSONResponse({"status": "starting", "error": startup_state["error"]}, status_code=503)
+    try:
+        await run_in_threadpool(_ping_database)
+    except Exception as e:
+        return JSONResponse({"status": "unavailable", "error": str(e)}, status_code=503)
+    return {"status": "ready", "catalog_version": catalog_cache.version}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus 텍스트 형식의 요청/DB 지표를 반환합니다."""
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """카탈로그 캐시의 버전과 적중/미스 통계, 워커 간 무효화 알림 수를 반환합니다."""
+    return {**catalog_cache.stats(), "sync": catalog_sync.stats()}
+
+
+async def _write_catalog(write: Callable, *args):
+    """
+    카탈로그 수정 (crud에서 커밋 직후 캐시를 무효화함)
+    무효화와 표시 사이에 들어온 요청이 복제본에서 다시 로드하지 않도록 쓰기 전후로 primary 읽기를 표시합니다.
+    """
+    mark_written(CATALOG_STICKY_KEY)
+    try:
+        return await write(*args)
+    finally:
+        mark_written(CATALOG_STICKY_KEY)
 
 
 @app.post("/api/hanja", response_model=Hanja, status_code=201)
-async def create_hanja_endpoint(hanja: HanjaCreate, db: Session = Depends(get_db)):
+async def create_hanja_endpoint(hanja: HanjaCreate, db: DbSession = Depends(get_session)):
     """새 한자 데이터를 생성합니다."""
     hanja_data = {
         "character": hanja.character,
@@ -85,7 +310,7 @@ async def create_hanja_endpoint(hanja: HanjaCreate, db: Session = Depends(get_db
         "chapter": hanja.chapter,
         "difficulty": hanja.difficulty,
     }
-    created = create_hanja(db, hanja_data)
+    created = await _write_catalog(create_hanja, db, hanja_data)
     return created
 
 
@@ -93,7 +318,7 @@ async def create_hanja_endpoint(hanja: HanjaCreate, db: Session = Depends(get_db
 async def update_hanja_endpoint(
     hanja_id: str, 
     hanja: HanjaUpdate, 
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_session)
 ):
     """한자 데이터를 수정합니다."""
     hanja_data = {}
@@ -112,48 +337,127 @@ async def update_hanja_endpoint(
     if hanja.difficulty is not None:
         hanja_data["difficulty"] = hanja.difficulty
     
-    updated = update_hanja(db, hanja_id, hanja_data)
+    updated = await _write_catalog(update_hanja, db, hanja_id, hanja_data)
     if not updated:
         raise HTTPException(status_code=404, detail="한자를 찾을 수 없습니다.")
     return updated
 
 
 @app.delete("/api/hanja/{hanja_id}", status_code=204)
-async def delete_hanja_endpoint(hanja_id: str, db: Session = Depends(get_db)):
+async def delete_hanja_endpoint(hanja_id: str, db: DbSession = Depends(get_session)):
     """한자 데이터를 삭제합니다."""
-    success = delete_hanja(db, hanja_id)
+    success = await _write_catalog(delete_hanja, db, hanja_id)
     if not success:
         raise HTTPException(status_code=404, detail="한자를 찾을 수 없습니다.")
     return None
 
 
+# 진행 상태 저장 (write-behind 모드면 버퍼에 넣고 바로 응답)
+async def _save_progress(mode: str, items: List[dict], db: DbSession) -> list:
+    mark_written(*{item["user_id"] for item in items})
+    if progress_buffer is not None:
+        progress_buffer.add(mode, items)
+        return items
+    if mode == "study":
+        return await upsert_study_progress_batch(db, items)
+    return await upsert_practice_progress_batch(db, items)
+
+
+# 조회 결과에 아직 저장되지 않은 버퍼 항목을 덮어씀 (방금 저장한 값이 보이도록)
+def _with_buffered(mode: str, user_id: str, progress_list: list, chapter: Optional[int] = None) -> list:
+    if progress_buffer is None:
+        return progress_list
+    buffered = progress_buffer.buffered(mode, user_id)
+    if not buffered:
+        return progress_list
+    merged = [p for p in progress_list if p.hanja_id not in buffered]
+    merged.extend(item for item in buffered.values() if chapter is None or item["chapter"] == chapter)
+    return merged
+
+
+# DB를 직접 읽거나 고치는 요청 전에 사용자의 버퍼 항목을 먼저 저장
+async def _flush_buffered(user_id: str) -> None:
+    # 이 사용자의 항목만 저장 (다른 사용자의 실패가 이 요청을 막지 않음)
+    if progress_buffer is not None and progress_buffer.has_user(user_id):
+        if await progress_buffer.flush(user_id):
+            raise HTTPException(status_code=503, detail="진행 상태를 저장하지 못했습니다. 잠시 후 다시 시도하세요.")
+
+
+# 진행 상태 비트맵 저장 (학습/연습 공통)
+async def _save_progress_bitmap(mode: str, user_id: str, bitmap: ProgressBitmapUpdate, db: DbSession) -> dict:
+    # db 세션이 연결을 잡기 전에 저장 (SQLite는 쓰기 연결이 하나뿐)
+    await _flush_buffered(user_id)
+    snapshot = catalog_cache.current() or await get_catalog(db)
+    if bitmap.catalog_version != snapshot.tag:
+        raise HTTPException(status_code=409, detail="카탈로그가 변경되었습니다. 비트맵을 다시 불러오세요.")
+    try:
+        known = decode_bitmap(bitmap.known, snapshot.bitmap_size)
+        unknown = decode_bitmap(bitmap.unknown, snapshot.bitmap_size)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if set(known) & set(unknown):
+        raise HTTPException(status_code=400, detail="같은 한자가 known과 unknown에 모두 있습니다.")
+
+    items = []
+    for ordinals, is_known in ((known, True), (unknown, False)):
+        for ordinal in ordinals:
+            hanja = snapshot.by_id.get(str(ordinal))
+            if hanja is None:
+                raise HTTPException(status_code=400, detail=f"카탈로그에 없는 한자 ID입니다: {ordinal}")
+            items.append({"user_id": user_id, "hanja_id": hanja.id, "chapter": hanja.chapter, "is_known": is_known})
+
+    await replace_progress(db, mode, user_id, items, snapshot.bitmap_size)
+    mark_written(user_id)
+    return await get_progress_bitmap(db, mode, user_id)
+
+
 # 학습 진행 상태 API 엔드포인트
 @app.get("/api/study-progress/{user_id}", response_model=StudyProgressListResponse)
-async def get_all_study_progress_endpoint(user_id: str, db: Session = Depends(get_db)):
+async def get_all_study_progress_endpoint(user_id: str, db: DbSession = Depends(get_read_session)):
     """특정 사용자의 모든 학습 진행 상태를 반환합니다."""
-    progress_list = get_all_study_progress(db, user_id)
-    return {"progress": progress_list}
+    progress_list = await get_all_study_progress(db, user_id)
+    return {"progress": _with_buffered("study", user_id, progress_list)}
+
+
+@app.get("/api/study-progress/{user_id}/bitmap", response_model=ProgressBitmap)
+async def get_study_progress_bitmap_endpoint(user_id: str, db: DbSession = Depends(get_read_session)):
+    """특정 사용자의 학습 진행 상태를 비트맵으로 반환합니다 (목록보다 훨씬 작음)."""
+    await _flush_buffered(user_id)
+    return await get_progress_bitmap(db, "study", user_id)
+
+
+@app.put("/api/study-progress/{user_id}/bitmap", response_model=ProgressBitmap)
+async def put_study_progress_bitmap_endpoint(
+    user_id: str,
+    bitmap: ProgressBitmapUpdate,
+    db: DbSession = Depends(get_session)
+):
+    """학습 진행 상태 전체를 비트맵으로 교체합니다 (catalog_version이 다르면 409)."""
+    return await _save_progress_bitmap("study", user_id, bitmap, db)
 
 
 @app.get("/api/study-progress/{user_id}/chapter/{chapter}", response_model=StudyProgressListResponse)
 async def get_study_progress_by_chapter_endpoint(
     user_id: str, 
     chapter: int, 
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_read_session)
 ):
     """특정 사용자의 특정 단원 학습 진행 상태를 반환합니다."""
-    progress_list = get_study_progress_by_chapter(db, user_id, chapter)
-    return {"progress": progress_list}
+    progress_list = await get_study_progress_by_chapter(db, user_id, chapter)
+    return {"progress": _with_buffered("study", user_id, progress_list, chapter)}
 
 
 @app.get("/api/study-progress/{user_id}/hanja/{hanja_id}", response_model=StudyProgressResponse)
 async def get_study_progress_endpoint(
     user_id: str, 
     hanja_id: str, 
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_read_session)
 ):
     """특정 사용자의 특정 한자 학습 진행 상태를 반환합니다."""
-    progress = get_study_progress(db, user_id, hanja_id)
+    buffered = progress_buffer.buffered("study", user_id) if progress_buffer is not None else {}
+    if hanja_id in buffered:
+        return buffered[hanja_id]
+    progress = await get_study_progress(db, user_id, hanja_id)
     if not progress:
         raise HTTPException(status_code=404, detail="학습 진행 상태를 찾을 수 없습니다.")
     return progress
@@ -162,7 +466,7 @@ async def get_study_progress_endpoint(
 @app.post("/api/study-progress", response_model=StudyProgressResponse, status_code=201)
 async def create_study_progress_endpoint(
     progress: StudyProgressCreate, 
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_session)
 ):
     """학습 진행 상태를 저장하거나 업데이트합니다."""
     progress_data = {
@@ -171,16 +475,28 @@ async def create_study_progress_endpoint(
         "chapter": progress.chapter,
         "is_known": progress.is_known
     }
-    created = upsert_study_progress(db, progress_data)
+    created = (await _save_progress("study", [progress_data], db))[0]
     return created
 
 
+@app.post("/api/study-progress/batch", response_model=StudyProgressListResponse)
+async def create_study_progress_batch_endpoint(
+    progress_list: List[StudyProgressCreate],
+    db: DbSession = Depends(get_session)
+):
+    """학습 진행 상태 여러 건을 하나의 트랜잭션으로 저장하거나 업데이트합니다."""
+    if len(progress_list) > MAX_PROGRESS_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_PROGRESS_BATCH_SIZE}개까지 저장할 수 있습니다.")
+    saved = await _save_progress("study", [p.model_dump() for p in progress_list], db)
+    return {"progress": saved}
+
+
 @app.put("/api/study-progress/{user_id}/hanja/{hanja_id}", response_model=StudyProgressResponse)
 async def update_study_progress_endpoint(
     user_id: str,
     hanja_id: str,
     progress: StudyProgressCreate,
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_session)
 ):
     """학습 진행 상태를 업데이트합니다."""
     if progress.user_id != user_id or progress.hanja_id != hanja_id:
@@ -192,7 +508,7 @@ async def update_study_progress_endpoint(
         "chapter": progress.chapter,
         "is_known": progress.is_known
     }
-    updated = upsert_study_progress(db, progress_data)
+    updated = (await _save_progress("study", [progress_data], db))[0]
     return updated
 
 
@@ -200,10 +516,12 @@ async def update_study_progress_endpoint(
 async def delete_study_progress_endpoint(
     user_id: str, 
     hanja_id: str, 
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_session)
 ):
     """학습 진행 상태를 삭제합니다."""
-    success = delete_study_progress(db, user_id, hanja_id)
+    await _flush_buffered(user_id)
+    success = await delete_study_progress(db, user_id, hanja_id)
+    mark_written(user_id)
     if not success:
         raise HTTPException(status_code=404, detail="학습 진행 상태를 찾을 수 없습니다.")
     return None
@@ -211,31 +529,51 @@ async def delete_study_progress_endpoint(
 
 # 연습 진행 상태 API 엔드포인트
 @app.get("/api/practice-progress/{user_id}", response_model=PracticeProgressListResponse)
-async def get_all_practice_progress_endpoint(user_id: str, db: Session = Depends(get_db)):
+async def get_all_practice_progress_endpoint(user_id: str, db: DbSession = Depends(get_read_session)):
     """특정 사용자의 모든 연습 진행 상태를 반환합니다."""
-    progress_list = get_all_practice_progress(db, user_id)
-    return {"progress": progress_list}
+    progress_list = await get_all_practice_progress(db, user_id)
+    return {"progress": _with_buffered("practice", user_id, progress_list)}
+
+
+@app.get("/api/practice-progress/{user_id}/bitmap", response_model=ProgressBitmap)
+async def get_practice_progress_bitmap_endpoint(user_id: str, db: DbSession = Depends(get_read_session)):
+    """특정 사용자의 연습 진행 상태를 비트맵으로 반환합니다."""
+    await _flush_buffered(user_id)
+    return await get_progress_bitmap(db, "practice", user_id)
+
+
+@app.put("/api/practice-progress/{user_id}/bitmap", response_model=ProgressBitmap)
+async def put_practice_progress_bitmap_endpoint(
+    user_id: str,
+    bitmap: ProgressBitmapUpdate,
+    db: DbSession = Depends(get_session)
+):
+    """연습 진행 상태 전체를 비트맵으로 교체합니다 (catalog_version이 다르면 409)."""
+    return await _save_progress_bitmap("practice", user_id, bitmap, db)
 
 
 @app.get("/api/practice-progress/{user_id}/chapter/{chapter}", response_model=PracticeProgressListResponse)
 async def get_practice_progress_by_chapter_endpoint(
     user_id: str, 
     chapter: int, 
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_read_session)
 ):
     """특정 사용자의 특정 단원 연습 진행 상태를 반환합니다."""
-    progress_list = get_practice_progress_by_chapter(db, user_id, chapter)
-    return {"progress": progress_list}
+    progress_list = await get_practice_progress_by_chapter(db, user_id, chapter)
+    return {"progress": _with_buffered("practice", user_id, progress_list, chapter)}
 
 
 @app.get("/api/practice-progress/{user_id}/hanja/{hanja_id}", response_model=PracticeProgressResponse)
 async def get_practice_progress_endpoint(
     user_id: str, 
     hanja_id: str, 
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_read_session)
 ):
     """특정 사용자의 특정 한자 연습 진행 상태를 반환합니다."""
-    progress = get_practice_progress(db, user_id, hanja_id)
+    buffered = progress_buffer.buffered("practice", user_id) if progress_buffer is not None else {}
+    if hanja_id in buffered:
+        return buffered[hanja_id]
+    progress = await get_practice_progress(db, user_id, hanja_id)
     if not progress:
         raise HTTPException(status_code=404, detail="연습 진행 상태를 찾을 수 없습니다.")
     return progress
@@ -244,7 +582,7 @@ async def get_practice_progress_endpoint(
 @app.post("/api/practice-progress", response_model=PracticeProgressResponse, status_code=201)
 async def create_practice_progress_endpoint(
     progress: PracticeProgressCreate, 
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_session)
 ):
     """연습 진행 상태를 저장하거나 업데이트합니다."""
     progress_data = {
@@ -253,16 +591,28 @@ async def create_practice_progress_endpoint(
         "chapter": progress.chapter,
         "is_known": progress.is_known
     }
-    created = upsert_practice_progress(db, progress_data)
+    created = (await _save_progress("practice", [progress_data], db))[0]
     return created
 
 
+@app.post("/api/practice-progress/batch", response_model=PracticeProgressListResponse)
+async def create_practice_progress_batch_endpoint(
+    progress_list: List[PracticeProgressCreate],
+    db: DbSession = Depends(get_session)
+):
+    """연습 진행 상태 여러 건을 하나의 트랜잭션으로 저장하거나 업데이트합니다."""
+    if len(progress_list) > MAX_PROGRESS_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {MAX_PROGRESS_BATCH_SIZE}개까지 저장할 수 있습니다.")
+    saved = await _save_progress("practice", [p.model_dump() for p in progress_list], db)
+    return {"progress": saved}
+
+
 @app.put("/api/practice-progress/{user_id}/hanja/{hanja_id}", response_model=PracticeProgressResponse)
 async def update_practice_progress_endpoint(
     user_id: str,
     hanja_id: str,
     progress: PracticeProgressCreate,
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_session)
 ):
     """연습 진행 상태를 업데이트합니다."""
     if progress.user_id != user_id or progress.hanja_id != hanja_id:
@@ -274,7 +624,7 @@ async def update_practice_progress_endpoint(
         "chapter": progress.chapter,
         "is_known": progress.is_known
     }
-    updated = upsert_practice_progress(db, progress_data)
+    updated = (await _save_progress("practice", [progress_data], db))[0]
     return updated
 
 
@@ -282,37 +632,110 @@ async def update_practice_progress_endpoint(
 async def delete_practice_progress_endpoint(
     user_id: str, 
     hanja_id: str, 
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_session)
 ):
     """연습 진행 상태를 삭제합니다."""
-    success = delete_practice_progress(db, user_id, hanja_id)
+    await _flush_buffered(user_id)
+    success = await delete_practice_progress(db, user_id, hanja_id)
+    mark_written(user_id)
     if not success:
         raise HTTPException(status_code=404, detail="연습 진행 상태를 찾을 수 없습니다.")
     return None
 
+
+# 통계 API 엔드포인트
+@app.get("/api/stats/{user_id}", response_model=ProgressStatsResponse)
+async def get_stats_endpoint(user_id: str, db: DbSession = Depends(get_read_session)):
+    """사용자의 단원별 학습/연습 통계(known, unknown, total)를 반환합니다."""
+    await _flush_buffered(user_id)
+    return await get_progress_stats(db, user_id)
+
+
+# 델타 동기화 API 엔드포인트
+@app.get("/api/sync/{user_id}", response_model=SyncResponse)
+async def sync_progress_endpoint(
+    user_id: str,
+    since: Optional[datetime] = Query(None, description="이전 응답의 watermark (없으면 전체)"),
+    db: DbSession = Depends(get_read_session)
+):
+    """since 이후 바뀐 학습/연습 진행 상태와 삭제 기록, 다음 요청에 쓸 watermark를 반환합니다."""
+    await _flush_buffered(user_id)
+    return await get_progress_changes(db, user_id, since)
+
+
+# 학습/연습 세션 API 엔드포인트
+@app.get("/api/session/{user_id}", response_model=StudySessionResponse)
+async def get_session_endpoint(
+    user_id: str,
+    mode: Literal["study", "practice"] = Query("study"),
+    chapter: Optional[int] = Query(None, description="단원 (연습 모드에서 없으면 학습한 한자 전체)"),
+    review: bool = Query(False, description="모름으로 표시한 한자만"),
+    seed: Optional[int] = Query(None, description="연습 카드 섞기 시드 (없으면 무작위)"),
+    db: DbSession = Depends(get_read_session)
+):
+    """
+    세션을 시작하는 데 필요한 카드 목록과 진행 상태를 한 번에 반환합니다.
+    (한자 목록, 단원 목록, 진행 상태를 따로 받아 클라이언트에서 거르던 요청들을 대체)
+    """
+    if mode == "study" and chapter is None:
+        raise HTTPException(status_code=400, detail="학습 모드에는 단원(chapter)이 필요합니다.")
+    await _flush_buffered(user_id)
+    return await get_study_session(db, user_id, mode, chapter, review, seed)
+
+
+# 퀴즈 API 엔드포인트
+@app.post("/api/quiz", response_model=QuizResponse)
+async def create_quiz_endpoint(quiz: QuizRequest, db: DbSession = Depends(get_read_session)):
+    """선택한 단원에서 객관식 퀴즈를 생성합니다 (보기와 정답 위치만 반환)."""
+    snapshot = catalog_cache.current() or await get_catalog(db)
+    if quiz.chapters:
+        candidates = [h for chapter in quiz.chapters for h in snapshot.by_chapter.get(chapter, [])]
+    else:
+        candidates = snapshot.hanja
+    if not candidates:
+        raise HTTPException(status_code=404, detail="선택한 단원에 한자가 없습니다.")
+    return generate_quiz(
+        candidates, snapshot.quiz_pools, quiz.question_type, quiz.count, quiz.choices, quiz.seed
+    )
+
+
+# 간격 반복 복습 API 엔드포인트
+@app.post("/api/review", response_model=ReviewStateResponse, status_code=201)
+async def create_review_endpoint(review: ReviewCreate, db: DbSession = Depends(get_session)):
+    """복습 결과(grade 0~5)를 기록하고 다음 복습 일정을 반환합니다."""
+    state = await record_review(db, review.model_dump())
+    mark_written(review.user_id)
+    return state
+
+
+@app.get("/api/review-queue/{user_id}", response_model=ReviewQueueResponse)
+async def get_review_queue_endpoint(
+    user_id: str,
+    limit: int = Query(20, ge=1, le=200),
+    db: DbSession = Depends(get_read_session)
+):
+    """복습 시각이 지난 카드를 오래된 순으로 최대 limit개 반환합니다."""
+    reviews = await get_review_queue(db, user_id, limit)
+    return {"reviews": reviews}
+
 # 정적 파일 서빙 설정 (Docker 빌드 시 static 폴더에 프론트엔드 빌드 결과가 있음)
 static_dir = "static"
 if os.path.exists(static_dir):
-    # 정적 파일 (JS, CSS, 이미지 등) 서빙
-    app.mount("/assets", StaticFiles(directory=f"{static_dir}/assets"), name="assets")
-    
+    # .br/.gz 파일은 빌드 단계에서 미리 만듦 (python -m static_files static), 없으면 원본을 그대로 전송
+    # 정적 파일 (JS, CSS, 이미지 등) 서빙: 미리 압축된 파일 + 해시 파일명은 immutable 캐시
+    app.mount("/assets", PrecompressedStaticFiles(f"{static_dir}/assets", hashed=True), name="assets")
+    # 최상위 파일 (favicon 등, 해시가 없으므로 짧은 캐시)과 메모리에 올려 둔 index.html
+    root_files = PrecompressedStaticFiles(static_dir, exclude=("index.html",))
+    spa_index = SpaIndex(os.path.join(static_dir, "index.html"))
+
     # SPA 라우팅을 위한 fallback: 모든 경로를 index.html로 리다이렉트
     # API 경로는 위에서 이미 처리되므로 여기서는 제외됨
     @app.get("/{full_path:path}")
     async def serve_spa(full_path: str, request: Request):
-        # 정적 파일 요청은 제외 (이미 /assets로 마운트됨)
-        if full_path.startswith("assets/"):
-            return None
-        
+        if full_path and full_path in root_files:
+            return await root_files.get_response(os.path.normpath(full_path), request.scope)
         # index.html 반환 (React Router가 라우팅 처리)
-        index_path = os.path.join(static_dir, "index.html")
-        if os.path.exists(index_path):
-            response = FileResponse(index_path)
-            # index.html은 캐시하지 않음 (항상 최신 버전)
-            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-            return response
-        
-        return {"error": "Frontend not found"}
+        return spa_index.response(request.headers)
 else:
     # 개발 환경: 정적 파일이 없으면 API만 제공
     @app.get("/")
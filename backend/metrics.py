@@ -0,0 +1,336 @@
+"""
+요청/DB 계측
+- MetricsMiddleware: 라우트별 요청 지연 시간 히스토그램, SQL 실행 수, DB 시간 기록 + Server-Timing 헤더
+- install_sql_hooks: SQLAlchemy 엔진 이벤트로 요청별 SQL 실행 수/시간 집계
+- TimedQueuePool / TimedAsyncQueuePool: 연결 풀 체크아웃 대기 시간 기록 (pool_collector로 노출)
+- registry.render(): Prometheus 텍스트 형식 (/metrics)
+"""
+import threading
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# 요청 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# 요청당 SQL 실행 수 히스토그램 구간
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50)
+
+
+class RequestStats:
+    """요청 하나에서 실행된 SQL 수와 DB 시간 (contextvar로 스레드풀/greenlet까지 전달)"""
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "total", "count")
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.total += value
+        self.count += 1
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class MetricsRegistry:
+    """라우트별 지표 저장소"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._latency: Dict[Tuple[str, str], Histogram] = {}
+        self._query_counts: Dict[Tuple[str, str], Histogram] = {}
+        self._db_seconds: Dict[Tuple[str, str], float] = {}
+        self._responses: Dict[Tuple[str, str, int], int] = {}
+        self.queries_outside_requests = 0
+        # 추가 지표 수집 함수 (Prometheus 텍스트 줄 목록 반환)
+        self._collectors: List[Callable[[], List[str]]] = []
+
+    def observe(self, method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+        key = (method, route)
+        with self._lock:
+            if key not in self._latency:
+                self._latency[key] = Histogram(LATENCY_BUCKETS)
+                self._query_counts[key] = Histogram(QUERY_COUNT_BUCKETS)
+                self._db_seconds[key] = 0.0
+            self._latency[key].observe(seconds)
+            self._query_counts[key].observe(stats.queries)
+            self._db_seconds[key] += stats.db_seconds
+            self._responses[(method, route, status)] = self._responses.get((method, route, status), 0) + 1
+
+    def add_collector(self, collector: Callable[[], List[str]]) -> None:
+        """render() 끝에 붙일 Prometheus 텍스트 줄을 반환하는 함수를 등록합니다."""
+        self._collectors.append(collector)
+
+    @staticmethod
+    def _render_histogram(lines: List[str], name: str, key: Tuple[str, str], histogram: Histogram) -> None:
+        method, route = key
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            lines.append(f"{name}_bucket{_labels(method=method, route=route, le=bound)} {count}")
+        lines.append(f"{name}_bucket{_labels(method=method, route=route, le='+Inf')} {histogram.count}")
+        lines.append(f"{name}_sum{_labels(method=method, route=route)} {histogram.total:.6f}")
+        lines.append(f"{name}_count{_labels(method=method, route=route)} {histogram.count}")
+
+    def render(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            lines.append("# HELP http_request_duration_seconds 라우트별 요청 처리 시간")
+            lines.append("# TYPE http_request_duration_seconds histogram")
+            for key, histogram in sorted(self._latency.items()):
+                self._render_histogram(lines, "http_request_duration_seconds", key, histogram)
+
+            lines.append("# HELP http_responses_total 라우트/상태 코드별 응답 수")
+            lines.append("# TYPE http_responses_total counter")
+            for (method, route, status), count in sorted(self._responses.items()):
+                lines.append(f"http_responses_total{_labels(method=method, route=route, status=status)} {count}")
+
+            lines.append("# HELP db_queries_per_request 요청당 실행된 SQL 문 수")
+            lines.append("# TYPE db_queries_per_request histogram")
+            for key, histogram in sorted(self._query_counts.items()):
+                self._render_histogram(lines, "db_queries_per_request", key, histogram)
+
+            lines.append("# HELP db_query_duration_seconds_total 라우트별 DB 실행 시간 합계")
+            lines.append("# TYPE db_query_duration_seconds_total counter")
+            for (method, route), seconds in sorted(self._db_seconds.items()):
+                lines.append(f"db_query_duration_seconds_total{_labels(method=method, route=route)} {seconds:.6f}")
+
+            lines.append("# HELP db_queries_outside_requests_total 요청 밖(시작, 백그라운드 작업)에서 실행된 SQL 문 수")
+            lines.append("# TYPE db_queries_outside_requests_total counter")
+            lines.append(f"db_queries_outside_requests_total {self.queries_outside_requests}")
+
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+def catalog_cache_collector(cache) -> Callable[[], List[str]]:
+    """카탈로그 캐시 적중/미스 지표"""
+    def collect() -> List[str]:
+        stats = cache.stats()
+        return [
+            "# TYPE catalog_cache_hits_total counter",
+            f"catalog_cache_hits_total {stats['hits']}",
+            "# TYPE catalog_cache_misses_total counter",
+            f"catalog_cache_misses_total {stats['misses']}",
+            "# TYPE catalog_cache_version gauge",
+            f"catalog_cache_version {stats['version']}",
+            "# TYPE catalog_cache_size gauge",
+            f"catalog_cache_size {stats['size']}",
+        ]
+    return collect
+
+
+def catalog_sync_collector(sync) -> Callable[[], List[str]]:
+    """워커 간 카탈로그 무효화 알림 지표"""
+    def collect() -> List[str]:
+        stats = sync.stats()
+        return [
+            "# TYPE catalog_sync_sent_total counter",
+            f"catalog_sync_sent_total {stats['sent']}",
+            "# TYPE catalog_sync_received_total counter",
+            f"catalog_sync_received_total {stats['received']}",
+            "# TYPE catalog_sync_connects_total counter",
+            f"catalog_sync_connects_total {stats['connects']}",
+        ]
+    return collect
+
+
+def progress_buffer_collector(buffer) -> Callable[[], List[str]]:
+    """진행 상태 write-behind 버퍼 지표"""
+    def collect() -> List[str]:
+        stats = buffer.stats()
+        return [
+            "# TYPE progress_buffer_pending gauge",
+            f"progress_buffer_pending {stats['pending']}",
+            "# TYPE progress_buffer_flushes_total counter",
+            f"progress_buffer_flushes_total {stats['flushes']}",
+            "# TYPE progress_buffer_flushed_entries_total counter",
+            f"progress_buffer_flushed_entries_total {stats['flushed_entries']}",
+            "# TYPE progress_buffer_failures_total counter",
+            f"progress_buffer_failures_total {stats['failures']}",
+            "# TYPE progress_buffer_dropped_entries_total counter",
+            f"progress_buffer_dropped_entries_total {stats['dropped_entries']}",
+        ]
+    return collect
+
+
+class _TimedPoolMixin:
+    """연결 체크아웃(빈 연결 대기, 새 연결 생성, pre-ping 포함)에 걸린 시간을 기록하는 풀"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.checkout_wait = Histogram(LATENCY_BUCKETS)
+        self.timeouts = 0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._stats_lock:
+                self.checkout_wait.observe(elapsed)
+
+
+class TimedQueuePool(_TimedPoolMixin, QueuePool):
+    pass
+
+
+class TimedAsyncQueuePool(_TimedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_collector(engines: Dict[str, object]) -> Callable[[], List[str]]:
+    """
+    엔진별 연결 풀 지표 (이름 → Engine, 비동기 엔진은 sync_engine 전달)
+    dispose() 후 새 풀로 바뀌어도 수집 시점의 engine.pool을 읽습니다.
+    """
+    def collect() -> List[str]:
+        gauges: Dict[str, List[str]] = {"size": [], "checked_out": [], "overflow": []}
+        waits: List[str] = []
+        timeouts: List[str] = []
+        for name, engine in engines.items():
+            pool = engine.pool
+            if isinstance(pool, QueuePool):
+                gauges["size"].append(f"db_pool_size{_labels(engine=name)} {pool.size()}")
+                gauges["checked_out"].append(f"db_pool_checked_out{_labels(engine=name)} {pool.checkedout()}")
+                # 기본 크기를 넘어 만든 연결 수 (음수면 아직 기본 크기만큼 만들지 않은 상태)
+                gauges["overflow"].append(f"db_pool_overflow{_labels(engine=name)} {pool.overflow()}")
+            if isinstance(pool, _TimedPoolMixin):
+                with pool._stats_lock:
+                    histogram = pool.checkout_wait
+                    for bound, count in zip(histogram.buckets, histogram.counts):
+                        waits.append(f"db_pool_checkout_seconds_bucket{_labels(engine=name, le=bound)} {count}")
+                    waits.append(f"db_pool_checkout_seconds_bucket{_labels(engine=name, le='+Inf')} {histogram.count}")
+                    waits.append(f"db_pool_checkout_seconds_sum{_labels(engine=name)} {histogram.total:.6f}")
+                    waits.append(f"db_pool_checkout_seconds_count{_labels(engine=name)} {histogram.count}")
+                    timeouts.append(f"db_pool_timeouts_total{_labels(engine=name)} {pool.timeouts}")
+
+        lines: List[str] = []
+        for key, samples in gauges.items():
+            if samples:
+                lines.append(f"# TYPE db_pool_{key} gauge")
+                lines.extend(samples)
+        if waits:
+            lines.append("# HELP db_pool_checkout_seconds 연결 풀에서 연결을 얻는 데 걸린 시간")
+            lines.append("# TYPE db_pool_checkout_seconds histogram")
+            lines.extend(waits)
+            lines.append("# TYPE db_pool_timeouts_total counter")
+            lines.extend(timeouts)
+        return lines
+    return collect
+
+
+def install_sql_hooks(sync_engine, metrics: MetricsRegistry = registry) -> None:
+    """엔진에서 실행되는 SQL 문을 현재 요청의 RequestStats에 집계합니다 (비동기 엔진은 sync_engine 전달)."""
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    def _finish(conn) -> None:
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        stats = _current_request.get()
+        if stats is None:
+            metrics.queries_outside_requests += 1
+            return
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        _finish(conn)
+
+    # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 여기서 시작 시각을 꺼냄
+    # (남겨 두면 연결이 풀로 돌아간 뒤 다음 문장의 시간이 어긋남)
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and exception_context.statement is not None and conn.info.get("query_started"):
+            _finish(conn)
+
+
+class MetricsMiddleware:
+    """
+    ASGI 미들웨어: 요청 시간과 SQL 실행 통계를 라우트 템플릿(/api/hanja/{hanja_id}) 단위로 기록하고
+    응답에 Server-Timing 헤더를 추가합니다.
+    """
+
+    def __init__(self, app, metrics: MetricsRegistry = registry) -> None:
+        self.app = app
+        self.metrics = metrics
+        self._route_paths: Dict[Callable, str] = {}
+
+    def _route_label(self, scope) -> str:
+        route = scope.get("route")
+        if route is not None:
+            return route.path
+        # 이전 Starlette 버전: 라우터가 scope에 남긴 endpoint로 경로 템플릿을 찾음
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return "unmatched"
+        if not self._route_paths:
+            for candidate in scope["app"].routes:
+                if hasattr(candidate, "endpoint"):
+                    self._route_paths[candidate.endpoint] = candidate.path
+        return self._route_paths.get(endpoint, "unmatched")
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                app_ms = (time.perf_counter() - started) * 1000
+                timing = (
+                    f'app;dur={app_ms:.2f}, db;dur={stats.db_seconds * 1000:.2f};desc="{stats.queries} queries"'
+                )
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", timing.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_request.reset(token)
+            self.metrics.observe(
+                scope["method"], self._route_label(scope), status, time.perf_counter() - started, stats
+            )
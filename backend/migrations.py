@@ -0,0 +1,138 @@
+"""
+스키마 마이그레이션
+Base.metadata.create_all은 없는 테이블만 만들고 기존 테이블의 인덱스/제약 조건은 바꾸지 않습니다.
+기존 DB에 필요한 변경을 번호순으로 적용하고 schema_migrations 테이블에 기록합니다.
+
+실행: python migrations.py
+"""
+import logging
+
+from sqlalchemy import delete, func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+from database import Base, engine
+from models import HanjaModel, StudyProgressModel, PracticeProgressModel, SchemaMigrationModel
+from id_allocator import sync_hanja_id_sequence
+from crud import rebuild_progress_counters
+from typing import Callable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _index_by_name(table, name: str):
+    return next(index for index in table.indexes if index.name == name)
+
+
+def _drop_index_if_exists(conn: Connection, table, name: str) -> None:
+    existing = {index["name"] for index in inspect(conn).get_indexes(table.name, schema=table.schema)}
+    if name in existing:
+        qualified = f"{table.schema}.{name}" if table.schema else name
+        conn.execute(text(f"DROP INDEX {qualified}"))
+
+
+def _progress_unique_user_hanja(conn: Connection) -> None:
+    """진행 상태 테이블에 (user_id, hanja_id) 유니크 인덱스를 추가합니다."""
+    for model, old_index, new_index in (
+        (StudyProgressModel, "idx_user_hanja", "uq_study_user_hanja"),
+        (PracticeProgressModel, "idx_practice_user_hanja", "uq_practice_user_hanja"),
+    ):
+        table = model.__table__
+        # 경쟁 상태로 생긴 중복 행은 가장 최근(id가 가장 큰) 행만 남김
+        keep = select(func.max(table.c.id)).group_by(table.c.user_id, table.c.hanja_id)
+        conn.execute(delete(table).where(table.c.id.not_in(keep)))
+        _index_by_name(table, new_index).create(conn, checkfirst=True)
+        _drop_index_if_exists(conn, table, old_index)
+
+
+def _hanja_id_sequence(conn: Connection) -> None:
+    """한자 ID 시퀀스(또는 카운터)를 기존 최대 ID 이후로 초기화합니다."""
+    sync_hanja_id_sequence(conn)
+
+
+def _progress_counters(conn: Connection) -> None:
+    """기존 진행 상태로 단원별 통계 카운터를 채웁니다."""
+    rebuild_progress_counters(conn)
+
+
+def _hanja_chapter_id_index(conn: Connection) -> None:
+    """한자 목록 키셋 페이지네이션용 (chapter, id) 인덱스를 추가합니다."""
+    _index_by_name(HanjaModel.__table__, "idx_chapter_id").create(conn, checkfirst=True)
+
+
+def _progress_updated_index(conn: Connection) -> None:
+    """델타 동기화용 (user_id, updated_at) 인덱스를 추가합니다."""
+    _index_by_name(StudyProgressModel.__table__, "idx_study_user_updated").create(conn, checkfirst=True)
+    _index_by_name(PracticeProgressModel.__table__, "idx_practice_user_updated").create(conn, checkfirst=True)
+
+
+def _hanja_trgm_index(conn: Connection) -> None:
+    """PostgreSQL: 검색(SEARCH_BACKEND=pg_trgm)용 음/뜻 트라이그램 인덱스를 추가합니다."""
+    if conn.dialect.name != "postgresql":
+        return
+    table = HanjaModel.__table__
+    qualified = f"{table.schema}.{table.name}" if table.schema else table.name
+    try:
+        # 확장 설치 권한이 없어도 나머지 마이그레이션은 진행 (검색은 인덱스 없이 동작)
+        with conn.begin_nested():
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    except Exception as e:
+        logger.warning("pg_trgm 확장을 설치하지 못해 트라이그램 인덱스를 건너뜁니다: %s", e)
+        return
+    for column in ("sound", "meaning"):
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS idx_hanja_{column}_trgm ON {qualified} USING gin ({column} gin_trgm_ops)"
+        ))
+
+
+# (버전, 이름, 적용 함수) - 한 번 배포된 항목은 수정하지 말고 새 번호로 추가하세요
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "progress_unique_user_hanja", _progress_unique_user_hanja),
+    (2, "hanja_id_sequence", _hanja_id_sequence),
+    (3, "progress_counters", _progress_counters),
+    (4, "hanja_chapter_id_index", _hanja_chapter_id_index),
+    (5, "progress_updated_index", _progress_updated_index),
+    (6, "hanja_trgm_index", _hanja_trgm_index),
+]
+
+
+def schema_is_current(bind: Engine = engine) -> bool:
+    """모든 테이블이 있고 모든 마이그레이션이 적용되었는지 확인합니다 (테이블 목록과 적용 기록 조회 두 번)."""
+    migration_table = SchemaMigrationModel.__table__
+    with bind.connect() as conn:
+        existing = set(inspect(conn).get_table_names(schema=migration_table.schema))
+        if not {table.name for table in Base.metadata.sorted_tables} <= existing:
+            return False
+        applied = set(conn.execute(select(migration_table.c.version)).scalars())
+    return {version for version, _, _ in MIGRATIONS} <= applied
+
+
+def run_migrations(bind: Engine = engine) -> List[int]:
+    """
+    없는 테이블을 만들고 아직 적용되지 않은 마이그레이션을 순서대로 적용합니다.
+    각 마이그레이션은 기록과 함께 하나의 트랜잭션으로 처리됩니다.
+    이미 최신이면 테이블별 확인(create_all) 없이 바로 끝납니다.
+    """
+    if schema_is_current(bind):
+        return []
+    Base.metadata.create_all(bind=bind)
+    migration_table = SchemaMigrationModel.__table__
+
+    with bind.connect() as conn:
+        applied = set(conn.execute(select(migration_table.c.version)).scalars())
+
+    newly_applied = []
+    for version, name, migrate in MIGRATIONS:
+        if version in applied:
+            continue
+        with bind.begin() as conn:
+            migrate(conn)
+            conn.execute(migration_table.insert().values(version=version, name=name))
+        newly_applied.append(version)
+    return newly_applied
+
+
+if __name__ == "__main__":
+    applied = run_migrations()
+    if applied:
+        print(f"마이그레이션을 적용했습니다: {applied}")
+    else:
+        print("적용할 마이그레이션이 없습니다.")
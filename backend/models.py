@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, JSON, Index, Boolean, DateTime
+from sqlalchemy import Column, String, Integer, Float, JSON, Index, Boolean, DateTime, Sequence
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 from database import Base
@@ -6,13 +6,19 @@ from config import settings
 from typing import List, Dict
 
 
+# 한자 ID 발급용 시퀀스 (PostgreSQL). SQLite 등에서는 IdSequenceModel 테이블을 사용합니다.
+hanja_id_seq = Sequence("hanja_id_seq", schema=settings.table_schema, metadata=Base.metadata)
+
+
 class HanjaModel(Base):
     """한자 데이터 모델 (ORM)"""
     __tablename__ = "hanja"
     __table_args__ = (
         Index("idx_chapter", "chapter"),
+        # (chapter, id) 키셋 페이지네이션 (migrations.py 4번)
+        Index("idx_chapter_id", "chapter", "id"),
         Index("idx_difficulty", "difficulty"),
-        {"schema": settings.database_schema},
+        {"schema": settings.table_schema},
     )
 
     id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
@@ -32,9 +38,12 @@ class StudyProgressModel(Base):
     """학습 진행 상태 모델 (ORM)"""
     __tablename__ = "study_progress"
     __table_args__ = (
-        Index("idx_user_hanja", "user_id", "hanja_id"),
+        # ON CONFLICT (user_id, hanja_id) upsert 기준 (migrations.py 1번에서 기존 DB에 추가)
+        Index("uq_study_user_hanja", "user_id", "hanja_id", unique=True),
         Index("idx_user_chapter", "user_id", "chapter"),
-        {"schema": settings.database_schema},
+        # 델타 동기화: user_id 일치 + updated_at 범위 스캔 (migrations.py 5번)
+        Index("idx_study_user_updated", "user_id", "updated_at"),
+        {"schema": settings.table_schema},
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -53,9 +62,10 @@ class PracticeProgressModel(Base):
     """연습 진행 상태 모델 (ORM)"""
     __tablename__ = "practice_progress"
     __table_args__ = (
-        Index("idx_practice_user_hanja", "user_id", "hanja_id"),
+        Index("uq_practice_user_hanja", "user_id", "hanja_id", unique=True),
         Index("idx_practice_user_chapter", "user_id", "chapter"),
-        {"schema": settings.database_schema},
+        Index("idx_practice_user_updated", "user_id", "updated_at"),
+        {"schema": settings.table_schema},
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -68,3 +78,95 @@ class PracticeProgressModel(Base):
 
     def __repr__(self) -> str:
         return f"<PracticeProgressModel(user_id={self.user_id}, hanja_id={self.hanja_id}, is_known={self.is_known})>"
+
+
+class ProgressTombstoneModel(Base):
+    """삭제된 진행 상태 기록 (델타 동기화에서 클라이언트에 삭제를 전달)"""
+    __tablename__ = "progress_tombstones"
+    __table_args__ = (
+        Index("idx_tombstone_user_deleted", "user_id", "deleted_at"),
+        {"schema": settings.table_schema},
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[str] = mapped_column(String, nullable=False)
+    mode: Mapped[str] = mapped_column(String, nullable=False)  # "study" 또는 "practice"
+    hanja_id: Mapped[str] = mapped_column(String, nullable=False)
+    chapter: Mapped[int] = mapped_column(Integer, nullable=False)
+    deleted_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<ProgressTombstoneModel(user_id={self.user_id}, mode={self.mode}, hanja_id={self.hanja_id})>"
+
+
+class ProgressCounterModel(Base):
+    """사용자/모드/단원별 진행 상태 카운터 (진행 상태 저장 트랜잭션에서 증감)"""
+    __tablename__ = "progress_counters"
+    __table_args__ = (
+        {"schema": settings.table_schema},
+    )
+
+    user_id: Mapped[str] = mapped_column(String, primary_key=True)
+    mode: Mapped[str] = mapped_column(String, primary_key=True)  # "study" 또는 "practice"
+    chapter: Mapped[int] = mapped_column(Integer, primary_key=True)
+    known_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    unknown_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<ProgressCounterModel(user_id={self.user_id}, mode={self.mode}, chapter={self.chapter})>"
+
+
+class ReviewStateModel(Base):
+    """간격 반복(SM-2) 복습 상태 모델 (ORM, scheduler.py)"""
+    __tablename__ = "review_state"
+    __table_args__ = (
+        Index("uq_review_user_hanja", "user_id", "hanja_id", unique=True),
+        # 복습 대기열 조회: user_id 일치 + due_at 범위 스캔
+        Index("idx_review_user_due", "user_id", "due_at"),
+        {"schema": settings.table_schema},
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[str] = mapped_column(String, nullable=False, default="default")
+    hanja_id: Mapped[str] = mapped_column(String, nullable=False)
+    chapter: Mapped[int] = mapped_column(Integer, nullable=False)
+    ease: Mapped[float] = mapped_column(Float, nullable=False, default=2.5)
+    interval_days: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    repetitions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    lapses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    due_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_reviewed_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return f"<ReviewStateModel(user_id={self.user_id}, hanja_id={self.hanja_id}, due_at={self.due_at})>"
+
+
+class IdSequenceModel(Base):
+    """시퀀스를 지원하지 않는 DB용 ID 카운터 (id_allocator.py)"""
+    __tablename__ = "id_sequences"
+    __table_args__ = (
+        {"schema": settings.table_schema},
+    )
+
+    name: Mapped[str] = mapped_column(String, primary_key=True)
+    next_value: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<IdSequenceModel(name={self.name}, next_value={self.next_value})>"
+
+
+class SchemaMigrationModel(Base):
+    """적용된 스키마 마이그레이션 기록 (migrations.py)"""
+    __tablename__ = "schema_migrations"
+    __table_args__ = (
+        {"schema": settings.table_schema},
+    )
+
+    version: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    name: Mapped[str] = mapped_column(String, nullable=False)
+    applied_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<SchemaMigrationModel(version={self.version}, name={self.name})>"
@@ -0,0 +1,44 @@
+"""
+진행 상태 비트맵 (사용자별 알고 있음/모름 상태의 압축 표현)
+한자 ID(시퀀스로 발급된 숫자, 재사용되지 않음)를 서수로 사용해 비트 i가 ID i인 한자를 나타냅니다.
+바이트 안에서는 하위 비트부터 채우며 base64로 인코딩합니다.
+숫자가 아닌 ID는 비트맵에 포함되지 않습니다.
+"""
+import base64
+import binascii
+from typing import Iterable, List, Optional
+
+
+def hanja_ordinal(hanja_id: str) -> Optional[int]:
+    """한자 ID의 비트맵 서수 (숫자 ID가 아니면 None)"""
+    return int(hanja_id) if hanja_id.isdigit() else None
+
+
+def bitmap_size(hanja_ids: Iterable[str]) -> int:
+    """카탈로그를 표현하는 데 필요한 비트 수 (가장 큰 서수 + 1)"""
+    ordinals = [ordinal for ordinal in map(hanja_ordinal, hanja_ids) if ordinal is not None]
+    return max(ordinals) + 1 if ordinals else 0
+
+
+def encode_bitmap(ordinals: Iterable[int], size: int) -> str:
+    buffer = bytearray((size + 7) // 8)
+    for ordinal in ordinals:
+        buffer[ordinal >> 3] |= 1 << (ordinal & 7)
+    return base64.b64encode(bytes(buffer)).decode("ascii")
+
+
+def decode_bitmap(data: str, size: int) -> List[int]:
+    """base64 비트맵에서 켜진 비트의 서수 목록을 반환합니다 (size를 넘으면 ValueError)."""
+    try:
+        raw = base64.b64decode(data, validate=True)
+    except binascii.Error as e:
+        raise ValueError("올바른 base64 비트맵이 아닙니다.") from e
+    if len(raw) > (size + 7) // 8:
+        raise ValueError("비트맵이 카탈로그보다 깁니다.")
+    ordinals = []
+    for index, byte in enumerate(raw):
+        while byte:
+            low = byte & -byte
+            ordinals.append(index * 8 + low.bit_length() - 1)
+            byte ^= low
+    return ordinals
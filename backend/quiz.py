@@ -0,0 +1,124 @@
+"""
+서버 측 퀴즈 생성기
+카탈로그 스냅샷을 로드할 때 오답 보기 후보(distractor pool)를 미리 만들어 두고,
+요청 시에는 샘플링만 하므로 50문항 생성도 1ms 이내로 끝납니다.
+오답 보기는 같은 단원 -> 같은 난이도 -> 전체 순으로 채우며,
+문제와 같은 음/뜻을 가진 한자처럼 문제에 대한 정답이 될 수 있는 보기는 뽑지 않습니다.
+"""
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from schemas import Hanja
+
+# 문제 유형별 (문제로 보여줄 필드, 정답 필드) - frontend types/hanja.ts의 QuestionType과 동일
+QUESTION_FIELDS: Dict[str, Tuple[str, str]] = {
+    "character-to-meaning": ("character", "meaning"),
+    "meaning-to-character": ("meaning", "character"),
+    "character-to-sound": ("character", "sound"),
+    "sound-to-character": ("sound", "character"),
+}
+ANSWER_FIELDS = ("character", "meaning", "sound")
+
+
+@dataclass(frozen=True)
+class QuizPools:
+    """정답 필드별 오답 후보 (중복 제거된 값 목록)"""
+    by_chapter: Dict[str, Dict[int, List[str]]]
+    by_difficulty: Dict[str, Dict[int, List[str]]]
+    everything: Dict[str, List[str]]
+    # 문제 유형별 문제 값 -> 그 문제 값을 가진 한자들의 정답 값 (모두 정답이 될 수 있으므로 오답 보기로 쓸 수 없음)
+    answers_by_prompt: Dict[str, Dict[str, Set[str]]]
+
+
+def _unique_values(hanja_list: Sequence[Hanja], field: str) -> List[str]:
+    return list(dict.fromkeys(getattr(h, field) for h in hanja_list))
+
+
+def _answers_by_prompt(hanja_list: Sequence[Hanja], prompt_field: str, answer_field: str) -> Dict[str, Set[str]]:
+    answers: Dict[str, Set[str]] = {}
+    for hanja in hanja_list:
+        answers.setdefault(getattr(hanja, prompt_field), set()).add(getattr(hanja, answer_field))
+    return answers
+
+
+def build_quiz_pools(hanja_list: List[Hanja]) -> QuizPools:
+    """카탈로그에서 단원별/난이도별/전체 오답 후보를 만듭니다."""
+    chapters: Dict[int, List[Hanja]] = {}
+    difficulties: Dict[int, List[Hanja]] = {}
+    for hanja in hanja_list:
+        chapters.setdefault(hanja.chapter, []).append(hanja)
+        difficulties.setdefault(hanja.difficulty, []).append(hanja)
+
+    return QuizPools(
+        by_chapter={
+            field: {chapter: _unique_values(items, field) for chapter, items in chapters.items()}
+            for field in ANSWER_FIELDS
+        },
+        by_difficulty={
+            field: {difficulty: _unique_values(items, field) for difficulty, items in difficulties.items()}
+            for field in ANSWER_FIELDS
+        },
+        everything={field: _unique_values(hanja_list, field) for field in ANSWER_FIELDS},
+        answers_by_prompt={
+            question_type: _answers_by_prompt(hanja_list, prompt_field, answer_field)
+            for question_type, (prompt_field, answer_field) in QUESTION_FIELDS.items()
+        },
+    )
+
+
+def _draw_distractors(
+    rng: random.Random, pools: QuizPools, question_type: str, hanja: Hanja, count: int
+) -> List[str]:
+    prompt_field, field = QUESTION_FIELDS[question_type]
+    # 정답과 함께, 문제 값이 같은 한자의 값도 제외 (예: 음이 같은 두 한자)
+    excluded = pools.answers_by_prompt[question_type].get(getattr(hanja, prompt_field), set())
+    excluded = excluded | {getattr(hanja, field)}
+    chosen: List[str] = []
+    for pool in (
+        pools.by_chapter[field].get(hanja.chapter, []),
+        pools.by_difficulty[field].get(hanja.difficulty, []),
+        pools.everything[field],
+    ):
+        need = count - len(chosen)
+        if need <= 0:
+            break
+        # 제외할 값과 이미 고른 값이 섞여 있을 수 있으므로 그만큼 여유 있게 샘플링
+        for value in rng.sample(pool, min(len(pool), need + len(chosen) + len(excluded))):
+            if value not in excluded and value not in chosen:
+                chosen.append(value)
+                if len(chosen) == count:
+                    break
+    return chosen
+
+
+def generate_quiz(
+    hanja_list: List[Hanja],
+    pools: QuizPools,
+    question_type: str,
+    count: int,
+    choices: int = 4,
+    seed: Optional[int] = None
+) -> dict:
+    """
+    후보 한자 중 count개를 뽑아 객관식 문제를 만듭니다.
+    같은 seed와 카탈로그이면 같은 퀴즈가 만들어지며, seed가 없으면 새로 정해 응답에 포함합니다.
+    """
+    prompt_field, answer_field = QUESTION_FIELDS[question_type]
+    if seed is None:
+        seed = random.randrange(2 ** 31)
+    rng = random.Random(seed)
+
+    questions = []
+    for hanja in rng.sample(hanja_list, min(count, len(hanja_list))):
+        answer = getattr(hanja, answer_field)
+        options = _draw_distractors(rng, pools, question_type, hanja, choices - 1)
+        options.append(answer)
+        rng.shuffle(options)
+        questions.append({
+            "hanja_id": hanja.id,
+            "chapter": hanja.chapter,
+            "prompt": getattr(hanja, prompt_field),
+            "choices": options,
+            "answer_index": options.index(answer),
+        })
+    return {"seed": seed, "question_type": question_type, "questions": questions}
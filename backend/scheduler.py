@@ -0,0 +1,53 @@
+"""
+간격 반복 스케줄러 (SM-2)
+답안 평가(grade 0~5)에 따라 난이도 계수(ease), 복습 간격, 다음 복습 시각을 계산합니다.
+- grade < 3 (틀림): 연속 정답 횟수를 초기화하고 RELEARN_DELAY 뒤에 다시 복습
+- grade >= 3 (맞음): 1일 -> 6일 -> 이전 간격 x ease 순으로 간격 증가
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+MIN_EASE = 1.3
+DEFAULT_EASE = 2.5
+PASSING_GRADE = 3
+# 틀린 카드는 같은 학습 세션 안에서 다시 나오도록 짧게 예약
+RELEARN_DELAY = timedelta(minutes=10)
+
+
+@dataclass(frozen=True)
+class ReviewState:
+    """카드 하나의 복습 상태"""
+    ease: float = DEFAULT_EASE
+    interval_days: float = 0.0
+    repetitions: int = 0
+    lapses: int = 0
+
+
+def next_state(state: ReviewState, grade: int) -> ReviewState:
+    """SM-2 규칙으로 다음 복습 상태를 계산합니다."""
+    if not 0 <= grade <= 5:
+        raise ValueError("grade는 0~5 사이여야 합니다.")
+
+    ease = max(MIN_EASE, state.ease + 0.1 - (5 - grade) * (0.08 + (5 - grade) * 0.02))
+    if grade < PASSING_GRADE:
+        return ReviewState(ease=ease, interval_days=0.0, repetitions=0, lapses=state.lapses + 1)
+
+    if state.repetitions == 0:
+        interval = 1.0
+    elif state.repetitions == 1:
+        interval = 6.0
+    else:
+        interval = round(state.interval_days * state.ease, 2)
+    return ReviewState(ease=ease, interval_days=interval, repetitions=state.repetitions + 1, lapses=state.lapses)
+
+
+def due_at(state: ReviewState, reviewed_at: datetime) -> datetime:
+    """복습 상태에 따른 다음 복습 시각"""
+    if state.interval_days <= 0:
+        return reviewed_at + RELEARN_DELAY
+    return reviewed_at + timedelta(days=state.interval_days)
+
+
+def utcnow() -> datetime:
+    """DB에 저장하는 기준 시각 (UTC)"""
+    return datetime.now(timezone.utc)
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import List, Literal, Optional
 
 
 class Example(BaseModel):
@@ -117,3 +118,126 @@ class PracticeProgressResponse(BaseModel):
 class PracticeProgressListResponse(BaseModel):
     """연습 진행 상태 리스트 응답 스키마"""
     progress: List[PracticeProgressResponse]
+
+
+class ChapterStats(BaseModel):
+    """단원별 통계 (total은 단원의 전체 한자 수)"""
+    chapter: int
+    known: int
+    unknown: int
+    total: int
+
+
+class ProgressStatsResponse(BaseModel):
+    """학습/연습 단원별 통계 응답 스키마"""
+    user_id: str
+    study: List[ChapterStats]
+    practice: List[ChapterStats]
+
+
+class QuizRequest(BaseModel):
+    """퀴즈 생성 요청 스키마 (chapters가 비어 있으면 전체 단원)"""
+    chapters: List[int] = []
+    count: int = Field(10, ge=1, le=100)
+    question_type: Literal[
+        "character-to-meaning", "meaning-to-character", "character-to-sound", "sound-to-character"
+    ] = "character-to-meaning"
+    choices: int = Field(4, ge=2, le=8)
+    seed: Optional[int] = None
+
+
+class QuizQuestion(BaseModel):
+    """객관식 문제 하나"""
+    hanja_id: str
+    chapter: int
+    prompt: str
+    choices: List[str]
+    answer_index: int
+
+
+class QuizResponse(BaseModel):
+    """퀴즈 생성 응답 스키마 (같은 seed로 다시 요청하면 같은 퀴즈)"""
+    seed: int
+    question_type: str
+    questions: List[QuizQuestion]
+
+
+class ReviewCreate(BaseModel):
+    """복습 결과 기록용 스키마 (grade: 0=전혀 모름 ~ 5=완벽)"""
+    user_id: str = "default"
+    hanja_id: str
+    chapter: int
+    grade: int = Field(ge=0, le=5)
+
+
+class ReviewStateResponse(BaseModel):
+    """복습 상태 응답 스키마"""
+    user_id: str
+    hanja_id: str
+    chapter: int
+    ease: float
+    interval_days: float
+    repetitions: int
+    lapses: int
+    due_at: datetime
+
+
+class ReviewQueueResponse(BaseModel):
+    """복습 대기열 응답 스키마 (due_at 오름차순)"""
+    reviews: List[ReviewStateResponse]
+
+
+class ProgressBitmap(BaseModel):
+    """
+    진행 상태 비트맵 응답 스키마
+    비트 i는 ID가 i인 한자 (base64, 바이트 안에서는 하위 비트부터), size는 전체 비트 수
+    """
+    user_id: str
+    catalog_version: str
+    size: int
+    known: str
+    unknown: str
+
+
+class ProgressBitmapUpdate(BaseModel):
+    """진행 상태 비트맵 저장 스키마 (두 비트맵에 모두 없는 한자의 기록은 삭제)"""
+    catalog_version: str
+    known: str
+    unknown: str
+
+
+class ProgressTombstone(BaseModel):
+    """삭제된 진행 상태 (mode: "study" 또는 "practice")"""
+    mode: str
+    hanja_id: str
+    chapter: int
+
+
+class SyncResponse(BaseModel):
+    """
+    델타 동기화 응답 스키마
+    since 이후 바뀐 행과 삭제 기록만 포함하며, 다음 요청에는 watermark를 since로 보냅니다.
+    full이 true이면 전체 목록이므로 클라이언트는 로컬 상태를 교체해야 합니다.
+    """
+    user_id: str
+    watermark: datetime
+    full: bool
+    study: List[StudyProgressResponse]
+    practice: List[PracticeProgressResponse]
+    deleted: List[ProgressTombstone]
+
+
+class StudySessionResponse(BaseModel):
+    """
+    학습/연습 세션 응답 스키마 (cards는 보여 줄 순서대로)
+    known_ids/unknown_ids는 해당 모드(단원 지정 시 그 단원)의 진행 상태입니다.
+    연습 카드는 seed로 섞으므로 같은 seed와 진행 상태이면 같은 순서가 됩니다.
+    """
+    user_id: str
+    mode: Literal["study", "practice"]
+    chapter: Optional[int] = None
+    review: bool
+    seed: int
+    cards: List[Hanja]
+    known_ids: List[str]
+    unknown_ids: List[str]
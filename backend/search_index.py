@@ -0,0 +1,210 @@
+"""
+한자 카탈로그 검색 인덱스 (인메모리)
+- 한자: 글자 → ID
+- 음/뜻/예문: 1-gram, 2-gram 역색인으로 후보를 좁힌 뒤 부분 문자열 확인
+- 초성 검색: "ㅎㅈ"처럼 자음만 입력하면 음과 뜻의 초성 문자열에서 검색
+카탈로그 버전과 함께 관리하며, 관리자 수정(create/update/delete)은 전체를 다시 만들지 않고
+해당 한자만 인덱스에서 빼고 다시 넣습니다.
+"""
+import heapq
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from schemas import Hanja
+
+# 한글 음절의 초성 (유니코드 순서)
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_START, _HANGUL_END = 0xAC00, 0xD7A3
+
+# 일치한 필드별 순위 (낮을수록 앞)
+RANK_CHARACTER, RANK_SOUND, RANK_MEANING, RANK_CHOSEONG, RANK_EXAMPLE = range(5)
+# 버전별 검색 결과 캐시 크기 (가득 차면 비움)
+RESULT_CACHE_SIZE = 1024
+
+
+def to_choseong(text: str) -> str:
+    """한글 음절을 초성으로 바꿉니다 (한글이 아닌 문자는 그대로)."""
+    result = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_START <= code <= _HANGUL_END:
+            result.append(_CHOSEONG[(code - _HANGUL_START) // 588])
+        else:
+            result.append(char)
+    return "".join(result)
+
+
+def is_choseong_query(query: str) -> bool:
+    """자음(초성)만으로 이루어진 검색어인지 확인합니다."""
+    return bool(query) and all(char in _CHOSEONG for char in query.replace(" ", ""))
+
+
+def query_characters(query: str) -> Set[str]:
+    """한자 순위에서 찾을 글자 집합: 검색어에 들어 있는 글자 중 하나라도 같으면 일치 (공백 제외)"""
+    return set(query) - {" "}
+
+
+def _grams(text: str) -> Set[str]:
+    """텍스트의 1-gram, 2-gram 집합"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+class NgramIndex:
+    """부분 문자열 검색용 n-gram 역색인 (키별 추가/삭제 가능)"""
+
+    def __init__(self) -> None:
+        self._postings: Dict[str, Set[str]] = {}
+        self._texts: Dict[str, str] = {}
+
+    def add(self, key: str, text: str) -> None:
+        text = text.lower()
+        self._texts[key] = text
+        for gram in _grams(text):
+            self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: str) -> None:
+        text = self._texts.pop(key, None)
+        if text is None:
+            return
+        for gram in _grams(text):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(key)
+                if not posting:
+                    del self._postings[gram]
+
+    def search(self, query: str) -> Set[str]:
+        """query를 부분 문자열로 포함하는 키 집합 (반환된 집합은 수정하지 마세요)"""
+        query = query.lower()
+        if len(query) <= 1:
+            return self._postings.get(query, set())
+        grams = [query[i:i + 2] for i in range(len(query) - 1)]
+        postings = sorted((self._postings.get(gram, set()) for gram in grams), key=len)
+        if not postings[0]:
+            return set()
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return candidates
+        if len(query) == 2:
+            return candidates
+        # 2-gram이 모두 있어도 연속하지 않을 수 있으므로 실제 텍스트로 확인
+        return {key for key in candidates if query in self._texts[key]}
+
+
+class SearchIndex:
+    """카탈로그 버전에 맞춰 관리되는 한자 검색 인덱스"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.version: Optional[int] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._hanja: Dict[str, Hanja] = {}
+        # 같은 순위 안에서의 정렬 기준 (단원, ID)
+        self._order: Dict[str, Tuple] = {}
+        self._results: Dict[Tuple[str, int], List[Hanja]] = {}
+        self._characters: Dict[str, Set[str]] = {}
+        self._sound = NgramIndex()
+        self._meaning = NgramIndex()
+        self._choseong = NgramIndex()
+        self._examples = NgramIndex()
+
+    def _add(self, hanja: Hanja) -> None:
+        self._hanja[hanja.id] = hanja
+        self._order[hanja.id] = (hanja.chapter, _id_sort_key(hanja.id))
+        self._characters.setdefault(hanja.character, set()).add(hanja.id)
+        self._sound.add(hanja.id, hanja.sound)
+        self._meaning.add(hanja.id, hanja.meaning)
+        self._choseong.add(hanja.id, f"{to_choseong(hanja.sound)} {to_choseong(hanja.meaning)}")
+        self._examples.add(hanja.id, "\n".join(f"{ex.sentence}\n{ex.meaning}" for ex in hanja.examples))
+
+    def _remove(self, hanja_id: str) -> None:
+        hanja = self._hanja.pop(hanja_id, None)
+        if hanja is None:
+            return
+        del self._order[hanja_id]
+        ids = self._characters.get(hanja.character)
+        if ids is not None:
+            ids.discard(hanja_id)
+            if not ids:
+                del self._characters[hanja.character]
+        for index in (self._sound, self._meaning, self._choseong, self._examples):
+            index.remove(hanja_id)
+
+    def rebuild(self, version: int, hanja_list: Iterable[Hanja]) -> None:
+        """카탈로그 전체로 인덱스를 다시 만듭니다."""
+        with self._lock:
+            self._reset()
+            for hanja in hanja_list:
+                self._add(hanja)
+            self.version = version
+
+    def apply(self, version: int, hanja: Optional[Hanja] = None, removed_id: Optional[str] = None) -> None:
+        """
+        관리자 수정 한 건을 반영합니다 (version은 수정 후 카탈로그 버전).
+        인덱스가 바로 이전 버전이 아니면 다음 검색 때 전체를 다시 만들도록 비워 둡니다.
+        """
+        with self._lock:
+            if self.version is None or self.version != version - 1:
+                self.version = None
+                return
+            if removed_id is not None:
+                self._remove(removed_id)
+            if hanja is not None:
+                self._remove(hanja.id)
+                self._add(hanja)
+            self._results.clear()
+            self.version = version
+
+    def _tiers(self, query: str) -> Iterator[Set[str]]:
+        """순위가 높은 필드부터 일치한 ID 집합을 차례로 만듭니다 (필요한 만큼만 계산)."""
+        if is_choseong_query(query):
+            yield self._choseong.search(query)
+            return
+        yield {hanja_id for char in query_characters(query) for hanja_id in self._characters.get(char, ())}
+        yield self._sound.search(query)
+        yield self._meaning.search(query)
+        yield self._examples.search(query)
+
+    def search(self, query: str, limit: int = 20) -> List[Hanja]:
+        """검색어와 일치하는 한자를 일치한 필드 순위, 단원, ID 순으로 최대 limit개 반환합니다."""
+        query = query.strip()
+        if not query:
+            return []
+        with self._lock:
+            cached = self._results.get((query, limit))
+            if cached is not None:
+                return cached
+
+            order = self._order.__getitem__
+            found: List[str] = []
+            seen: Set[str] = set()
+            for ids in self._tiers(query):
+                fresh = ids - seen if seen else ids
+                need = limit - len(found)
+                if len(fresh) > need:
+                    found.extend(heapq.nsmallest(need, fresh, key=order))
+                    break
+                found.extend(sorted(fresh, key=order))
+                seen.update(fresh)
+                if len(found) == limit:
+                    break
+
+            results = [self._hanja[hanja_id] for hanja_id in found]
+            if len(self._results) >= RESULT_CACHE_SIZE:
+                self._results.clear()
+            self._results[(query, limit)] = results
+            return results
+
+
+def _id_sort_key(hanja_id: str):
+    # 숫자 ID는 숫자 순서로
+    return (0, int(hanja_id), "") if hanja_id.isdigit() else (1, 0, hanja_id)
+
+
+search_index = SearchIndex()
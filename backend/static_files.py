@@ -0,0 +1,210 @@
+"""
+프론트엔드 빌드 결과(static/) 서빙
+- 미리 압축: Docker 빌드 단계(python -m static_files static)에서 .br/.gz 파일을 만들어 두고
+  요청의 Accept-Encoding에 맞는 파일을 그대로 보냅니다 (요청마다 압축하지 않음, 압축 파일이 없으면 원본 전송).
+- 캐시: assets/ 아래 Vite 해시 파일명([name]-[hash].ext)의 자산만 Cache-Control: immutable (1년),
+  index.html은 메모리에 두고 ETag로 재검증
+- 파일 목록과 stat 결과는 시작 시 한 번만 읽어 요청마다 파일 시스템을 확인하지 않습니다.
+- 본문은 FileResponse로 보내며, 서버가 ASGI pathsend 확장을 지원하면 sendfile로 전송됩니다.
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 사용
+    brotli = None
+
+# 압축해서 이득이 있는 파일 (이미지/폰트 중 이미 압축된 형식은 제외)
+COMPRESSIBLE_SUFFIXES = {
+    ".js", ".mjs", ".css", ".html", ".svg", ".json", ".map", ".txt", ".xml", ".wasm", ".ttf", ".otf", ".eot", ".ico",
+}
+# 이보다 작은 파일은 압축하지 않음 (헤더 비용이 더 큼)
+MIN_COMPRESS_SIZE = 1024
+# Vite 빌드의 [name]-[hash].ext 파일명 (해시는 8자, assets/ 아래에만 있음)
+_HASHED_NAME = re.compile(r"-[A-Za-z0-9_-]{8}\.[A-Za-z0-9]+$")
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 해시가 없는 파일(favicon 등)
+DEFAULT_CACHE_CONTROL = "public, max-age=3600"
+# index.html은 매번 재검증 (ETag가 같으면 304)
+INDEX_CACHE_CONTROL = "no-cache"
+
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0: 같은 내용이면 같은 결과 (빌드 재현성)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+# (Content-Encoding, 파일 확장자, 압축 함수), 선호 순서
+ENCODINGS: List[Tuple[str, str, Callable[[bytes], bytes]]] = [("gzip", ".gz", _gzip)]
+if brotli is not None:
+    ENCODINGS.insert(0, ("br", ".br", lambda data: brotli.compress(data, quality=11)))
+
+
+def _is_compressible(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in COMPRESSIBLE_SUFFIXES
+
+
+def _source_files(directory: str):
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith((".gz", ".br")):
+                yield os.path.join(root, name)
+
+
+def precompress(directory: str) -> int:
+    """압축할 만한 파일마다 .br/.gz 파일을 만들고 만든 개수를 반환합니다 (원본보다 새 파일이 있으면 건너뜀)."""
+    written = 0
+    for path in _source_files(directory):
+        if not _is_compressible(path):
+            continue
+        source_stat = os.stat(path)
+        if source_stat.st_size < MIN_COMPRESS_SIZE:
+            continue
+        data = None
+        for _, suffix, compress in ENCODINGS:
+            target = path + suffix
+            try:
+                if os.stat(target).st_mtime >= source_stat.st_mtime:
+                    continue
+            except FileNotFoundError:
+                pass
+            if data is None:
+                with open(path, "rb") as f:
+                    data = f.read()
+            compressed = compress(data)
+            if len(compressed) >= len(data):
+                continue
+            # 다른 워커가 동시에 만들어도 반쯤 쓴 파일을 보내지 않도록 임시 파일에 쓰고 교체
+            temp = f"{target}.{os.getpid()}.tmp"
+            with open(temp, "wb") as f:
+                f.write(compressed)
+            os.replace(temp, target)
+            written += 1
+    return written
+
+
+def accepted_encodings(accept_encoding: Optional[str]) -> Set[str]:
+    """Accept-Encoding 헤더에서 받아들이는 인코딩 집합 (q=0은 제외)"""
+    accepted = set()
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if name and not re.fullmatch(r"q=0(\.0*)?", params):
+            accepted.add(name.lower())
+    return accepted
+
+
+@dataclass(frozen=True)
+class _StaticFile:
+    path: str
+    stat_result: os.stat_result
+    media_type: str
+    cache_control: str
+    # Content-Encoding → (압축 파일 경로, stat), ENCODINGS 선호 순서
+    variants: Dict[str, Tuple[str, os.stat_result]] = field(default_factory=dict)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    미리 압축된 파일과 캐시 헤더를 사용하는 StaticFiles (파일 목록은 생성 시 고정)
+    hashed=True는 Vite 자산 디렉터리(assets/)용으로, 해시 파일명의 파일에 immutable 캐시를 붙입니다.
+    """
+
+    def __init__(self, directory: str, exclude: Tuple[str, ...] = (), hashed: bool = False) -> None:
+        super().__init__(directory=directory)
+        self._files: Dict[str, _StaticFile] = {}
+        for path in _source_files(directory):
+            relative = os.path.relpath(path, directory)
+            if relative in exclude:
+                continue
+            variants = {}
+            for encoding, suffix, _ in ENCODINGS:
+                if os.path.exists(path + suffix):
+                    variants[encoding] = (path + suffix, os.stat(path + suffix))
+            self._files[relative] = _StaticFile(
+                path=path,
+                stat_result=os.stat(path),
+                media_type=mimetypes.guess_type(path)[0] or "application/octet-stream",
+                cache_control=(
+                    IMMUTABLE_CACHE_CONTROL if hashed and _HASHED_NAME.search(os.path.basename(path))
+                    else DEFAULT_CACHE_CONTROL
+                ),
+                variants=variants,
+            )
+
+    def __contains__(self, path: str) -> bool:
+        return os.path.normpath(path) in self._files
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        if scope["method"] not in ("GET", "HEAD"):
+            raise HTTPException(status_code=405, headers={"Allow": "GET, HEAD"})
+        static_file = self._files.get(path)
+        if static_file is None:
+            raise HTTPException(status_code=404)
+
+        request_headers = Headers(scope=scope)
+        full_path, stat_result = static_file.path, static_file.stat_result
+        headers = {"Cache-Control": static_file.cache_control}
+        if _is_compressible(full_path):
+            headers["Vary"] = "Accept-Encoding"
+        if static_file.variants:
+            accepted = accepted_encodings(request_headers.get("accept-encoding"))
+            for encoding, (variant_path, variant_stat) in static_file.variants.items():
+                if encoding in accepted:
+                    full_path, stat_result = variant_path, variant_stat
+                    headers["Content-Encoding"] = encoding
+                    break
+
+        # ETag는 보내는 파일(압축 파일)의 stat으로 만들어지므로 인코딩별로 다름
+        response = FileResponse(
+            full_path, stat_result=stat_result, media_type=static_file.media_type, headers=headers
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+class SpaIndex:
+    """메모리에 올려 둔 index.html (인코딩별 본문을 미리 만들어 둠)"""
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            body = f.read()
+        self.etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        self._bodies: Dict[str, bytes] = {"identity": body}
+        for encoding, _, compress in ENCODINGS:
+            compressed = compress(body)
+            if len(compressed) < len(body):
+                self._bodies[encoding] = compressed
+
+    def response(self, request_headers: Headers) -> Response:
+        headers = {"Cache-Control": INDEX_CACHE_CONTROL, "ETag": self.etag, "Vary": "Accept-Encoding"}
+        if_none_match = request_headers.get("if-none-match")
+        if if_none_match and self.etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+            return Response(status_code=304, headers=headers)
+
+        accepted = accepted_encodings(request_headers.get("accept-encoding"))
+        encoding = next((e for e, _, _ in ENCODINGS if e in accepted and e in self._bodies), "identity")
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(self._bodies[encoding], media_type="text/html", headers=headers)
+
+
+if __name__ == "__main__":
+    # Docker 빌드 단계에서 실행: python -m static_files static
+    target = sys.argv[1] if len(sys.argv) > 1 else "static"
+    print(f"{precompress(target)}개 파일 압축 ({', '.join(e for e, _, _ in ENCODINGS)})")
@@ -0,0 +1,73 @@
+"""
+테스트 공통 설정
+임시 디렉터리에 primary SQLite 파일과 그 복사본인 복제본 파일을 만들어 READ_DATABASE_URL로 사용합니다.
+복제본은 테스트 중에 갱신되지 않으므로 복제 지연이 아주 긴 상황과 같습니다.
+쓴 뒤에 primary에서 읽는 시간(REPLICA_STICKY_SECONDS)은 테스트가 끝날 때까지로 늘려,
+앞선 테스트가 쓴 카탈로그/진행 상태를 뒤의 테스트가 복제본에서 오래된 값으로 읽지 않게 합니다.
+설정은 모듈 import 시점에 읽히므로 앱 모듈을 import하기 전에 환경 변수를 지정합니다.
+"""
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+TEMP_DIR = tempfile.mkdtemp(prefix="hanja-test-")
+PRIMARY_PATH = os.path.join(TEMP_DIR, "primary.db")
+REPLICA_PATH = os.path.join(TEMP_DIR, "replica.db")
+
+for name in ("ASYNC_DATABASE_URL", "ASYNC_READ_DATABASE_URL", "DATABASE_SCHEMA"):
+    os.environ.pop(name, None)
+os.environ.update(
+    DATABASE_URL=f"sqlite:///{PRIMARY_PATH}",
+    READ_DATABASE_URL=f"sqlite:///{REPLICA_PATH}",
+    USE_ASYNC_DB="false",
+    AUTO_MIGRATE="false",
+    PROGRESS_WRITE_BEHIND="false",
+    CATALOG_SYNC="off",
+    WEB_CONCURRENCY="1",
+    REPLICA_STICKY_SECONDS="3600",
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """샘플 데이터가 들어간 primary를 만들고 복제본으로 복사합니다."""
+    from catalog_cache import catalog_cache
+    from database import engine
+    from init_db import init_db
+
+    init_db()
+    engine.dispose()
+    # WAL에 남은 내용을 본 파일에 반영한 뒤 복사
+    with sqlite3.connect(PRIMARY_PATH) as conn:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    shutil.copyfile(PRIMARY_PATH, REPLICA_PATH)
+    catalog_cache.invalidate()
+    yield
+    shutil.rmtree(TEMP_DIR, ignore_errors=True)
+
+
+@pytest.fixture
+def client():
+    from fastapi.testclient import TestClient
+    import main
+
+    return TestClient(main.app)
+
+
+@pytest.fixture
+def db():
+    """primary 세션"""
+    from database import SessionLocal
+
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,27 @@
+from catalog_cache import catalog_cache
+
+
+def test_catalog_is_served_from_cache(client):
+    """두 번째 조회는 DB를 다시 읽지 않고 같은 스냅샷을 사용해야 함"""
+    assert client.get("/api/hanja").status_code == 200
+    before = catalog_cache.stats()
+    response = client.get("/api/hanja/chapter/2")
+    assert response.status_code == 200
+    assert {h["id"] for h in response.json()["hanja"]} >= {"7", "8", "9", "10"}
+    after = catalog_cache.stats()
+    assert after["misses"] == before["misses"]
+    assert after["hits"] > before["hits"]
+    assert after["version"] == before["version"]
+
+
+def test_catalog_write_invalidates_cache(client):
+    """한자를 수정하면 버전이 올라가고 다음 조회에 수정 내용이 보여야 함"""
+    original = client.get("/api/hanja/10").json()["meaning"]
+    version = catalog_cache.version
+    try:
+        assert client.put("/api/hanja/10", json={"meaning": "나무 목"}).status_code == 200
+        assert catalog_cache.version > version
+        chapter = client.get("/api/hanja/chapter/2").json()["hanja"]
+        assert next(h for h in chapter if h["id"] == "10")["meaning"] == "나무 목"
+    finally:
+        client.put("/api/hanja/10", json={"meaning": original})
@@ -0,0 +1,27 @@
+def test_catalog_etag_returns_304(client):
+    """If-None-Match가 현재 ETag와 같으면 본문 없이 304를 반환해야 함 (weak 비교 포함)"""
+    response = client.get("/api/hanja")
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.json()["hanja"]
+
+    for header in (etag, f"W/{etag}", f'"other", {etag}'):
+        cached = client.get("/api/hanja", headers={"If-None-Match": header})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+
+
+def test_catalog_etag_changes_after_write(client):
+    """카탈로그를 수정하면 ETag가 바뀌어 이전 ETag로는 200과 새 본문을 받아야 함"""
+    response = client.get("/api/hanja/9")
+    etag, original = response.headers["etag"], response.json()["meaning"]
+    assert client.get("/api/hanja/9", headers={"If-None-Match": etag}).status_code == 304
+    try:
+        assert client.put("/api/hanja/9", json={"meaning": "불 화"}).status_code == 200
+        refreshed = client.get("/api/hanja/9", headers={"If-None-Match": etag})
+        assert refreshed.status_code == 200
+        assert refreshed.json()["meaning"] == "불 화"
+        assert refreshed.headers["etag"] != etag
+    finally:
+        client.put("/api/hanja/9", json={"meaning": original})
@@ -0,0 +1,35 @@
+import io
+
+import pytest
+from sqlalchemy import select
+
+from catalog import Progress, detect_format, import_chunked, read_records
+from models import HanjaModel
+
+
+def test_csv_without_examples_keeps_existing_examples(db):
+    """examples/strokeOrder 열이 없는 CSV는 기존 한자의 예문과 획순을 지우지 않아야 함"""
+    existing = db.get(HanjaModel, "1")
+    examples, stroke_order = existing.examples, existing.stroke_order
+    assert examples
+    stream = io.StringIO(
+        "character,sound,meaning,chapter,difficulty\n"
+        f"{existing.character},{existing.sound},새 뜻,{existing.chapter},{existing.difficulty}\n"
+        "澔,호,넓을,1,3\n"
+    )
+
+    import_chunked(db, read_records(stream, "csv"), 100, Progress())
+
+    db.expire_all()
+    updated = db.get(HanjaModel, "1")
+    assert updated.meaning == "새 뜻"
+    assert updated.examples == examples
+    assert updated.stroke_order == stroke_order
+    added = db.scalars(select(HanjaModel).where(HanjaModel.character == "澔")).one()
+    assert added.examples == [] and added.stroke_order == []
+
+
+def test_json_array_files_are_not_read_as_jsonl():
+    """.json(JSON 배열)은 JSONL로 읽지 않고 형식을 지정하도록 안내해야 함"""
+    with pytest.raises(SystemExit, match="--format"):
+        detect_format("hanja.json", None)
@@ -0,0 +1,63 @@
+import asyncio
+import os
+
+from catalog_cache import CatalogCache
+from catalog_sync import WORKER_ID, CatalogSync
+from database import SessionLocal
+
+
+def test_stamp_written_after_commit(tmp_path):
+    """file 방식은 커밋이 끝난 뒤에 스탬프 파일을 써야 함 (커밋 전에 알리면 다른 워커가 수정 전 데이터를 캐시함)"""
+    stamp = str(tmp_path / "catalog.stamp")
+    sync = CatalogSync(CatalogCache(), "file", stamp_file=stamp)
+
+    with SessionLocal() as session:
+        sync.publish(session)
+        assert not os.path.exists(stamp)
+        session.commit()
+    assert os.path.exists(stamp)
+    assert sync.sent == 1
+
+
+def test_other_worker_invalidates_on_new_stamp(tmp_path):
+    """다른 워커가 스탬프를 새로 쓰면 폴링하는 워커의 카탈로그 버전이 올라가야 함"""
+    stamp = str(tmp_path / "catalog.stamp")
+    writer = CatalogSync(CatalogCache(), "file", stamp_file=stamp)
+    reader_cache = CatalogCache()
+    reader = CatalogSync(reader_cache, "file", stamp_file=stamp, interval_ms=10)
+
+    async def scenario():
+        reader.start()
+        try:
+            await asyncio.sleep(0.05)
+            assert reader.received == 0
+            writer._write_stamp()
+            for _ in range(100):
+                if reader.received:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            await reader.stop()
+
+    asyncio.run(scenario())
+    assert reader.received == 1
+    assert reader_cache.version == 1
+
+
+def test_notify_ignores_own_worker():
+    """notify 방식은 자기 워커가 보낸 알림은 무시하고 다른 워커의 알림만 반영해야 함"""
+    cache = CatalogCache()
+    sync = CatalogSync(cache, "notify")
+    sync._on_notify(None, 1, "hanja_catalog", WORKER_ID)
+    assert cache.version == 0
+    sync._on_notify(None, 1, "hanja_catalog", "other-worker")
+    assert cache.version == 1 and sync.received == 1
+
+
+def test_notify_is_skipped_outside_postgresql():
+    """PostgreSQL이 아니면 notify 방식의 publish는 아무것도 보내지 않아야 함"""
+    sync = CatalogSync(CatalogCache(), "notify")
+    with SessionLocal() as session:
+        sync.publish(session)
+        session.commit()
+    assert sync.sent == 0
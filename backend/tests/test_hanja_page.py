@@ -0,0 +1,33 @@
+from sqlalchemy import select
+
+from models import HanjaModel
+
+
+def test_keyset_pages_cover_catalog_in_order(client, db):
+    """next 커서를 따라가면 (chapter, id) 순서로 모든 한자를 한 번씩만 받아야 함"""
+    expected = db.execute(select(HanjaModel.id).order_by(HanjaModel.chapter, HanjaModel.id)).scalars().all()
+    db.commit()  # 쓰기 연결은 하나뿐이므로 요청 전에 반납
+
+    seen, params = [], {"limit": 5, "fields": "character,sound"}
+    while True:
+        page = client.get("/api/hanja", params=params).json()
+        assert all(set(h) == {"id", "character", "sound"} for h in page["hanja"])
+        seen.extend(h["id"] for h in page["hanja"])
+        if page["next"] is None:
+            break
+        params = {**params, "after": page["next"]}
+    assert seen == expected
+
+
+def test_last_page_has_no_next(client):
+    """limit보다 적게 남은 페이지는 next가 없어야 함"""
+    page = client.get("/api/hanja", params={"limit": 1000}).json()
+    assert page["next"] is None
+    assert "examples" in page["hanja"][0]
+
+
+def test_invalid_cursor_and_fields_are_rejected(client):
+    """잘못된 커서나 알 수 없는 필드는 400을 반환해야 함"""
+    assert client.get("/api/hanja", params={"after": "abc"}).status_code == 400
+    assert client.get("/api/hanja", params={"after": "1,"}).status_code == 400
+    assert client.get("/api/hanja", params={"fields": "character,password"}).status_code == 400
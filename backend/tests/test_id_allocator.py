@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import select
+
+from database import SessionLocal
+from id_allocator import allocate_hanja_id, reserve_hanja_ids
+from models import HanjaModel
+
+
+def test_allocated_ids_follow_existing_ids(db):
+    """발급한 ID는 숫자이고 기존 한자 ID와 겹치지 않아야 함"""
+    existing = set(db.scalars(select(HanjaModel.id)).all())
+    allocated = allocate_hanja_id(db)
+    db.commit()
+    assert allocated.isdigit()
+    assert allocated not in existing
+    assert int(allocated) > max(int(i) for i in existing if i.isdigit())
+
+
+def test_concurrent_block_reservations_do_not_overlap():
+    """여러 요청이 동시에 블록을 예약해도 ID가 겹치지 않고 블록 안에서는 연속이어야 함"""
+    def reserve(_):
+        with SessionLocal() as session:
+            ids = reserve_hanja_ids(session, 25)
+            session.commit()
+            return ids
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        blocks = list(pool.map(reserve, range(16)))
+
+    all_ids = [int(i) for block in blocks for i in block]
+    assert len(all_ids) == len(set(all_ids)) == 16 * 25
+    for block in blocks:
+        numbers = [int(i) for i in block]
+        assert numbers == list(range(numbers[0], numbers[0] + 25))
+
+
+def test_create_hanja_uses_allocator(client):
+    """ID 없이 만든 한자는 발급기에서 받은 새 ID를 가져야 함"""
+    response = client.post("/api/hanja", json={
+        "character": "森", "sound": "삼", "meaning": "수풀", "chapter": 9, "difficulty": 2,
+        "examples": [], "strokeOrder": [],
+    })
+    assert response.status_code == 201
+    created = response.json()["id"]
+    assert created.isdigit()
+    assert client.delete(f"/api/hanja/{created}").status_code == 204
@@ -0,0 +1,20 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from metrics import MetricsRegistry, install_sql_hooks
+
+
+def test_failed_statement_pops_query_timer():
+    """실패한 SQL 문도 시작 시각을 꺼내야 다음 문장의 시간이 어긋나지 않음"""
+    engine = create_engine("sqlite://")
+    metrics = MetricsRegistry()
+    install_sql_hooks(engine, metrics)
+
+    with engine.connect() as conn:
+        with pytest.raises(OperationalError):
+            conn.execute(text("SELECT * FROM missing_table"))
+        assert conn.info["query_started"] == []
+        conn.execute(text("SELECT 1"))
+        assert conn.info["query_started"] == []
+    assert metrics.queries_outside_requests == 2
@@ -0,0 +1,43 @@
+from main import MAX_PROGRESS_BATCH_SIZE
+
+
+def test_study_batch_saves_all_items_and_merges_duplicates(client):
+    """배치의 모든 항목을 저장하고, 같은 한자가 여러 번 오면 마지막 값이 남아야 함"""
+    user_id = "batch-user"
+    response = client.post("/api/study-progress/batch", json=[
+        {"user_id": user_id, "hanja_id": "1", "chapter": 1, "is_known": False},
+        {"user_id": user_id, "hanja_id": "7", "chapter": 2, "is_known": True},
+        {"user_id": user_id, "hanja_id": "1", "chapter": 1, "is_known": True},
+    ])
+    assert response.status_code == 200
+
+    saved = client.get(f"/api/study-progress/{user_id}").json()["progress"]
+    assert {(p["hanja_id"], p["is_known"]) for p in saved} == {("1", True), ("7", True)}
+
+
+def test_practice_batch_updates_existing_rows(client):
+    """연습 배치는 기존 행을 갱신하고 새 행을 추가해야 함"""
+    user_id = "batch-practice-user"
+    item = {"user_id": user_id, "hanja_id": "8", "chapter": 2, "is_known": False}
+    assert client.post("/api/practice-progress", json=item).status_code == 201
+
+    response = client.post("/api/practice-progress/batch", json=[
+        {**item, "is_known": True},
+        {"user_id": user_id, "hanja_id": "9", "chapter": 2, "is_known": False},
+    ])
+    assert response.status_code == 200
+
+    saved = client.get(f"/api/practice-progress/{user_id}/chapter/2").json()["progress"]
+    assert {(p["hanja_id"], p["is_known"]) for p in saved} == {("8", True), ("9", False)}
+
+
+def test_batch_rejects_oversized_requests(client):
+    """최대 개수를 넘는 배치는 저장하지 않고 400을 반환해야 함"""
+    user_id = "batch-limit-user"
+    items = [
+        {"user_id": user_id, "hanja_id": str(i), "chapter": 1, "is_known": True}
+        for i in range(MAX_PROGRESS_BATCH_SIZE + 1)
+    ]
+    response = client.post("/api/study-progress/batch", json=items)
+    assert response.status_code == 400
+    assert client.get(f"/api/study-progress/{user_id}").json()["progress"] == []
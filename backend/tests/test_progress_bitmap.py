@@ -0,0 +1,24 @@
+from sqlalchemy import select
+
+from models import StudyProgressModel
+
+
+def test_bitmap_save_keeps_rows_it_cannot_represent(client, db):
+    """비트맵 저장은 숫자가 아닌 ID의 기록을 지우지 않고, 비트맵에서 빠진 숫자 ID 기록만 지워야 함"""
+    user_id = "bitmap-user"
+    response = client.post("/api/study-progress", json={
+        "user_id": user_id, "hanja_id": "1", "chapter": 1, "is_known": True,
+    })
+    assert response.status_code == 201
+    db.add(StudyProgressModel(user_id=user_id, hanja_id="legacy-1", chapter=1, is_known=True))
+    db.commit()
+
+    bitmap = client.get(f"/api/study-progress/{user_id}/bitmap").json()
+    response = client.put(f"/api/study-progress/{user_id}/bitmap", json={
+        "catalog_version": bitmap["catalog_version"], "known": "", "unknown": "",
+    })
+    assert response.status_code == 200
+
+    db.expire_all()
+    remaining = db.scalars(select(StudyProgressModel.hanja_id).where(StudyProgressModel.user_id == user_id)).all()
+    assert remaining == ["legacy-1"]
@@ -0,0 +1,70 @@
+from sqlalchemy import event, select
+
+import crud
+from models import ProgressCounterModel, StudyProgressModel
+
+
+def _counters(db, user_id):
+    rows = db.execute(
+        select(ProgressCounterModel.mode, ProgressCounterModel.chapter,
+               ProgressCounterModel.known_count, ProgressCounterModel.unknown_count)
+        .where(ProgressCounterModel.user_id == user_id)
+    )
+    return {(mode, chapter): (known, unknown) for mode, chapter, known, unknown in rows if known or unknown}
+
+
+def test_counters_match_rows_after_inserts_and_updates(db):
+    """새 행 삽입, 값 변경, 같은 배치 재전송을 섞어도 카운터가 진행 상태 행과 같아야 함"""
+    user_id = "counter-user"
+
+    crud.upsert_study_progress(db, {"user_id": user_id, "hanja_id": "1", "chapter": 1, "is_known": False})
+    batch = [
+        {"user_id": user_id, "hanja_id": "1", "chapter": 1, "is_known": True},
+        {"user_id": user_id, "hanja_id": "2", "chapter": 1, "is_known": False},
+        {"user_id": user_id, "hanja_id": "7", "chapter": 2, "is_known": True},
+        {"user_id": user_id, "hanja_id": "2", "chapter": 1, "is_known": True},
+    ]
+    crud.upsert_study_progress_batch(db, batch)
+    crud.upsert_study_progress_batch(db, batch)
+    assert _counters(db, user_id) == {("study", 1): (2, 0), ("study", 2): (1, 0)}
+
+    crud.rebuild_progress_counters(db)
+    db.commit()
+    assert _counters(db, user_id) == {("study", 1): (2, 0), ("study", 2): (1, 0)}
+
+
+def test_update_path_runs_one_upsert_statement(db):
+    """기존 행 변경은 기존 행 조회 + upsert 한 문장 + 카운터 upsert로 끝나야 함 (UPDATE를 따로 보내지 않음)"""
+    from database import engine
+
+    user_id = "statement-user"
+    crud.upsert_study_progress(db, {"user_id": user_id, "hanja_id": "3", "chapter": 1, "is_known": False})
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith(("BEGIN", "PRAGMA")):
+            statements.append(statement.split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        crud.upsert_study_progress(db, {"user_id": user_id, "hanja_id": "3", "chapter": 1, "is_known": True})
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert statements == ["SELECT", "INSERT", "INSERT"]
+    assert _counters(db, user_id) == {("study", 1): (1, 0)}
+
+
+def test_postgresql_upsert_returns_previous_values_in_one_statement():
+    """PostgreSQL은 기존 행 잠금, upsert, 이전 값 반환을 한 문장으로 실행해야 함"""
+    from sqlalchemy.dialects import postgresql
+
+    stmt = crud._postgresql_upsert_statement(StudyProgressModel, [
+        {"user_id": "u", "hanja_id": "1", "chapter": 1, "is_known": True},
+        {"user_id": "u", "hanja_id": "2", "chapter": 1, "is_known": False},
+    ])
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("WITH old_progress AS")
+    assert "FOR UPDATE" in sql and "ON CONFLICT (user_id, hanja_id) DO UPDATE" in sql
+    assert "xmax = 0 AS inserted" in sql and "AS old_is_known" in sql
+    assert ";" not in sql
@@ -0,0 +1,28 @@
+from quiz import build_quiz_pools, generate_quiz
+from schemas import Hanja
+
+
+def _hanja(hanja_id: str, character: str, sound: str, meaning: str) -> Hanja:
+    return Hanja(
+        id=hanja_id, character=character, sound=sound, meaning=meaning,
+        strokeOrder=[], examples=[], chapter=1, difficulty=1,
+    )
+
+
+def test_distractors_skip_hanja_with_same_prompt():
+    """음이 같은 한자는 음 -> 한자 문제의 오답 보기로 나오지 않아야 함"""
+    hanja_list = [
+        _hanja("1", "水", "수", "물"),
+        _hanja("2", "手", "수", "손"),
+        _hanja("3", "火", "화", "불"),
+        _hanja("4", "木", "목", "나무"),
+        _hanja("5", "金", "금", "쇠"),
+    ]
+    pools = build_quiz_pools(hanja_list)
+
+    for seed in range(50):
+        quiz = generate_quiz(hanja_list[:2], pools, "sound-to-character", 2, choices=4, seed=seed)
+        for question in quiz["questions"]:
+            assert question["prompt"] == "수"
+            assert {"水", "手"} & set(question["choices"]) == {question["choices"][question["answer_index"]]}
+            assert len(question["choices"]) == 4
@@ -0,0 +1,27 @@
+import main
+
+
+def test_readyz_waits_for_catalog(client, monkeypatch):
+    """카탈로그를 로드하기 전에는 /healthz만 200이고 /readyz는 503이어야 함"""
+    monkeypatch.setitem(main.startup_state, "catalog_loaded", False)
+    monkeypatch.setitem(main.startup_state, "error", "catalog not loaded")
+    assert client.get("/healthz").status_code == 200
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    assert response.json() == {"status": "starting", "error": "catalog not loaded"}
+
+
+def test_readyz_checks_database(client, monkeypatch):
+    """카탈로그를 로드했으면 DB 연결 여부에 따라 200 또는 503이어야 함"""
+    monkeypatch.setitem(main.startup_state, "catalog_loaded", True)
+    response = client.get("/readyz")
+    assert response.status_code == 200
+    assert response.json()["status"] == "ready"
+
+    def unreachable():
+        raise ConnectionError("database is down")
+
+    monkeypatch.setattr(main, "_ping_database", unreachable)
+    response = client.get("/readyz")
+    assert response.status_code == 503
+    assert response.json() == {"status": "unavailable", "error": "database is down"}
@@ -0,0 +1,16 @@
+from catalog_cache import catalog_cache
+
+
+def test_catalog_reload_after_write_reads_primary(client):
+    """카탈로그를 쓴 직후 사용자별 API에서 다시 로드해도 복제본이 아닌 primary의 내용이어야 함"""
+    assert client.get("/api/hanja").status_code == 200
+    response = client.post("/api/hanja", json={
+        "character": "新", "sound": "신", "meaning": "새", "chapter": 1, "difficulty": 2,
+    })
+    assert response.status_code == 201
+    hanja_id = response.json()["id"]
+
+    assert client.get("/api/stats/replica-user").status_code == 200
+    snapshot = catalog_cache.current()
+    assert snapshot is not None
+    assert hanja_id in snapshot.by_id
@@ -0,0 +1,8 @@
+def test_first_reviews_of_same_card_update_one_row(client):
+    """같은 카드의 첫 복습이 연달아 들어와도 두 번째는 첫 번째가 만든 행을 갱신해야 함"""
+    review = {"user_id": "review-user", "hanja_id": "3", "chapter": 1, "grade": 4}
+    first = client.post("/api/review", json=review)
+    second = client.post("/api/review", json=review)
+    assert first.status_code == second.status_code == 201
+    assert first.json()["repetitions"] == 1
+    assert second.json()["repetitions"] == 2
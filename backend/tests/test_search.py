@@ -0,0 +1,31 @@
+import pytest
+
+from catalog_cache import catalog_cache
+from crud import _search_hanja_trgm, search_hanja
+
+
+def _ids(results):
+    return [h.id for h in results]
+
+
+def test_character_match_ranks_first(db):
+    """검색어의 글자와 같은 한자가 음/뜻/예문 일치보다 앞에 와야 함"""
+    results = _ids(search_hanja(db, "二 一"))
+    assert results[:2] == ["1", "2"]
+
+
+def test_choseong_query_matches_sound_and_meaning(db):
+    """자음만 입력하면 음 또는 뜻의 초성으로 찾아야 함"""
+    assert set(_ids(search_hanja(db, "ㅅ"))) >= {"3", "6", "7", "8"}
+    assert _ids(search_hanja(db, "ㄱ", limit=2)) == ["11", "12"]
+
+
+@pytest.mark.parametrize("query", ["一二", "二 一", "가", "이", "산", "一石"])
+def test_memory_and_sql_backends_rank_alike(db, query):
+    """인메모리 인덱스와 SQL(pg_trgm) 검색이 같은 한자를 같은 순위 규칙으로 찾아야 함"""
+    catalog_cache.invalidate()  # 다른 테스트가 캐시를 거치지 않고 바꾼 행도 양쪽에서 같게 보이도록
+    memory = search_hanja(db, query, limit=50)
+    sql = _search_hanja_trgm(db, query, limit=50)
+    assert set(_ids(memory)) == set(_ids(sql))
+    # 같은 순위 안의 정렬(단원, ID)은 ID 비교 방식이 달라 순서 대신 단원만 비교
+    assert [h.chapter for h in memory] == [h.chapter for h in sql]
@@ -0,0 +1,83 @@
+import threading
+import time
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from config import Settings
+from database import engine_options, install_sqlite_pragmas
+
+
+def _engine(url, read_only=False):
+    engine = create_engine(url, **engine_options(url, read_only=read_only))
+    install_sqlite_pragmas(engine, read_only=read_only)
+    return engine
+
+
+@pytest.fixture
+def sqlite_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'edge.db'}"
+    writer = _engine(url)
+    with writer.begin() as conn:
+        conn.execute(text("CREATE TABLE counter (n INTEGER NOT NULL)"))
+        conn.execute(text("INSERT INTO counter VALUES (0)"))
+    writer.dispose()
+    return url
+
+
+def test_database_url_is_required(monkeypatch):
+    """DATABASE_URL이 없으면 SQLite로 조용히 시작하지 않고 설정 오류가 나야 함"""
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    with pytest.raises(ValidationError):
+        Settings(_env_file=None)
+
+
+def test_writer_and_reader_pragmas(sqlite_url):
+    """쓰기 엔진은 WAL과 연결 하나, 읽기 엔진은 query_only 연결 풀이어야 함"""
+    writer, reader = _engine(sqlite_url), _engine(sqlite_url, read_only=True)
+    try:
+        assert writer.pool.size() == 1
+        with writer.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+        with reader.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA query_only").scalar() == 1
+            with pytest.raises(OperationalError):
+                conn.execute(text("UPDATE counter SET n = n + 1"))
+    finally:
+        writer.dispose()
+        reader.dispose()
+
+
+def test_writers_in_separate_processes_wait_instead_of_failing(sqlite_url):
+    """
+    다른 프로세스(엔진)의 읽고-쓰기 트랜잭션이 겹쳐도 BEGIN IMMEDIATE로 차례를 기다려
+    database is locked 없이 모두 반영되어야 함
+    """
+    engines = [_engine(sqlite_url) for _ in range(4)]
+    errors = []
+
+    def increment(engine):
+        try:
+            for _ in range(5):
+                with engine.begin() as conn:
+                    n = conn.execute(text("SELECT n FROM counter")).scalar()
+                    time.sleep(0.005)
+                    conn.execute(text("UPDATE counter SET n = :n"), {"n": n + 1})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=increment, args=(engine,)) for engine in engines]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    try:
+        assert errors == []
+        with engines[0].connect() as conn:
+            assert conn.execute(text("SELECT n FROM counter")).scalar() == 20
+    finally:
+        for engine in engines:
+            engine.dispose()
@@ -0,0 +1,25 @@
+import asyncio
+
+from static_files import DEFAULT_CACHE_CONTROL, IMMUTABLE_CACHE_CONTROL, PrecompressedStaticFiles
+
+
+def _cache_control(files, path):
+    scope = {"type": "http", "method": "GET", "headers": []}
+    return asyncio.run(files.get_response(path, scope)).headers["cache-control"]
+
+
+def test_only_vite_hashed_assets_are_immutable(tmp_path):
+    """assets/의 Vite 해시 파일만 immutable이고, 하이픈이 들어간 일반 파일명은 짧은 캐시여야 함"""
+    assets = tmp_path / "assets"
+    assets.mkdir()
+    for name in ("index-B3xk_9Qa.js", "logo-Dk3_aZ9x.svg", "icon-background.png"):
+        (assets / name).write_text("x")
+    (tmp_path / "apple-touch-icon.png").write_bytes(b"x")
+
+    hashed = PrecompressedStaticFiles(str(assets), hashed=True)
+    assert _cache_control(hashed, "index-B3xk_9Qa.js") == IMMUTABLE_CACHE_CONTROL
+    assert _cache_control(hashed, "logo-Dk3_aZ9x.svg") == IMMUTABLE_CACHE_CONTROL
+    assert _cache_control(hashed, "icon-background.png") == DEFAULT_CACHE_CONTROL
+
+    root = PrecompressedStaticFiles(str(tmp_path))
+    assert _cache_control(root, "apple-touch-icon.png") == DEFAULT_CACHE_CONTROL
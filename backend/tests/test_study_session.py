@@ -0,0 +1,40 @@
+def _ids(session):
+    return [card["id"] for card in session["cards"]]
+
+
+def test_study_session_returns_chapter_cards_and_progress(client):
+    """학습 세션은 단원 카드를 카탈로그 순서로 주고, review면 모름 표시한 한자만 줘야 함"""
+    user_id = "session-user"
+    client.post("/api/study-progress/batch", json=[
+        {"user_id": user_id, "hanja_id": "1", "chapter": 1, "is_known": True},
+        {"user_id": user_id, "hanja_id": "3", "chapter": 1, "is_known": False},
+        {"user_id": user_id, "hanja_id": "7", "chapter": 2, "is_known": False},
+    ])
+
+    chapter = [h["id"] for h in client.get("/api/hanja/chapter/1").json()["hanja"]]
+    session = client.get(f"/api/session/{user_id}", params={"chapter": 1}).json()
+    assert _ids(session) == chapter
+    assert {"1", "2", "3", "4", "5", "6"} <= set(chapter)
+    assert session["known_ids"] == ["1"] and session["unknown_ids"] == ["3"]
+
+    review = client.get(f"/api/session/{user_id}", params={"chapter": 1, "review": True}).json()
+    assert _ids(review) == ["3"]
+
+
+def test_practice_session_is_seeded_and_limited_to_studied(client):
+    """연습(전체) 세션은 학습한 한자만 고르고 같은 seed면 같은 순서여야 함"""
+    user_id = "session-practice-user"
+    client.post("/api/study-progress/batch", json=[
+        {"user_id": user_id, "hanja_id": hanja_id, "chapter": 1, "is_known": True} for hanja_id in "12345"
+    ])
+    params = {"mode": "practice", "seed": 7}
+    first = client.get(f"/api/session/{user_id}", params=params).json()
+    second = client.get(f"/api/session/{user_id}", params=params).json()
+    assert sorted(_ids(first)) == ["1", "2", "3", "4", "5"]
+    assert _ids(first) == _ids(second)
+    assert first["seed"] == 7
+
+
+def test_study_session_requires_chapter(client):
+    """학습 모드에서 단원이 없으면 400이어야 함"""
+    assert client.get("/api/session/session-user").status_code == 400
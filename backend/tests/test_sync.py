@@ -0,0 +1,46 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+
+from models import PracticeProgressModel, StudyProgressModel
+
+
+def _age_rows(db, user_id):
+    """이미 받은 행을 한 시간 전에 바뀐 것으로 만들어 워터마크 겹침 구간 밖으로 보냄"""
+    past = datetime.now(timezone.utc) - timedelta(hours=1)
+    for model in (StudyProgressModel, PracticeProgressModel):
+        db.execute(update(model).where(model.user_id == user_id).values(updated_at=past))
+    db.commit()
+
+
+def test_sync_returns_only_changes_and_tombstones(client, db):
+    """since 이후 바뀐 행과 삭제 기록만 반환하고, 다시 저장된 항목은 삭제 기록에서 빠져야 함"""
+    user_id = "sync-user"
+    client.post("/api/study-progress/batch", json=[
+        {"user_id": user_id, "hanja_id": "1", "chapter": 1, "is_known": False},
+        {"user_id": user_id, "hanja_id": "2", "chapter": 1, "is_known": True},
+    ])
+    client.post("/api/practice-progress", json={"user_id": user_id, "hanja_id": "7", "chapter": 2, "is_known": True})
+
+    full = client.get(f"/api/sync/{user_id}").json()
+    assert full["full"] is True
+    assert {p["hanja_id"] for p in full["study"]} == {"1", "2"}
+    assert [p["hanja_id"] for p in full["practice"]] == ["7"]
+    assert full["deleted"] == []
+    _age_rows(db, user_id)
+
+    client.put(f"/api/study-progress/{user_id}/hanja/1",
+               json={"user_id": user_id, "hanja_id": "1", "chapter": 1, "is_known": True})
+    assert client.delete(f"/api/study-progress/{user_id}/hanja/2").status_code == 204
+
+    delta = client.get(f"/api/sync/{user_id}", params={"since": full["watermark"]}).json()
+    assert delta["full"] is False
+    assert [(p["hanja_id"], p["is_known"]) for p in delta["study"]] == [("1", True)]
+    assert delta["practice"] == []
+    assert delta["deleted"] == [{"mode": "study", "hanja_id": "2", "chapter": 1}]
+    assert delta["watermark"] >= full["watermark"]
+
+    client.post("/api/study-progress", json={"user_id": user_id, "hanja_id": "2", "chapter": 1, "is_known": False})
+    again = client.get(f"/api/sync/{user_id}", params={"since": full["watermark"]}).json()
+    assert {p["hanja_id"] for p in again["study"]} == {"1", "2"}
+    assert again["deleted"] == []
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+
+import main
+from database import SessionLocal
+from models import StudyProgressModel
+from write_behind import MAX_FLUSH_ATTEMPTS, ProgressBuffer
+
+
+def _saved(db, user_id):
+    db.expire_all()
+    rows = db.execute(
+        select(StudyProgressModel.hanja_id, StudyProgressModel.is_known).where(StudyProgressModel.user_id == user_id)
+    ).all()
+    db.commit()  # 쓰기 연결은 하나뿐이므로 바로 반납
+    return dict(rows)
+
+
+def _item(user_id, hanja_id, is_known=True, chapter=1):
+    return {"user_id": user_id, "hanja_id": hanja_id, "chapter": chapter, "is_known": is_known}
+
+
+@pytest.fixture
+def buffer(monkeypatch):
+    buffer = ProgressBuffer(session_factory=SessionLocal)
+    monkeypatch.setattr(main, "progress_buffer", buffer)
+    return buffer
+
+
+def test_reads_see_buffered_writes_and_flush_only_that_user(client, db, buffer):
+    """저장 직후 조회에 버퍼 값이 보이고, DB를 읽는 요청은 그 사용자의 항목만 저장해야 함"""
+    assert client.post("/api/study-progress", json=_item("wb-reader", "1")).status_code == 201
+    buffer.add("study", [_item("wb-other", "2")])
+    assert _saved(db, "wb-reader") == {}
+
+    listed = client.get("/api/study-progress/wb-reader").json()["progress"]
+    assert [(p["hanja_id"], p["is_known"]) for p in listed] == [("1", True)]
+
+    assert client.get("/api/stats/wb-reader").status_code == 200
+    assert _saved(db, "wb-reader") == {"1": True}
+    assert buffer.buffered("study", "wb-other") and _saved(db, "wb-other") == {}
+
+
+def test_failing_row_is_isolated_then_dropped(db, buffer):
+    """저장할 수 없는 행은 다른 행을 막지 않고 버퍼에 남았다가 재시도 한도 뒤에 버려져야 함"""
+    buffer.add("study", [_item("wb-good", "3"), _item("wb-bad", "4", chapter=None), _item("wb-good", "5", False)])
+
+    assert asyncio.run(buffer.flush()) == 1
+    assert _saved(db, "wb-good") == {"3": True, "5": False}
+    assert list(buffer.buffered("study", "wb-bad")) == ["4"]
+
+    for _ in range(MAX_FLUSH_ATTEMPTS - 1):
+        asyncio.run(buffer.flush())
+    assert len(buffer) == 0
+    assert buffer.stats()["dropped_entries"] == 1
+
+
+def test_stop_flushes_remaining_entries(db, buffer):
+    """종료할 때 남은 항목을 모두 저장해야 함"""
+    buffer.add("study", [_item("wb-shutdown", "6"), _item("wb-shutdown", "7", False, chapter=2)])
+    asyncio.run(buffer.stop())
+    assert len(buffer) == 0
+    assert _saved(db, "wb-shutdown") == {"6": True, "7": False}
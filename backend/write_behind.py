@@ -0,0 +1,247 @@
+"""
+진행 상태 write-behind 버퍼 (PROGRESS_WRITE_BEHIND=true)
+진행 상태 저장 요청을 바로 커밋하지 않고 (모드, user_id, hanja_id)별 마지막 값만 메모리에 모아 두었다가,
+백그라운드 작업이 write_behind_interval_ms마다 또는 write_behind_max_entries개가 쌓이면
+모드별 다중 행 upsert 한 번으로 저장합니다 (그룹 커밋). 요청마다 하던 커밋/WAL 쓰기가 주기당 한 번으로 줄어듭니다.
+- 읽기: 같은 사용자의 버퍼 내용을 조회 결과에 덮어써서 방금 저장한 값이 보이게 합니다.
+  DB에서 바로 읽어야 하는 조회는 그 사용자의 항목만 먼저 저장합니다.
+- 실패: 청크마다 따로 저장하고, 실패한 청크는 한 행씩 다시 저장해 문제 있는 행만 버퍼에 남깁니다.
+  같은 항목이 MAX_FLUSH_ATTEMPTS번 연속 실패하면 버리고 로그에 남깁니다 (DB 연결 오류는 청크째 다음 주기에 재시도).
+- 종료: lifespan에서 남은 항목을 모두 저장한 뒤 끝납니다.
+- 프로세스가 비정상 종료되면 아직 저장하지 않은 최대 한 주기 분량의 쓰기는 유실됩니다.
+"""
+import asyncio
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+import crud
+from database import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+MODES = ("study", "practice")
+# 한 번의 upsert 문에 넣는 최대 행 수
+FLUSH_CHUNK_SIZE = 1000
+# 저장 실패 시 재시도 간격 상한 (초)
+MAX_RETRY_DELAY = 5.0
+# 같은 항목을 버리기 전까지 저장을 시도하는 횟수
+MAX_FLUSH_ATTEMPTS = 5
+
+Key = Tuple[str, str]
+
+_UPSERT_BATCH = {
+    "study": crud.upsert_study_progress_batch,
+    "practice": crud.upsert_practice_progress_batch,
+}
+
+
+class ProgressBuffer:
+    """(user_id, hanja_id)별로 병합하는 진행 상태 쓰기 버퍼"""
+
+    def __init__(
+        self,
+        interval_ms: int = 50,
+        max_entries: int = 500,
+        session_factory: Callable[[], Session] = SessionLocal
+    ) -> None:
+        self.interval = interval_ms / 1000
+        self.max_entries = max_entries
+        self._session_factory = session_factory
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[Key, dict]] = {mode: {} for mode in MODES}
+        # 저장 중인 항목 (저장이 끝날 때까지 읽기에 반영)
+        self._inflight: Dict[str, Dict[Key, dict]] = {mode: {} for mode in MODES}
+        # 연속 저장 실패 횟수 ((모드, user_id, hanja_id) → 횟수, 새 값이 들어오면 초기화)
+        self._attempts: Dict[Tuple[str, str, str], int] = {}
+        self._flush_lock = asyncio.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.flushes = 0
+        self.flushed_entries = 0
+        self.failures = 0
+        self.dropped_entries = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(pending) for pending in self._pending.values())
+
+    def add(self, mode: str, items: List[dict]) -> None:
+        """진행 상태를 버퍼에 넣습니다 (같은 키는 마지막 값만 유지)."""
+        with self._lock:
+            pending = self._pending[mode]
+            for item in items:
+                self._attempts.pop((mode, item["user_id"], item["hanja_id"]), None)
+                pending[(item["user_id"], item["hanja_id"])] = {
+                    "user_id": item["user_id"],
+                    "hanja_id": item["hanja_id"],
+                    "chapter": item["chapter"],
+                    "is_known": item["is_known"],
+                }
+            full = sum(len(p) for p in self._pending.values()) >= self.max_entries
+        if full and self._wakeup is not None:
+            self._wakeup.set()
+
+    def buffered(self, mode: str, user_id: str) -> Dict[str, dict]:
+        """사용자의 아직 저장되지 않은 항목 (hanja_id → 항목)"""
+        with self._lock:
+            result = {hid: item for (uid, hid), item in self._inflight[mode].items() if uid == user_id}
+            result.update({hid: item for (uid, hid), item in self._pending[mode].items() if uid == user_id})
+        return result
+
+    def has_user(self, user_id: str) -> bool:
+        """사용자의 아직 저장되지 않은 항목이 있는지 확인합니다."""
+        with self._lock:
+            return any(
+                uid == user_id
+                for entries in (*self._pending.values(), *self._inflight.values())
+                for uid, _ in entries
+            )
+
+    async def flush(self, user_id: Optional[str] = None) -> int:
+        """
+        버퍼를 비워 저장합니다 (동시에 한 번만 실행). user_id를 주면 그 사용자의 항목만 저장합니다.
+        실패한 항목은 버퍼로 되돌리고(재시도 횟수를 넘으면 버림) 버퍼에 남은 실패 항목 수를 반환합니다.
+        """
+        async with self._flush_lock:
+            with self._lock:
+                for mode in MODES:
+                    pending = self._pending[mode]
+                    if user_id is None:
+                        self._inflight[mode], self._pending[mode] = pending, {}
+                    else:
+                        self._inflight[mode] = {key: item for key, item in pending.items() if key[0] == user_id}
+                        for key in self._inflight[mode]:
+                            del pending[key]
+                batches = {mode: list(self._inflight[mode].values()) for mode in MODES if self._inflight[mode]}
+            if not batches:
+                return 0
+
+            try:
+                failed = await run_in_threadpool(self._write, batches)
+            except Exception:
+                # 세션 생성 등 청크 밖에서 실패하면 전부 실패로 처리
+                logger.exception("진행 상태 버퍼 저장 실패")
+                failed = batches
+            return self._settle(batches, failed)
+
+    def _settle(self, batches: Dict[str, List[dict]], failed: Dict[str, List[dict]]) -> int:
+        """저장 결과를 반영합니다: 성공한 항목은 비우고, 실패한 항목은 재시도 횟수를 세어 되돌리거나 버립니다."""
+        retried, dropped = 0, []
+        with self._lock:
+            for mode in MODES:
+                for item in failed.get(mode, []):
+                    key = (item["user_id"], item["hanja_id"])
+                    if key in self._pending[mode]:
+                        # 그 사이 들어온 새 값이 우선 (재시도 횟수는 add에서 초기화됨)
+                        continue
+                    attempts = self._attempts.get((mode, *key), 0) + 1
+                    if attempts >= MAX_FLUSH_ATTEMPTS:
+                        self._attempts.pop((mode, *key), None)
+                        dropped.append((mode, *key))
+                    else:
+                        self._attempts[(mode, *key)] = attempts
+                        self._pending[mode][key] = item
+                        retried += 1
+                failed_keys = {(item["user_id"], item["hanja_id"]) for item in failed.get(mode, [])}
+                for key in self._inflight[mode]:
+                    if key not in failed_keys:
+                        self._attempts.pop((mode, *key), None)
+                self._inflight[mode] = {}
+        saved = sum(len(items) for items in batches.values()) - sum(len(items) for items in failed.values())
+        if saved:
+            self.flushes += 1
+            self.flushed_entries += saved
+        if failed:
+            self.failures += 1
+        if dropped:
+            self.dropped_entries += len(dropped)
+            logger.error(
+                "진행 상태 %d개를 %d번 저장하지 못해 버렸습니다: %s",
+                len(dropped), MAX_FLUSH_ATTEMPTS, ", ".join(f"{m}/{u}/{h}" for m, u, h in dropped[:20])
+            )
+        return retried
+
+    def _write(self, batches: Dict[str, List[dict]]) -> Dict[str, List[dict]]:
+        """모드별로 청크씩 저장하고 저장하지 못한 항목을 반환합니다 (청크마다 따로 커밋)."""
+        failed: Dict[str, List[dict]] = {}
+        db = self._session_factory()
+        try:
+            for mode, items in batches.items():
+                upsert = _UPSERT_BATCH[mode]
+                for start in range(0, len(items), FLUSH_CHUNK_SIZE):
+                    chunk = items[start:start + FLUSH_CHUNK_SIZE]
+                    try:
+                        upsert(db, chunk)
+                        continue
+                    except Exception as e:
+                        db.rollback()
+                        if _is_unavailable(e) or len(chunk) == 1:
+                            logger.warning("진행 상태 %d개 저장 실패: %s", len(chunk), e)
+                            failed.setdefault(mode, []).extend(chunk)
+                            continue
+                    # 문제 있는 행만 남기도록 한 행씩 다시 저장
+                    for item in chunk:
+                        try:
+                            upsert(db, [item])
+                        except Exception as e:
+                            db.rollback()
+                            logger.warning("진행 상태 저장 실패 (%s/%s/%s): %s", mode, item["user_id"], item["hanja_id"], e)
+                            failed.setdefault(mode, []).append(item)
+        finally:
+            db.close()
+        return failed
+
+    async def _run(self) -> None:
+        delay = self.interval
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if await self.flush():
+                delay = min(max(delay, self.interval) * 2, MAX_RETRY_DELAY)
+            else:
+                delay = self.interval
+
+    def start(self) -> None:
+        """백그라운드 저장 작업을 시작합니다 (이벤트 루프 안에서 호출)."""
+        if self._task is not None:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 작업을 멈추고 남은 항목을 모두 저장합니다."""
+        if self._task is not None:
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        # 종료 중에는 재시도 한도까지 다시 저장해 보고 남은 항목은 유실로 기록
+        for _ in range(MAX_FLUSH_ATTEMPTS):
+            if not await self.flush():
+                return
+        if len(self):
+            logger.error("종료 중 진행 상태 버퍼 저장 실패 (%d개 유실)", len(self))
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": len(self),
+            "flushes": self.flushes,
+            "flushed_entries": self.flushed_entries,
+            "failures": self.failures,
+            "dropped_entries": self.dropped_entries,
+        }
+
+
+def _is_unavailable(error: Exception) -> bool:
+    """DB 연결 문제처럼 행과 관계없이 실패한 경우 (한 행씩 나눠 다시 저장해도 소용없음)"""
+    return isinstance(error, OperationalError) or (isinstance(error, DBAPIError) and error.connection_invalidated)
@@ -4,6 +4,7 @@ import Layout from './components/Layout/Layout'
 import Home from './pages/Home/Home'
 import ChapterSelection from './pages/ChapterSelection/ChapterSelection'
 import StudyMode from './pages/StudyMode/StudyMode'
+import Quiz from './pages/Quiz/Quiz'
 import Game from './pages/Game/Game'
 import Exam from './pages/Exam/Exam'
 import Statistics from './pages/Statistics/Statistics'
@@ -55,6 +56,8 @@ function App() {
           <Route path="/study/:chapterId" element={<StudyMode />} />
           <Route path="/quiz" element={<StudyMode />} />
           <Route path="/quiz/chapter/:chapterId" element={<StudyMode />} />
+          <Route path="/quiz/choice" element={<Quiz />} />
+          <Route path="/quiz/choice/:chapterId" element={<Quiz />} />
           <Route path="/game" element={<Game />} />
           <Route path="/exam" element={<Exam />} />
           <Route path="/statistics" element={<Statistics />} />
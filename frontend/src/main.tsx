@@ -2,6 +2,10 @@ import React from 'react'
 import ReactDOM from 'react-dom/client'
 import App from './App.tsx'
 import './index.css'
+import { startProgressQueue } from './utils/progressQueue'
+
+// 진행 상태 쓰기 큐의 백그라운드 전송 시작
+startProgressQueue()
 
 ReactDOM.createRoot(document.getElementById('root')!).render(
   <React.StrictMode>
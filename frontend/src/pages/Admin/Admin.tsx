@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react'
 import { useStore } from '../../store/useStore'
-import { fetchHanjaList, fetchHanjaById } from '../../utils/api'
+import { fetchHanjaList, fetchHanjaById, searchHanja } from '../../utils/api'
 import { Hanja } from '../../types/hanja'
 import styled from 'styled-components'
 import HanjaForm from './HanjaForm'
@@ -55,6 +55,19 @@ const Select = styled.select`
   }
 `
 
+const SearchInput = styled.input`
+  padding: 0.75rem 1rem;
+  border: 2px solid #e0e0e0;
+  border-radius: 8px;
+  font-size: 1rem;
+  min-width: 200px;
+
+  &:focus {
+    outline: none;
+    border-color: #2563eb;
+  }
+`
+
 const FilterLabel = styled.label`
   font-weight: 600;
   color: #333;
@@ -144,11 +157,33 @@ const Admin = () => {
   const [showForm, setShowForm] = useState(false)
   const [formData, setFormData] = useState<Hanja | null>(null)
   const [selectedChapter, setSelectedChapter] = useState<number | 'all'>('all')
+  const [searchQuery, setSearchQuery] = useState('')
+  const [searchResults, setSearchResults] = useState<Hanja[] | null>(null)
 
   useEffect(() => {
     loadHanjaList()
   }, [])
 
+  // 검색어 입력이 멈추면 서버 검색 인덱스로 조회 (전체 목록을 브라우저에서 거르지 않음)
+  useEffect(() => {
+    const query = searchQuery.trim()
+    if (!query) {
+      setSearchResults(null)
+      return
+    }
+    let cancelled = false
+    const timer = window.setTimeout(async () => {
+      const response = await searchHanja(query, 100)
+      if (!cancelled && response.data) {
+        setSearchResults(response.data.hanja)
+      }
+    }, 200)
+    return () => {
+      cancelled = true
+      window.clearTimeout(timer)
+    }
+  }, [searchQuery, hanjaList])
+
   const loadHanjaList = async () => {
     const response = await fetchHanjaList()
     if (response.data) {
@@ -213,11 +248,12 @@ const Admin = () => {
   // 단원 목록 추출 (중복 제거 및 정렬)
   const chapters = Array.from(new Set(hanjaList.map((h) => h.chapter))).sort((a, b) => a - b)
 
-  // 필터링된 한자 목록
+  // 필터링된 한자 목록 (검색 중이면 검색 결과 기준)
+  const baseList = searchResults ?? hanjaList
   const filteredHanjaList =
     selectedChapter === 'all'
-      ? hanjaList
-      : hanjaList.filter((h) => h.chapter === selectedChapter)
+      ? baseList
+      : baseList.filter((h) => h.chapter === selectedChapter)
 
   return (
     <Container>
@@ -244,6 +280,12 @@ const Admin = () => {
             </option>
           ))}
         </Select>
+        <SearchInput
+          type="search"
+          placeholder="한자, 음, 뜻, 초성(ㅎㅈ) 검색"
+          value={searchQuery}
+          onChange={(e) => setSearchQuery(e.target.value)}
+        />
         <span style={{ color: '#666', fontSize: '0.9rem' }}>
           총 {filteredHanjaList.length}개
         </span>
@@ -1,12 +1,13 @@
 import { useState, useEffect } from 'react'
 import { Link, useNavigate } from 'react-router-dom'
 import { useStore } from '../../store/useStore'
-import { fetchAllStudyProgress, fetchChapters } from '../../utils/api'
+import { fetchChapters } from '../../utils/api'
+import { flushProgressQueue } from '../../utils/progressQueue'
 import './ChapterSelection.css'
 
 const ChapterSelection = () => {
   const navigate = useNavigate()
-  const { hanjaList, userName } = useStore()
+  const { hanjaList, userName, loadKnownState } = useStore()
   const [studyProgress, setStudyProgress] = useState<Map<number, { known: number; total: number }>>(new Map())
   const [chapters, setChapters] = useState<number[]>([])
   
@@ -28,9 +29,11 @@ const ChapterSelection = () => {
           setChapters(uniqueChapters)
         }
 
-        // 2) 학습 진행 상태 불러오기
-        const response = await fetchAllStudyProgress(userId)
-        if (response.data) {
+        // 2) 학습 진행 상태 불러오기 (아직 전송하지 않은 저장 내용을 먼저 반영)
+        //    목록 대신 비트맵으로 받아 한자 목록의 단원 정보로 집계
+        await flushProgressQueue()
+        const knownState = await loadKnownState(userId, 'study')
+        if (knownState) {
           // 단원별로 학습 상태 집계
           const progressMap = new Map<number, { known: number; total: number }>()
           
@@ -45,14 +48,18 @@ const ChapterSelection = () => {
           })
           
           // 학습한 한자들을 단원별로 집계
-          response.data.progress.forEach((p) => {
-            const chapter = p.chapter
+          const chapterById = new Map(hanjaList.map((h) => [h.id, h.chapter]))
+          const countStudied = (hanjaId: string, isKnown: boolean) => {
+            const chapter = chapterById.get(hanjaId)
+            if (chapter === undefined) return
             const current = progressMap.get(chapter) || { known: 0, total: 0 }
             progressMap.set(chapter, {
-              known: p.is_known ? current.known + 1 : current.known,
+              known: isKnown ? current.known + 1 : current.known,
               total: current.total + 1
             })
-          })
+          }
+          knownState.known.forEach((hanjaId) => countStudied(hanjaId, true))
+          knownState.unknown.forEach((hanjaId) => countStudied(hanjaId, false))
           
           setStudyProgress(progressMap)
         }
@@ -62,7 +69,7 @@ const ChapterSelection = () => {
     }
     
     loadProgress()
-  }, [userId, hanjaList])
+  }, [userId, hanjaList, loadKnownState])
   
   // 단원별 한자 개수 계산 (API에서 받은 단원 목록 기준)
   const chapterCards = chapters.map((chapterId) => {
@@ -1,17 +1,45 @@
+import { useEffect, useState } from 'react'
 import { useStore } from '../../store/useStore'
+import { fetchProgressStats, ProgressStats } from '../../utils/api'
+import { flushProgressQueue } from '../../utils/progressQueue'
 import './Statistics.css'
 
 const Statistics = () => {
-  const { progress, quizResults, examResults, hanjaList } = useStore()
-  
-  const totalProgress = progress.length > 0
-    ? progress.reduce((sum, p) => sum + (p.completedHanja.length / hanjaList.length) * 100, 0) / progress.length
-    : 0
-  
+  const { quizResults, examResults, userName } = useStore()
+  const userId = userName || 'default'
+  const [stats, setStats] = useState<ProgressStats | null>(null)
+
+  // 서버에서 집계한 단원별 통계 불러오기 (진행 상태 행 대신 카운터만 읽음)
+  useEffect(() => {
+    let cancelled = false
+    const loadStats = async () => {
+      try {
+        // 아직 전송하지 않은 저장 내용을 먼저 반영
+        await flushProgressQueue()
+        const response = await fetchProgressStats(userId)
+        if (!cancelled && response.data) {
+          setStats(response.data)
+        }
+      } catch (error) {
+        console.error('학습 통계 불러오기 실패:', error)
+      }
+    }
+    loadStats()
+    return () => {
+      cancelled = true
+    }
+  }, [userId])
+
+  const studyStats = stats?.study ?? []
+  const knownCount = studyStats.reduce((sum, s) => sum + s.known, 0)
+  const totalCount = studyStats.reduce((sum, s) => sum + s.total, 0)
+  const totalProgress = totalCount > 0 ? (knownCount / totalCount) * 100 : 0
+  const completedChapters = studyStats.filter((s) => s.total > 0 && s.known === s.total).length
+
   const totalQuizQuestions = quizResults.length
   const correctQuizAnswers = quizResults.filter((r) => r.isCorrect).length
-  const quizAccuracy = totalQuizQuestions > 0 
-    ? (correctQuizAnswers / totalQuizQuestions) * 100 
+  const quizAccuracy = totalQuizQuestions > 0
+    ? (correctQuizAnswers / totalQuizQuestions) * 100
     : 0
 
   return (
@@ -31,6 +59,9 @@ const Statistics = () => {
               style={{ width: `${totalProgress}%` }}
             />
           </div>
+          <div className="stat-detail">
+            {knownCount} / {totalCount} 한자
+          </div>
         </div>
 
         <div className="stat-card">
@@ -44,7 +75,10 @@ const Statistics = () => {
         <div className="stat-card">
           <h3>완료한 단원</h3>
           <div className="stat-value">
-            {progress.filter((p) => p.completedHanja.length > 0).length}개
+            {completedChapters}개
+          </div>
+          <div className="stat-detail">
+            {studyStats.length}개 단원 중
           </div>
         </div>
 
@@ -58,4 +92,3 @@ const Statistics = () => {
 }
 
 export default Statistics
-
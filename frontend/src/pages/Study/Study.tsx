@@ -3,10 +3,8 @@ import { useParams, useNavigate } from 'react-router-dom'
 import styled from 'styled-components'
 import { useStore } from '../../store/useStore'
 import HanjaCard from '../../components/HanjaCard/HanjaCard'
-import { 
-  fetchStudyProgressByChapter, 
-  saveStudyProgress
-} from '../../utils/api'
+import { fetchStudyProgressByChapter } from '../../utils/api'
+import { enqueueProgress, flushProgressQueue } from '../../utils/progressQueue'
 
 const Screen = styled.div`
   padding: 0;
@@ -145,6 +143,8 @@ const Study = () => {
   const loadStudyProgress = useCallback(async () => {
     setIsLoadingProgress(true)
     try {
+      // 아직 전송하지 않은 저장 내용을 먼저 반영
+      await flushProgressQueue()
       const response = await fetchStudyProgressByChapter(userId, chapter)
       if (response.data) {
         const knownIds = new Set<string>()
@@ -222,28 +222,13 @@ const Study = () => {
     
     const isKnown = result === 'known'
     
-    // DB에 학습 상태 저장
-    try {
-      const saveResponse = await saveStudyProgress({
-        user_id: userId,
-        hanja_id: currentHanja.id,
-        chapter: chapter,
-        is_known: isKnown
-      })
-      
-      if (saveResponse.error) {
-        console.error('학습 상태 저장 오류:', saveResponse.error)
-      } else {
-        console.log('학습 상태 저장 성공:', { 
-          hanja_id: currentHanja.id, 
-          chapter: chapter,
-          is_known: isKnown 
-        })
-      }
-    } catch (error) {
-      console.error('학습 상태 저장 실패:', error)
-      // 저장 실패해도 UI는 업데이트 (사용자 경험 개선)
-    }
+    // 학습 상태 저장 (쓰기 큐에 넣고 백그라운드에서 배치 전송, 오프라인이어도 유지)
+    await enqueueProgress('study', {
+      user_id: userId,
+      hanja_id: currentHanja.id,
+      chapter: chapter,
+      is_known: isKnown
+    })
     
     // 다음 한자로 이동
     if (currentIndex < studyList.length - 1) {
@@ -1,16 +1,11 @@
-import { useState, useMemo, useEffect, useCallback } from 'react'
+import { useState, useEffect, useCallback } from 'react'
 import { useParams, useNavigate, useSearchParams, useLocation } from 'react-router-dom'
 import styled from 'styled-components'
 import { useStore } from '../../store/useStore'
 import HanjaCard from '../../components/HanjaCard/HanjaCard'
-import { 
-  fetchStudyProgressByChapter, 
-  saveStudyProgress,
-  fetchPracticeProgressByChapter, 
-  fetchAllPracticeProgress,
-  savePracticeProgress,
-  fetchAllStudyProgress
-} from '../../utils/api'
+import { Hanja } from '../../types/hanja'
+import { fetchSession } from '../../utils/api'
+import { enqueueProgress, flushProgressQueue } from '../../utils/progressQueue'
 
 const Screen = styled.div`
   padding: 0;
@@ -142,7 +137,7 @@ const StudyMode = () => {
   const { chapterId } = useParams<{ chapterId: string }>()
   const [searchParams] = useSearchParams()
   const navigate = useNavigate()
-  const { hanjaList, userName } = useStore()
+  const { userName } = useStore()
   
   const location = useLocation()
   
@@ -157,347 +152,131 @@ const StudyMode = () => {
   const isChapterMode = chapter !== null
   
   // 학습 / 연습 상태 관리
-  const [knownHanjaIds, setKnownHanjaIds] = useState<Set<string>>(new Set())
-  const [unknownHanjaIds, setUnknownHanjaIds] = useState<string[]>([])
+  // 이번 세션에 보여 줄 한자 리스트 (서버에서 거르고 섞은 순서 그대로 사용)
+  const [sessionCards, setSessionCards] = useState<Hanja[]>([])
   const [isReviewMode, setIsReviewMode] = useState(false)
   const [currentIndex, setCurrentIndex] = useState(0)
   const [isLoadingProgress, setIsLoadingProgress] = useState(true)
-  // 연습 모드에서 이번 세션에 사용할 한자 리스트 (중복 방지 + 고정 랜덤 순서)
-  const [practiceSessionList, setPracticeSessionList] = useState<typeof hanjaList>([])
   // 연습 모드: 이번 세션에서 틀린 단어들 (복습용)
-  const [practiceWrongIds, setPracticeWrongIds] = useState<string[]>([])
+  const [practiceWrongIds, setPracticeWrongIds] = useState<Set<string>>(new Set())
   
-  // DB에서 진행 상태 불러오기 함수
-  const loadProgress = useCallback(async () => {
-    setIsLoadingProgress(true)
+  // 서버에서 세션 카드 불러오기 (review: DB에서 모름으로 표시한 한자만)
+  const loadSession = useCallback(async (review: boolean) => {
+    if (!isPracticeMode && !chapter) {
+      console.error('학습 모드에서는 chapter가 필요합니다.')
+      return null
+    }
     try {
-      if (isPracticeMode) {
-        // 연습 모드
-        let practiceResponse
-        if (isChapterMode && chapter) {
-          practiceResponse = await fetchPracticeProgressByChapter(userId, chapter)
-        } else {
-          practiceResponse = await fetchAllPracticeProgress(userId)
-        }
-        
-        if (practiceResponse.error) {
-          console.error('연습 상태 불러오기 오류:', practiceResponse.error)
-        } else if (practiceResponse.data) {
-          const knownIds = new Set<string>()
-          const unknownIds: string[] = []
-          
-          practiceResponse.data.progress.forEach((p) => {
-            if (p.is_known) {
-              knownIds.add(p.hanja_id)
-            } else {
-              unknownIds.push(p.hanja_id)
-            }
-          })
-          
-          setKnownHanjaIds(knownIds)
-          setUnknownHanjaIds(unknownIds)
-          console.log('연습 상태 불러오기 성공:', { 
-            knownCount: knownIds.size, 
-            unknownCount: unknownIds.length
-          })
-          return { knownIds, unknownIds }
-        }
-        
-        // 전체 연습 모드일 때는 학습 상태도 확인하여 필터링에 사용
-        if (!isChapterMode) {
-          const studyResponse = await fetchAllStudyProgress(userId)
-          if (studyResponse.data) {
-            const studiedIds = new Set<string>()
-            studyResponse.data.progress.forEach((p) => {
-              studiedIds.add(p.hanja_id)
-            })
-            console.log('학습 상태 확인 (필터링용):', {
-              학습한한자수: studiedIds.size
-            })
-          }
-        }
-      } else {
-        // 학습 모드
-        if (!chapter) {
-          console.error('학습 모드에서는 chapter가 필요합니다.')
-          return null
-        }
-        
-        const response = await fetchStudyProgressByChapter(userId, chapter)
-        if (response.data) {
-          const knownIds = new Set<string>()
-          const unknownIds: string[] = []
-          
-          response.data.progress.forEach((p) => {
-            if (p.is_known) {
-              knownIds.add(p.hanja_id)
-            } else {
-              unknownIds.push(p.hanja_id)
-            }
-          })
-          
-          setKnownHanjaIds(knownIds)
-          setUnknownHanjaIds(unknownIds)
-          console.log('학습 상태 불러오기 성공:', { 
-            knownCount: knownIds.size, 
-            unknownCount: unknownIds.length,
-            unknownIds: unknownIds
-          })
-          return { knownIds, unknownIds }
-        }
+      // 아직 전송하지 않은 저장 내용을 먼저 반영
+      await flushProgressQueue()
+      const response = await fetchSession(userId, mode, { chapter, review })
+      if (response.error) {
+        console.error('세션 불러오기 오류:', response.error)
+        return null
       }
+      return response.data?.cards ?? null
     } catch (error) {
-      console.error('진행 상태 불러오기 실패:', error)
-    } finally {
-      setIsLoadingProgress(false)
+      console.error('세션 불러오기 실패:', error)
+      return null
     }
-    return null
-  }, [chapter, userId, isChapterMode, isPracticeMode])
-  
-  // DB에서 진행 상태 불러오기
-  useEffect(() => {
-    loadProgress()
-  }, [loadProgress])
+  }, [chapter, userId, mode, isPracticeMode])
   
-  // 현재 학습할 한자 리스트 계산
-  const hanjaList_filtered = useMemo(() => {
-    if (isPracticeMode) {
-      // 연습 모드: 이미 만들어 둔 세션 리스트 사용 (중복 없이 고정 랜덤 순서)
-      return practiceSessionList
-    } else {
-      // 학습 모드
-      if (!chapter) return []
-      
-      const allChapterHanja = hanjaList.filter((h) => h.chapter === chapter)
-      
-      if (isReviewMode) {
-        // 리뷰 모드: 모르는 한자만 다시 학습
-        return allChapterHanja.filter((h) => unknownHanjaIds.includes(h.id))
-      } else {
-        // 일반 모드: 모든 한자 학습
-        return allChapterHanja
-      }
-    }
-  }, [hanjaList, chapter, isChapterMode, knownHanjaIds, unknownHanjaIds, isReviewMode, isPracticeMode, practiceSessionList])
-
-  // 연습 모드: 세션용 리스트를 한 번만 생성 (중복 없이 랜덤 순서)
+  // 세션 시작: 한 번의 요청으로 카드 목록을 받아 옴
   useEffect(() => {
-    if (!isPracticeMode || isLoadingProgress) return
-
-    if (!isReviewMode) {
-      // 연습 일반 모드: 이미 세션 리스트가 있으면 그대로 사용 (인덱스만 증가)
-      if (practiceSessionList.length > 0) return
-
-      // 새 연습 세션 시작 시, 이전 복습용 틀린 단어 목록 초기화
-      setPracticeWrongIds([])
-
-      let base: typeof hanjaList = []
-      if (isChapterMode && chapter) {
-        // 단원 연습: 해당 단원 전체
-        base = hanjaList.filter((h) => h.chapter === chapter)
-      } else {
-        // 전체 연습: "학습한 한자"만 대상으로
-        const studiedIds = new Set([...knownHanjaIds, ...unknownHanjaIds])
-        const studiedList = hanjaList.filter((h) => studiedIds.has(h.id))
-        if (studiedIds.size === 0) {
-          console.warn('⚠️ 학습한 한자가 없습니다. 전체 연습을 하려면 먼저 학습을 시작해주세요.')
-        }
-        // 전체 연습은 학습한 한자 중 랜덤 20개만 사용
-        const shuffled = shuffleArray(studiedList)
-        base = shuffled.slice(0, 20)
+    let cancelled = false
+    setIsLoadingProgress(true)
+    loadSession(false).then((cards) => {
+      if (cancelled) return
+      if (isPracticeMode && !isChapterMode && cards?.length === 0) {
+        console.warn('⚠️ 학습한 한자가 없습니다. 전체 연습을 하려면 먼저 학습을 시작해주세요.')
       }
-
-      setPracticeSessionList(shuffleArray(base))
-      setCurrentIndex(0)
-    } else {
-      // 연습 복습 모드: 이미 세션 리스트가 있으면 그대로 사용 (인덱스만 증가)
-      if (practiceSessionList.length > 0) return
-
-      // 이번 세션에서 틀렸던 한자들만 복습 대상으로 사용
-      const base = hanjaList.filter((h) => practiceWrongIds.includes(h.id))
-      setPracticeSessionList(shuffleArray(base))
+      setSessionCards(cards ?? [])
+      setIsReviewMode(false)
+      setPracticeWrongIds(new Set())
       setCurrentIndex(0)
+      setIsLoadingProgress(false)
+    })
+    return () => {
+      cancelled = true
     }
-  }, [isPracticeMode, isChapterMode, chapter, hanjaList, knownHanjaIds, unknownHanjaIds, isReviewMode, isLoadingProgress, practiceSessionList.length, practiceWrongIds])
-  
-  // studyList가 변경되면 currentIndex 조정
-  useEffect(() => {
-    // ✅ 이 효과는 "학습 모드"에서만 동작하도록 제한
-    if (!isPracticeMode) {
-      if (hanjaList_filtered.length > 0) {
-        if (currentIndex >= hanjaList_filtered.length) {
-          setCurrentIndex(0)
-        }
-      } else if (hanjaList_filtered.length === 0 && isReviewMode) {
-        // 학습 모드 리뷰에서 모든 한자를 알고 있으면 완료
-        alert('복습이 완료되었습니다!')
-        navigate('/chapters')
-      }
-    }
-  }, [hanjaList_filtered.length, currentIndex, isReviewMode, navigate, isPracticeMode, isChapterMode])
+  }, [loadSession, isPracticeMode, isChapterMode])
   
   // 현재 한자 (인덱스 기반으로 통일)
-  const currentHanja = hanjaList_filtered[currentIndex]
+  const currentHanja = sessionCards[currentIndex]
   
   // 진행률 계산 (인덱스 기반으로 통일)
-  const progressPercent = hanjaList_filtered.length > 0 
-    ? ((currentIndex + 1) / hanjaList_filtered.length) * 100 
+  const progressPercent = sessionCards.length > 0 
+    ? ((currentIndex + 1) / sessionCards.length) * 100 
     : 0
 
   const handleSwipe = async (result: 'known' | 'unknown') => {
     if (!currentHanja) return
     
     const isKnown = result === 'known'
-    // 연습 모드용: 이번 스와이프 이후 기준으로 사용할 "업데이트된 틀린 단어 목록"을 미리 계산
-    let nextPracticeWrongIds = practiceWrongIds
-    
-    // DB에 진행 상태 저장
-    try {
-      if (isPracticeMode) {
-        const saveResponse = await savePracticeProgress({
-          user_id: userId,
-          hanja_id: currentHanja.id,
-          chapter: currentHanja.chapter,
-          is_known: isKnown
-        })
-        
-        if (saveResponse.error) {
-          console.error('연습 상태 저장 오류:', saveResponse.error)
-        } else {
-          console.log('연습 상태 저장 성공:', { 
-            hanja_id: currentHanja.id, 
-            is_known: isKnown 
-          })
-        }
-      } else {
-        const saveResponse = await saveStudyProgress({
-          user_id: userId,
-          hanja_id: currentHanja.id,
-          chapter: chapter!,
-          is_known: isKnown
-        })
-        
-        if (saveResponse.error) {
-          console.error('학습 상태 저장 오류:', saveResponse.error)
-        } else {
-          console.log('학습 상태 저장 성공:', { 
-            hanja_id: currentHanja.id, 
-            chapter: chapter,
-            is_known: isKnown 
-          })
-        }
-      }
-    } catch (error) {
-      console.error('진행 상태 저장 실패:', error)
-    }
     
-    // 상태 업데이트 (DB 기준 상태)
-    if (isKnown) {
-      setKnownHanjaIds((prev) => new Set(prev).add(currentHanja.id))
-      setUnknownHanjaIds((prev) => prev.filter((id) => id !== currentHanja.id))
+    // 진행 상태 저장 (쓰기 큐에 넣고 백그라운드에서 배치 전송, 오프라인이어도 유지)
+    if (isPracticeMode) {
+      await enqueueProgress('practice', {
+        user_id: userId,
+        hanja_id: currentHanja.id,
+        chapter: currentHanja.chapter,
+        is_known: isKnown
+      })
     } else {
-      setUnknownHanjaIds((prev) => {
-        if (!prev.includes(currentHanja.id)) {
-          return [...prev, currentHanja.id]
-        }
-        return prev
+      await enqueueProgress('study', {
+        user_id: userId,
+        hanja_id: currentHanja.id,
+        chapter: chapter!,
+        is_known: isKnown
       })
     }
 
     // 연습 모드에서 이번 세션의 "틀린 단어" 관리 (복습용)
+    let nextPracticeWrongIds = practiceWrongIds
     if (isPracticeMode) {
-      if (!isKnown) {
-        // 틀린 경우: 목록에 추가
-        if (!nextPracticeWrongIds.includes(currentHanja.id)) {
-          nextPracticeWrongIds = [...nextPracticeWrongIds, currentHanja.id]
-        }
-      } else {
+      nextPracticeWrongIds = new Set(practiceWrongIds)
+      if (isKnown) {
         // 맞힌 경우: 목록에서 제거 (복습 대상 제외)
-        nextPracticeWrongIds = nextPracticeWrongIds.filter((id) => id !== currentHanja.id)
+        nextPracticeWrongIds.delete(currentHanja.id)
+      } else {
+        // 틀린 경우: 목록에 추가
+        nextPracticeWrongIds.add(currentHanja.id)
       }
-      // 계산된 결과를 한 번만 반영
       setPracticeWrongIds(nextPracticeWrongIds)
     }
     
     // 다음 한자로 이동 (인덱스 기반으로 통일)
-    if (currentIndex < hanjaList_filtered.length - 1) {
-      // 다음 한자로 이동
+    if (currentIndex < sessionCards.length - 1) {
       setCurrentIndex(prev => prev + 1)
+      return
+    }
+
+    // 모든 한자를 다 봤을 때
+    const doneMessage = isReviewMode
+      ? '복습이 완료되었습니다!'
+      : (isPracticeMode ? '연습이 완료되었습니다!' : '학습이 완료되었습니다!')
+    if (isPracticeMode) {
+      // ✅ 연습 모드: DB is_known 대신, 이번 세션의 practiceWrongIds 기준으로만 복습 제어
+      if (nextPracticeWrongIds.size > 0) {
+        // 틀린 단어가 남아 있으면 그 단어들만 다시 섞어서 복습
+        setSessionCards(shuffleArray(sessionCards.filter((h) => nextPracticeWrongIds.has(h.id))))
+        setIsReviewMode(true)
+        setCurrentIndex(0)
+      } else {
+        alert(doneMessage)
+        navigate(isChapterMode ? '/chapters' : '/quiz')
+      }
     } else {
-      // 모든 한자를 다 봤을 때
-      if (isPracticeMode) {
-        // ✅ 연습 모드: DB is_known 대신, 이번 세션의 practiceWrongIds 기준으로만 복습 제어
-        if (!isReviewMode) {
-          // 연습 1회전 끝
-          if (nextPracticeWrongIds.length > 0) {
-            // 틀린 단어가 있으면 복습 모드로 진입
-            setIsReviewMode(true)
-            setPracticeSessionList([]) // 복습용 리스트를 다시 만들도록 초기화
-            setCurrentIndex(0)
-          } else {
-            // 모두 맞혔으면 연습 완료
-            alert('연습이 완료되었습니다!')
-            navigate(isChapterMode ? '/chapters' : '/quiz')
-          }
-        } else {
-          // 연습 복습 모드에서 한 바퀴 끝
-          if (nextPracticeWrongIds.length > 0) {
-            // 아직도 틀린 단어가 남아 있으면 다시 복습 한 바퀴
-            setPracticeSessionList([])
-            setCurrentIndex(0)
-          } else {
-            // 이번 세션 기준으로 모든 틀린 단어를 맞혔으면 복습 종료
-            alert('복습이 완료되었습니다!')
-            navigate(isChapterMode ? '/chapters' : '/quiz')
-          }
-        }
+      // ✅ 학습 모드: DB is_known 기준으로 모르는 한자만 서버에서 다시 받아 복습
+      const reviewCards = await loadSession(true)
+      if (!reviewCards) return
+      if (reviewCards.length > 0) {
+        setSessionCards(reviewCards)
+        setIsReviewMode(true)
+        setCurrentIndex(0)
       } else {
-        // ✅ 학습 모드: 기존처럼 DB is_known 기반으로 복습/완료 판단
-        if (!isReviewMode) {
-          // 일반 모드에서 끝났을 때
-          if (result === 'unknown') {
-            const progressData = await loadProgress()
-            if (progressData && progressData.unknownIds.length > 0) {
-              setIsReviewMode(true)
-              setCurrentIndex(0)
-            } else {
-              alert('학습이 완료되었습니다!')
-              navigate('/chapters')
-            }
-          } else {
-            const progressData = await loadProgress()
-            if (progressData) {
-              if (progressData.unknownIds.length === 0) {
-                alert('학습이 완료되었습니다!')
-                navigate('/chapters')
-              } else {
-                setIsReviewMode(true)
-                setCurrentIndex(0)
-              }
-            }
-          }
-        } else {
-          // 학습 복습 모드에서 끝났을 때
-          if (result === 'unknown') {
-            const progressData = await loadProgress()
-            if (progressData && progressData.unknownIds.length > 0) {
-              setCurrentIndex(0)
-            } else {
-              alert('복습이 완료되었습니다!')
-              navigate('/chapters')
-            }
-          } else {
-            const progressData = await loadProgress()
-            if (progressData) {
-              if (progressData.unknownIds.length === 0) {
-                alert('복습이 완료되었습니다!')
-                navigate('/chapters')
-              } else {
-                setCurrentIndex(0)
-              }
-            }
-          }
-        }
+        alert(doneMessage)
+        navigate('/chapters')
       }
     }
   }
@@ -510,7 +289,7 @@ const StudyMode = () => {
     )
   }
 
-  if (hanjaList_filtered.length === 0) {
+  if (sessionCards.length === 0) {
     return (
       <Empty>
         <EmptyText>
@@ -549,7 +328,7 @@ const StudyMode = () => {
   }
 
   const getProgressText = () => {
-    return `${currentIndex + 1} / ${hanjaList_filtered.length}`
+    return `${currentIndex + 1} / ${sessionCards.length}`
   }
 
   return (
@@ -1,6 +1,15 @@
 import { create } from 'zustand'
 import { Hanja, Progress, QuizResult, ExamResult } from '../types/hanja'
-import { fetchHanjaList } from '../utils/api'
+import { fetchHanjaList, fetchProgressBitmap } from '../utils/api'
+import { decodeBitmap } from '../utils/progressBitmap'
+import { ProgressMode } from '../utils/progressQueue'
+
+// 서버 진행 상태 비트맵을 디코딩한 결과
+export interface KnownState {
+  catalogVersion: string
+  known: Set<string>
+  unknown: Set<string>
+}
 
 interface AppState {
   // 사용자 이름
@@ -18,6 +27,10 @@ interface AppState {
   progress: Progress[]
   updateProgress: (progress: Progress) => void
   
+  // 학습/연습 모드별 알고 있음/모름 상태
+  knownStates: Record<ProgressMode, KnownState | null>
+  loadKnownState: (userId: string, mode: ProgressMode) => Promise<KnownState | null>
+  
   // 퀴즈 결과
   quizResults: QuizResult[]
   addQuizResult: (result: QuizResult) => void
@@ -56,6 +69,7 @@ export const useStore = create<AppState>((set, get) => ({
   userName: getStoredUserName(),
   hanjaList: [],
   progress: [],
+  knownStates: { study: null, practice: null },
   quizResults: [],
   examResults: [],
   wrongAnswers: [],
@@ -113,6 +127,22 @@ export const useStore = create<AppState>((set, get) => ({
       ],
     })),
   
+  // 비트맵(약 300바이트/1,800자)으로 받아 디코딩
+  loadKnownState: async (userId, mode) => {
+    const response = await fetchProgressBitmap(mode, userId)
+    if (!response.data) {
+      console.error('진행 상태 비트맵 로드 실패:', response.error)
+      return null
+    }
+    const knownState: KnownState = {
+      catalogVersion: response.data.catalog_version,
+      known: new Set(decodeBitmap(response.data.known)),
+      unknown: new Set(decodeBitmap(response.data.unknown)),
+    }
+    set((state) => ({ knownStates: { ...state.knownStates, [mode]: knownState } }))
+    return knownState
+  },
+  
   addQuizResult: (result) =>
     set((state) => ({
       quizResults: [...state.quizResults, result],
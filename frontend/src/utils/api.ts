@@ -1,4 +1,4 @@
-import { Hanja } from '../types/hanja'
+import { Hanja, QuestionType } from '../types/hanja'
 
 // API 기본 URL 설정
 // - 로컬 개발 환경: http://localhost:8000 (백엔드 서버)
@@ -63,6 +63,18 @@ export async function fetchHanjaList(): Promise<ApiResponse<{ hanja: Hanja[] }>>
   return fetchApi<{ hanja: Hanja[] }>('/api/hanja')
 }
 
+/**
+ * 한자 검색 (한자, 음, 뜻, 예문 또는 초성 예: 'ㅎㅈ')
+ */
+export async function searchHanja(
+  query: string,
+  limit: number = 20
+): Promise<ApiResponse<{ hanja: Hanja[] }>> {
+  return fetchApi<{ hanja: Hanja[] }>(
+    `/api/hanja/search?q=${encodeURIComponent(query)}&limit=${limit}`
+  )
+}
+
 /**
  * 특정 한자 데이터 가져오기
  */
@@ -159,6 +171,21 @@ export async function saveStudyProgress(
   }
 }
 
+/**
+ * 학습 진행 상태 여러 건을 한 번에 저장/업데이트 (하나의 트랜잭션으로 처리)
+ * keepalive: 페이지를 떠나는 중에도 요청이 끝까지 전송되도록 함 (본문 64KB 제한)
+ */
+export async function saveStudyProgressBatch(
+  progressList: StudyProgress[],
+  options?: { keepalive?: boolean }
+): Promise<ApiResponse<StudyProgressListResponse>> {
+  return fetchApi<StudyProgressListResponse>('/api/study-progress/batch', {
+    method: 'POST',
+    body: JSON.stringify(progressList),
+    keepalive: options?.keepalive,
+  })
+}
+
 // 연습 진행 상태 타입
 export interface PracticeProgress {
   user_id: string
@@ -231,3 +258,120 @@ export async function savePracticeProgress(
     }
   }
 }
+
+/**
+ * 연습 진행 상태 여러 건을 한 번에 저장/업데이트 (하나의 트랜잭션으로 처리)
+ */
+export async function savePracticeProgressBatch(
+  progressList: PracticeProgress[],
+  options?: { keepalive?: boolean }
+): Promise<ApiResponse<PracticeProgressListResponse>> {
+  return fetchApi<PracticeProgressListResponse>('/api/practice-progress/batch', {
+    method: 'POST',
+    body: JSON.stringify(progressList),
+    keepalive: options?.keepalive,
+  })
+}
+
+// 진행 상태 비트맵 타입 (known/unknown은 base64, 디코딩은 utils/progressBitmap.ts)
+export interface ProgressBitmap {
+  user_id: string
+  catalog_version: string
+  size: number
+  known: string
+  unknown: string
+}
+
+/**
+ * 학습/연습 진행 상태를 비트맵으로 가져오기 (전체 목록 JSON보다 훨씬 작음)
+ */
+export async function fetchProgressBitmap(
+  mode: 'study' | 'practice',
+  userId: string = 'default'
+): Promise<ApiResponse<ProgressBitmap>> {
+  return fetchApi<ProgressBitmap>(`/api/${mode}-progress/${userId}/bitmap`)
+}
+
+// 단원별 통계 타입
+export interface ChapterStats {
+  chapter: number
+  known: number
+  unknown: number
+  total: number
+}
+
+export interface ProgressStats {
+  user_id: string
+  study: ChapterStats[]
+  practice: ChapterStats[]
+}
+
+/**
+ * 단원별 학습/연습 통계 가져오기 (서버에서 집계된 카운터)
+ */
+export async function fetchProgressStats(
+  userId: string = 'default'
+): Promise<ApiResponse<ProgressStats>> {
+  return fetchApi<ProgressStats>(`/api/stats/${userId}`)
+}
+
+// 퀴즈 타입
+export interface QuizQuestion {
+  hanja_id: string
+  chapter: number
+  prompt: string
+  choices: string[]
+  answer_index: number
+}
+
+export interface QuizResponse {
+  seed: number
+  question_type: QuestionType
+  questions: QuizQuestion[]
+}
+
+/**
+ * 서버에서 객관식 퀴즈 생성 (전체 카탈로그를 내려받지 않음)
+ * chapters가 비어 있으면 전체 단원, 같은 seed로 요청하면 같은 퀴즈가 생성됨
+ */
+export async function createQuiz(options: {
+  chapters?: number[]
+  count?: number
+  question_type?: QuestionType
+  choices?: number
+  seed?: number
+}): Promise<ApiResponse<QuizResponse>> {
+  return fetchApi<QuizResponse>('/api/quiz', {
+    method: 'POST',
+    body: JSON.stringify(options),
+  })
+}
+
+// 학습/연습 세션 타입
+export interface StudySession {
+  user_id: string
+  mode: 'study' | 'practice'
+  chapter: number | null
+  review: boolean
+  seed: number
+  cards: Hanja[] // 보여 줄 순서대로 (연습은 서버에서 섞음)
+  known_ids: string[]
+  unknown_ids: string[]
+}
+
+/**
+ * 학습/연습 세션 시작에 필요한 카드와 진행 상태를 한 번에 가져오기
+ * - 학습: chapter 필수, review면 모름으로 표시한 한자만
+ * - 연습: chapter가 없으면 학습한 한자 중 무작위 20개
+ */
+export async function fetchSession(
+  userId: string = 'default',
+  mode: 'study' | 'practice',
+  options: { chapter?: number | null; review?: boolean; seed?: number } = {}
+): Promise<ApiResponse<StudySession>> {
+  const params = new URLSearchParams({ mode })
+  if (options.chapter !== undefined && options.chapter !== null) params.set('chapter', String(options.chapter))
+  if (options.review) params.set('review', 'true')
+  if (options.seed !== undefined) params.set('seed', String(options.seed))
+  return fetchApi<StudySession>(`/api/session/${userId}?${params.toString()}`)
+}
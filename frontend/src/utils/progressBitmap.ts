@@ -0,0 +1,21 @@
+// 진행 상태 비트맵 디코딩
+// 비트 i는 ID가 i인 한자 (base64, 바이트 안에서는 하위 비트부터) - 백엔드 progress_bitmap.py와 같은 형식
+
+/**
+ * base64 비트맵에서 켜진 비트의 한자 ID 목록 반환
+ */
+export function decodeBitmap(data: string): string[] {
+  const raw = atob(data)
+  const ids: string[] = []
+  for (let index = 0; index < raw.length; index++) {
+    const byte = raw.charCodeAt(index)
+    if (byte === 0) continue
+    for (let bit = 0; bit < 8; bit++) {
+      if (byte & (1 << bit)) {
+        ids.push(String(index * 8 + bit))
+      }
+    }
+  }
+  return ids
+}
+
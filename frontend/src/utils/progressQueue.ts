@@ -0,0 +1,220 @@
+import {
+  StudyProgress,
+  PracticeProgress,
+  saveStudyProgressBatch,
+  savePracticeProgressBatch,
+} from './api'
+
+// 진행 상태 쓰기 큐 (오프라인 우선)
+// - (모드, 사용자, 한자)별로 마지막 값만 IndexedDB에 보관 → 카드를 여러 번 뒤집어도 한 건만 전송
+// - 일정 간격, 페이지 숨김, 온라인 복귀 시 배치 API로 한 번에 전송
+// - 실패하면 지수 백오프로 재시도 (서버는 같은 값을 다시 받아도 아무것도 바꾸지 않음)
+
+export type ProgressMode = 'study' | 'practice'
+
+interface QueuedProgress {
+  key: string
+  mode: ProgressMode
+  progress: StudyProgress | PracticeProgress
+  queuedAt: number
+}
+
+const DB_NAME = 'hanja-progress-queue'
+const STORE_NAME = 'pending'
+const FLUSH_INTERVAL_MS = 5000
+// keepalive 요청(페이지를 떠날 때)의 본문 크기 제한(64KB) 안에 들어가도록
+const MAX_BATCH_SIZE = 500
+const MIN_BACKOFF_MS = 1000
+const MAX_BACKOFF_MS = 5 * 60 * 1000
+
+// IndexedDB를 쓸 수 없는 환경(사생활 보호 모드 등)에서는 메모리에만 보관
+const memoryQueue = new Map<string, QueuedProgress>()
+let dbPromise: Promise<IDBDatabase | null> | null = null
+let lastQueuedAt = 0
+let flushing: Promise<void> | null = null
+let retryAttempt = 0
+let nextRetryAt = 0
+let started = false
+
+function openDb(): Promise<IDBDatabase | null> {
+  if (!dbPromise) {
+    dbPromise = new Promise((resolve) => {
+      if (typeof indexedDB === 'undefined') {
+        resolve(null)
+        return
+      }
+      const request = indexedDB.open(DB_NAME, 1)
+      request.onupgradeneeded = () => {
+        request.result.createObjectStore(STORE_NAME, { keyPath: 'key' })
+      }
+      request.onsuccess = () => resolve(request.result)
+      request.onerror = () => {
+        console.error('IndexedDB 열기 오류:', request.error)
+        resolve(null)
+      }
+    })
+  }
+  return dbPromise
+}
+
+function waitForTransaction(tx: IDBTransaction): Promise<void> {
+  return new Promise((resolve, reject) => {
+    tx.oncomplete = () => resolve()
+    tx.onerror = () => reject(tx.error)
+    tx.onabort = () => reject(tx.error)
+  })
+}
+
+async function putEntry(entry: QueuedProgress): Promise<void> {
+  const db = await openDb()
+  if (!db) {
+    memoryQueue.set(entry.key, entry)
+    return
+  }
+  const tx = db.transaction(STORE_NAME, 'readwrite')
+  tx.objectStore(STORE_NAME).put(entry)
+  await waitForTransaction(tx)
+}
+
+async function readEntries(): Promise<QueuedProgress[]> {
+  const db = await openDb()
+  const stored: QueuedProgress[] = db
+    ? await new Promise<QueuedProgress[]>((resolve, reject) => {
+      const request = db.transaction(STORE_NAME, 'readonly').objectStore(STORE_NAME).getAll()
+      request.onsuccess = () => resolve(request.result as QueuedProgress[])
+      request.onerror = () => reject(request.error)
+    })
+    : []
+  // IndexedDB 저장에 실패해 메모리에만 있는 항목과 합치고, 같은 키는 더 새로운 값 사용
+  const latest = new Map<string, QueuedProgress>()
+  for (const entry of [...stored, ...memoryQueue.values()]) {
+    const current = latest.get(entry.key)
+    if (!current || current.queuedAt < entry.queuedAt) {
+      latest.set(entry.key, entry)
+    }
+  }
+  return Array.from(latest.values())
+}
+
+// 전송하는 동안 더 새로운 값이 들어온 항목은 남겨 두고 다음 전송에 포함
+async function removeSentEntries(sent: QueuedProgress[]): Promise<void> {
+  sent.forEach((entry) => {
+    if (memoryQueue.get(entry.key)?.queuedAt === entry.queuedAt) {
+      memoryQueue.delete(entry.key)
+    }
+  })
+  const db = await openDb()
+  if (!db) return
+
+  const tx = db.transaction(STORE_NAME, 'readwrite')
+  const store = tx.objectStore(STORE_NAME)
+  sent.forEach((entry) => {
+    const request = store.get(entry.key)
+    request.onsuccess = () => {
+      // 메모리 대체 저장소에서 보낸 값보다 오래된 항목도 함께 정리
+      const stored = request.result as QueuedProgress | undefined
+      if (stored && stored.queuedAt <= entry.queuedAt) {
+        store.delete(entry.key)
+      }
+    }
+  })
+  await waitForTransaction(tx)
+}
+
+/**
+ * 진행 상태 저장을 큐에 넣기 (같은 한자는 마지막 값만 남음)
+ * 실제 전송은 flushProgressQueue가 배치로 처리
+ */
+export async function enqueueProgress(
+  mode: ProgressMode,
+  progress: StudyProgress | PracticeProgress
+): Promise<void> {
+  // 같은 밀리초에 여러 번 저장해도 순서가 구분되도록 단조 증가
+  lastQueuedAt = Math.max(Date.now(), lastQueuedAt + 1)
+  const entry: QueuedProgress = {
+    key: `${mode}:${progress.user_id}:${progress.hanja_id}`,
+    mode,
+    progress,
+    queuedAt: lastQueuedAt,
+  }
+  try {
+    await putEntry(entry)
+  } catch (error) {
+    console.error('진행 상태 큐 저장 오류:', error)
+    memoryQueue.set(entry.key, entry)
+  }
+}
+
+async function sendEntries(keepalive: boolean): Promise<void> {
+  if (!keepalive && Date.now() < nextRetryAt) return
+
+  const entries = await readEntries()
+  if (entries.length === 0) return
+
+  try {
+    for (const mode of ['study', 'practice'] as ProgressMode[]) {
+      const pending = entries.filter((entry) => entry.mode === mode)
+      for (let i = 0; i < pending.length; i += MAX_BATCH_SIZE) {
+        const chunk = pending.slice(i, i + MAX_BATCH_SIZE)
+        const progressList = chunk.map((entry) => entry.progress)
+        const response = mode === 'study'
+          ? await saveStudyProgressBatch(progressList, { keepalive })
+          : await savePracticeProgressBatch(progressList, { keepalive })
+        if (response.error) {
+          throw new Error(response.error)
+        }
+        await removeSentEntries(chunk)
+      }
+    }
+    retryAttempt = 0
+    nextRetryAt = 0
+  } catch (error) {
+    retryAttempt += 1
+    // 지수 백오프 + 지터 (여러 탭/기기가 동시에 재시도하지 않도록)
+    const backoff = Math.min(MIN_BACKOFF_MS * 2 ** retryAttempt, MAX_BACKOFF_MS)
+    nextRetryAt = Date.now() + backoff * (0.5 + Math.random() / 2)
+    console.error(`진행 상태 전송 실패 (${retryAttempt}회째), 나중에 다시 시도합니다:`, error)
+  }
+}
+
+/**
+ * 큐에 쌓인 진행 상태를 서버로 전송 (동시에 한 번만 실행)
+ * 서버에서 진행 상태를 다시 불러오기 전에 호출하면 방금 저장한 값이 반영됨
+ */
+export function flushProgressQueue(options: { keepalive?: boolean } = {}): Promise<void> {
+  if (!flushing) {
+    flushing = sendEntries(options.keepalive ?? false).finally(() => {
+      flushing = null
+    })
+  }
+  return flushing
+}
+
+/**
+ * 주기적 전송과 페이지 숨김/온라인 복귀 시 전송을 시작 (앱 시작 시 한 번 호출)
+ */
+export function startProgressQueue(): void {
+  if (started) return
+  started = true
+
+  window.setInterval(() => {
+    void flushProgressQueue()
+  }, FLUSH_INTERVAL_MS)
+
+  // 탭 전환/앱 종료 시 남은 항목 전송 (keepalive로 페이지가 닫혀도 요청 유지)
+  document.addEventListener('visibilitychange', () => {
+    if (document.visibilityState === 'hidden') {
+      void flushProgressQueue({ keepalive: true })
+    }
+  })
+  window.addEventListener('pagehide', () => {
+    void flushProgressQueue({ keepalive: true })
+  })
+  window.addEventListener('online', () => {
+    nextRetryAt = 0
+    void flushProgressQueue()
+  })
+
+  // 이전 세션에서 전송하지 못한 항목
+  void flushProgressQueue()
+}